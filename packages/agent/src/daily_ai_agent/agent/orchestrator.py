@@ -5,15 +5,26 @@ from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
 from langchain_core.language_models.chat_models import BaseChatModel
 from langchain_openai import ChatOpenAI
-from typing import Dict, Any, List, Optional, AsyncIterator
+from typing import Dict, Any, List, Optional, AsyncIterator, Tuple
 from loguru import logger
 from datetime import datetime
+from functools import cache, lru_cache
+from collections import deque, OrderedDict
+import asyncio
+import hashlib
+import time
 
 from .tools import get_all_tools
 from ..models.config import get_settings
 from ..services.llm import LLMService
 from ..services.preferences import get_enabled_categories
 from ..utils.tracing import setup_langsmith_tracing, is_tracing_active
+from ..utils.constants import (
+    CHAT_RESPONSE_CACHE_TTL,
+    CHAT_RESPONSE_CACHE_MAX_ENTRIES,
+    STREAM_COALESCE_CHARS,
+    STREAM_COALESCE_INTERVAL,
+)
 
 # Map weekend category IDs (from /weekend/categories) to the LangChain tool names
 # that implement them. Disabled categories are filtered out before tool selection.
@@ -59,184 +70,50 @@ def _filter_tools_by_enabled_categories(tools: List, enabled: List[str]) -> List
         )
     return filtered
 
-# Module-level tool cache for performance
-_cached_tools: Optional[List] = None
-
-
-def get_cached_tools() -> List:
-    """Get cached tools, creating them only once."""
-    global _cached_tools
-    if _cached_tools is None:
-        logger.debug("Initializing tool cache")
-        _cached_tools = get_all_tools()
-    return _cached_tools
-
-
-def clear_tool_cache() -> None:
-    """Clear the tool cache (useful for testing)."""
-    global _cached_tools
-    _cached_tools = None
-    logger.debug("Tool cache cleared")
-
-
-class AgentOrchestrator:
-    """Main orchestrator for the AI agent."""
-
-    def __init__(self, use_cached_tools: bool = True, enable_memory: Optional[bool] = None) -> None:
-        """
-        Initialize the agent orchestrator.
-
-        Args:
-            use_cached_tools: Whether to use cached tools (True for production)
-            enable_memory: Whether to enable conversation memory (defaults to settings.enable_memory)
-        """
-        self.settings = get_settings()
-
-        # Set up LangSmith tracing if configured (must be done before LangChain imports)
-        self._setup_tracing()
-
-        self.llm_service = LLMService()
-
-        # Initialize conversation memory based on settings or override
-        self.enable_memory = enable_memory if enable_memory is not None else self.settings.enable_memory
-        self.chat_history: List[BaseMessage] = []
-
-        if self.enable_memory:
-            logger.info("Conversation memory enabled")
-        else:
-            logger.info("Conversation memory disabled")
-
-        # Use cached tools by default for better performance
-        self._use_cached_tools = use_cached_tools
-        # Track the prefs we last built tools+agent against so we can detect
-        # changes and rebuild only when needed (cheap to compare a tuple).
-        self._last_enabled_categories: Optional[tuple] = None
-        self.tools: List = []
-        self._refresh_tools_from_preferences()
-
-        # Determine which LLM provider to use
-        self.llm_provider = self.settings.effective_llm_provider
-
-        # Initialize LangChain agent if any LLM is available
-        if self._has_llm_credentials():
-            self._init_langchain_agent()
-        else:
-            self.agent: Optional[AgentExecutor] = None
-            logger.warning("No LLM API key configured - conversational features disabled")
-
-    def _refresh_tools_from_preferences(self) -> bool:
-        """Re-read prefs and rebuild self.tools if enabled categories changed.
-
-        Returns True if a rebuild happened (so callers can also rebuild the
-        LangChain agent), False otherwise. Cheap when prefs haven't changed.
-        """
-        enabled_categories = get_enabled_categories()
-        signature = tuple(sorted(enabled_categories))
-
-        if signature == self._last_enabled_categories and self.tools:
-            return False  # Already in sync, no work needed
-
-        all_tools = (
-            get_cached_tools() if self._use_cached_tools else get_all_tools()
-        )
-        self.tools = _filter_tools_by_enabled_categories(
-            all_tools, enabled_categories
-        )
-        self._last_enabled_categories = signature
-        logger.info(
-            f"Agent tools refreshed: {len(self.tools)} available "
-            f"(weekend categories enabled: {enabled_categories})"
-        )
-        return True
-
-    def _setup_tracing(self) -> None:
-        """Set up LangSmith tracing if configured."""
-        if self.settings.is_tracing_enabled:
-            setup_langsmith_tracing(
-                api_key=self.settings.langchain_api_key,
-                project=self.settings.langchain_project,
-                endpoint=self.settings.langchain_endpoint,
-                enabled=True,
-            )
-        else:
-            logger.debug("LangSmith tracing not configured")
-
-    def _has_llm_credentials(self) -> bool:
-        """Check if any LLM credentials are available."""
-        return bool(self.settings.openai_api_key) or bool(self.settings.anthropic_api_key)
-
-    def _create_llm(self, streaming: bool = False) -> BaseChatModel:
-        """
-        Create the appropriate LLM based on configuration.
-
-        Args:
-            streaming: Whether to enable streaming for this LLM instance
-
-        Returns:
-            Configured LLM instance (ChatOpenAI or ChatAnthropic)
-        """
-        if self.llm_provider == "anthropic":
-            # Import here to avoid requiring anthropic if not used
-            from langchain_anthropic import ChatAnthropic
-
-            logger.info(f"Using Anthropic model: {self.settings.anthropic_model}")
-            return ChatAnthropic(
-                api_key=self.settings.anthropic_api_key,
-                model=self.settings.anthropic_model,
-                temperature=self.settings.llm_temperature,
-                streaming=streaming,
-            )
-        else:
-            # Default to OpenAI
-            logger.info(f"Using OpenAI model: {self.settings.openai_model}")
-            return ChatOpenAI(
-                api_key=self.settings.openai_api_key,
-                model=self.settings.openai_model,
-                temperature=self.settings.llm_temperature,
-                streaming=streaming,
-            )
-
-    def _init_langchain_agent(self) -> None:
-        """Initialize the LangChain agent with tools."""
-        try:
-            # Create the LLM using configured provider
-            llm = self._create_llm(streaming=False)
-
-            # Create the prompt template with current date
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            current_day = datetime.now().strftime("%A, %B %d, %Y")
-
-            # Compute disabled weekend categories so the prompt can tell the agent
-            # to short-circuit ("concerts are disabled — suggest enabling them")
-            # instead of looping through other tools when asked about a disabled
-            # category. See WEEKEND_ORCHESTRATOR_SPEC.md Section 20.
-            all_weekend_categories = set(_CATEGORY_TO_TOOL_NAMES.keys())
-            enabled_categories = set(get_enabled_categories())
-            disabled_categories = sorted(all_weekend_categories - enabled_categories)
-            disabled_categories_note = (
-                f"\n\nDISABLED WEEKEND CATEGORIES: {', '.join(disabled_categories)}. "
-                f"If the user asks about any of these categories, do NOT try to call other "
-                f"tools to substitute — instead reply briefly that the category is disabled "
-                f"in their preferences and suggest they enable it in settings."
-                if disabled_categories
-                else ""
-            )
-
-            # Build prompt messages - include chat_history placeholder if memory is enabled
-            prompt_messages = [
-                ("system", f"""You are {self.settings.user_name}'s personal morning assistant.
+@lru_cache(maxsize=8)
+def _build_prompt(
+    enable_memory: bool,
+    user_name: str,
+    user_location: str,
+    commute_origin: str,
+    commute_destination: str,
+    disabled_categories: Tuple[str, ...],
+) -> ChatPromptTemplate:
+    """Build the agent prompt template.
+
+    The prompt only varies by these arguments, so it is memoized; re-creating
+    an orchestrator reuses the template instead of assembling the
+    multi-kilobyte system message again. Today's date is left as the
+    {current_date}/{current_day} template variables and supplied on every
+    invoke, so a long-lived agent never answers with a stale date.
+    """
+    # Tell the agent to short-circuit ("concerts are disabled — suggest enabling
+    # them") instead of looping through other tools when asked about a disabled
+    # category. See WEEKEND_ORCHESTRATOR_SPEC.md Section 20.
+    disabled_categories_note = (
+        f"\n\nDISABLED WEEKEND CATEGORIES: {', '.join(disabled_categories)}. "
+        f"If the user asks about any of these categories, do NOT try to call other "
+        f"tools to substitute — instead reply briefly that the category is disabled "
+        f"in their preferences and suggest they enable it in settings."
+        if disabled_categories
+        else ""
+    )
+
+    # Build prompt messages - include chat_history placeholder if memory is enabled
+    prompt_messages = [
+        ("system", f"""You are {user_name}'s personal morning assistant.
 You help with their daily routine by providing weather, calendar, todo, and commute information.
 
-IMPORTANT: Today's date is {current_date} ({current_day}). When users ask about "today", "this morning", "my schedule", etc., use this date: {current_date}.
+IMPORTANT: Today's date is {{current_date}} ({{current_day}}). When users ask about "today", "this morning", "my schedule", etc., use this date: {{current_date}}.
 
 User preferences:
-- Name: {self.settings.user_name}
-- Location: {self.settings.user_location}
-- Default commute: {self.settings.default_commute_origin} to {self.settings.default_commute_destination}
+- Name: {user_name}
+- Location: {user_location}
+- Default commute: {commute_origin} to {commute_destination}
 
 You have access to these tools:
 - get_weather: Get weather forecasts
-- get_calendar: Get calendar events for a single date (use YYYY-MM-DD format, today is {current_date})
+- get_calendar: Get calendar events for a single date (use YYYY-MM-DD format, today is {{current_date}})
 - get_calendar_range: Get calendar events for a date range (MUCH more efficient for week queries)
 - get_todos: Get todo/task lists
 - get_commute: Get basic travel information between any two locations
@@ -250,7 +127,7 @@ You have access to these tools:
 - update_calendar_event: MOVE or EDIT an existing calendar event — use for "move", "reschedule", "change time"
 - delete_calendar_event: REMOVE or CANCEL an existing calendar event — use for "remove", "delete", "cancel"
 - create_todo: Add a task to the user's todo list — use for "remind me to X", "add X to my list", or proactively after itineraries (see TODO WRITE-BACK)
-- vault_search: Search {self.settings.user_name}'s personal markdown notes (his "brain-vault" — projects, career history, meetings, decisions, ideas)
+- vault_search: Search {user_name}'s personal markdown notes (his "brain-vault" — projects, career history, meetings, decisions, ideas)
 - vault_read: Read a specific note from the vault by path (use after vault_search to load the full file)
 - vault_list: List a vault folder's contents (use to explore structure when unsure what exists)
 
@@ -443,22 +320,223 @@ If asked about work meetings specifically, explain that work calendar integratio
 CONVERSATION MEMORY: You have access to the conversation history. When users say things like "yes", "proceed",
 "do it", "go ahead", or reference previous messages, use the chat history to understand what they're referring to.
 Always maintain context from earlier in the conversation.{disabled_categories_note}"""),
-            ]
+    ]
+
+    # Add chat history placeholder if memory is enabled
+    if enable_memory:
+        prompt_messages.append(MessagesPlaceholder(variable_name="chat_history"))
+
+    prompt_messages.extend([
+        ("human", "{input}"),
+        ("placeholder", "{agent_scratchpad}")
+    ])
+
+    return ChatPromptTemplate.from_messages(prompt_messages)
+
+
+@cache
+def _get_anthropic_cls() -> type:
+    """Import ChatAnthropic on first use so anthropic isn't required unless configured."""
+    from langchain_anthropic import ChatAnthropic
+    return ChatAnthropic
+
+
+# Module-level tool cache for performance
+@cache
+def get_cached_tools() -> List:
+    """Get cached tools, creating them only once."""
+    logger.debug("Initializing tool cache")
+    return get_all_tools()
+
+
+def clear_tool_cache() -> None:
+    """Clear the tool cache (useful for testing)."""
+    get_cached_tools.cache_clear()
+    logger.debug("Tool cache cleared")
+
+
+class AgentOrchestrator:
+    """Main orchestrator for the AI agent."""
+
+    def __init__(self, use_cached_tools: bool = True, enable_memory: Optional[bool] = None) -> None:
+        """
+        Initialize the agent orchestrator.
+
+        Args:
+            use_cached_tools: Whether to use cached tools (True for production)
+            enable_memory: Whether to enable conversation memory (defaults to settings.enable_memory)
+        """
+        self.settings = get_settings()
+
+        # Set up LangSmith tracing if configured (must be done before LangChain imports)
+        self._setup_tracing()
+
+        self.llm_service = LLMService()
+
+        # Initialize conversation memory based on settings or override
+        self.enable_memory = enable_memory if enable_memory is not None else self.settings.enable_memory
+        # Ring buffer of the most recent turns (one human + one AI message each);
+        # older messages fall off so memory and prompt size stay bounded.
+        self.chat_history: deque[BaseMessage] = deque(
+            maxlen=2 * self.settings.max_history_turns
+        )
+
+        # Recent tool-free answers keyed by question + conversational context,
+        # so an immediate re-ask skips the LLM round trip: key -> (stored_at, response)
+        self._response_cache: OrderedDict[str, Tuple[float, str]] = OrderedDict()
+
+        if self.enable_memory:
+            logger.info("Conversation memory enabled")
+        else:
+            logger.info("Conversation memory disabled")
+
+        # Use cached tools by default for better performance
+        self._use_cached_tools = use_cached_tools
+        # Track the prefs we last built tools+agent against so we can detect
+        # changes and rebuild only when needed (cheap to compare a tuple).
+        self._last_enabled_categories: Optional[tuple] = None
+        self.tools: List = []
+        self._refresh_tools_from_preferences()
+
+        # Determine which LLM provider to use
+        self.llm_provider = self.settings.effective_llm_provider
+        # Built once and shared by every agent rebuild; astream_events streams
+        # tokens from it via callbacks, so chat_stream needs no second instance
+        self.llm: Optional[BaseChatModel] = None
+
+        # Initialize LangChain agent if any LLM is available
+        if self._has_llm_credentials():
+            self._init_langchain_agent()
+        else:
+            self.agent: Optional[AgentExecutor] = None
+            logger.warning("No LLM API key configured - conversational features disabled")
+
+        # Open the MCP session in the background when constructed inside a
+        # running loop, so the first chat() doesn't pay the handshake
+        self._warmup_task: Optional[asyncio.Task] = None
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not None:
+            self._warmup_task = loop.create_task(self._warmup())
+
+    async def _warmup(self) -> None:
+        """Prime the shared MCP connection (SSE session or pooled HTTP client)."""
+        from ..services.mcp_client import MCPClient, MCP_SDK_AVAILABLE
+
+        client = MCPClient()
+        try:
+            if MCP_SDK_AVAILABLE and not MCPClient._use_http_fallback:
+                await client._ensure_connection()
+            else:
+                await client.health_check()
+            logger.debug("MCP connection pre-warmed")
+        except Exception as e:
+            # Not fatal: the first tool call will connect (or fall back) itself
+            logger.debug(f"MCP warm-up skipped: {e}")
+
+    def _refresh_tools_from_preferences(self) -> bool:
+        """Re-read prefs and rebuild self.tools if enabled categories changed.
+
+        Returns True if a rebuild happened (so callers can also rebuild the
+        LangChain agent), False otherwise. Cheap when prefs haven't changed.
+        """
+        enabled_categories = get_enabled_categories()
+        signature = tuple(sorted(enabled_categories))
+
+        if signature == self._last_enabled_categories and self.tools:
+            return False  # Already in sync, no work needed
+
+        all_tools = (
+            get_cached_tools() if self._use_cached_tools else get_all_tools()
+        )
+        self.tools = _filter_tools_by_enabled_categories(
+            all_tools, enabled_categories
+        )
+        self._last_enabled_categories = signature
+        logger.info(
+            f"Agent tools refreshed: {len(self.tools)} available "
+            f"(weekend categories enabled: {enabled_categories})"
+        )
+        return True
+
+    def _setup_tracing(self) -> None:
+        """Set up LangSmith tracing if configured."""
+        if self.settings.is_tracing_enabled:
+            setup_langsmith_tracing(
+                api_key=self.settings.langchain_api_key,
+                project=self.settings.langchain_project,
+                endpoint=self.settings.langchain_endpoint,
+                enabled=True,
+            )
+        else:
+            logger.debug("LangSmith tracing not configured")
+
+    def _has_llm_credentials(self) -> bool:
+        """Check if any LLM credentials are available."""
+        return bool(self.settings.openai_api_key) or bool(self.settings.anthropic_api_key)
+
+    def _create_llm(self, streaming: bool = False) -> BaseChatModel:
+        """
+        Create the appropriate LLM based on configuration.
+
+        Args:
+            streaming: Whether to enable streaming for this LLM instance
+
+        Returns:
+            Configured LLM instance (ChatOpenAI or ChatAnthropic)
+        """
+        if self.llm_provider == "anthropic":
+            logger.info(f"Using Anthropic model: {self.settings.anthropic_model}")
+            return _get_anthropic_cls()(
+                api_key=self.settings.anthropic_api_key,
+                model=self.settings.anthropic_model,
+                temperature=self.settings.llm_temperature,
+                streaming=streaming,
+            )
+        else:
+            # Default to OpenAI
+            logger.info(f"Using OpenAI model: {self.settings.openai_model}")
+            return ChatOpenAI(
+                api_key=self.settings.openai_api_key,
+                model=self.settings.openai_model,
+                temperature=self.settings.llm_temperature,
+                streaming=streaming,
+            )
 
-            # Add chat history placeholder if memory is enabled
-            if self.enable_memory:
-                prompt_messages.append(MessagesPlaceholder(variable_name="chat_history"))
+    def _init_langchain_agent(self) -> None:
+        """Initialize the LangChain agent with tools."""
+        try:
+            # Create the LLM using configured provider (reused across rebuilds)
+            if self.llm is None:
+                self.llm = self._create_llm(streaming=False)
 
-            prompt_messages.extend([
-                ("human", "{input}"),
-                ("placeholder", "{agent_scratchpad}")
-            ])
+            # Disabled weekend categories are called out in the prompt
+            all_weekend_categories = set(_CATEGORY_TO_TOOL_NAMES.keys())
+            enabled_categories = set(get_enabled_categories())
+            disabled_categories = sorted(all_weekend_categories - enabled_categories)
 
-            prompt = ChatPromptTemplate.from_messages(prompt_messages)
+            prompt = _build_prompt(
+                self.enable_memory,
+                self.settings.user_name,
+                self.settings.user_location,
+                self.settings.default_commute_origin,
+                self.settings.default_commute_destination,
+                tuple(disabled_categories),
+            )
 
             # Create the agent
-            agent = create_tool_calling_agent(llm, self.tools, prompt)
-            self.agent = AgentExecutor(agent=agent, tools=self.tools, verbose=True)
+            agent = create_tool_calling_agent(self.llm, self.tools, prompt)
+            self.agent = AgentExecutor(
+                agent=agent,
+                tools=self.tools,
+                # Step-by-step console dumps are costly on large tool outputs;
+                # only pay for them when debugging
+                verbose=bool(self.settings.debug) or self.settings.log_level.upper() == "DEBUG",
+                # Lets chat() tell tool-free answers apart for the response cache
+                return_intermediate_steps=True,
+            )
 
             # Log tracing status
             tracing_status = "with LangSmith tracing" if is_tracing_active() else "without tracing"
@@ -489,23 +567,24 @@ Always maintain context from earlier in the conversation.{disabled_categories_no
         try:
             logger.info(f"Processing user input: {user_input}")
 
-            # Build the invoke payload
-            invoke_payload: Dict[str, Any] = {"input": user_input}
+            cache_key = self._response_cache_key(user_input)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                logger.info("Serving cached response")
+                self._remember_turn(user_input, cached)
+                return cached
 
-            # Include chat history if memory is enabled
-            if self.enable_memory:
-                invoke_payload["chat_history"] = self.chat_history
-                logger.debug(f"Including {len(self.chat_history)} messages in chat history")
+            invoke_payload = self._build_invoke_payload(user_input)
 
             # Use the agent to process the input
             result = await self.agent.ainvoke(invoke_payload)
             response = result.get("output", "I'm not sure how to help with that.")
 
-            # Store the conversation in memory if enabled
-            if self.enable_memory:
-                self.chat_history.append(HumanMessage(content=user_input))
-                self.chat_history.append(AIMessage(content=response))
-                logger.debug(f"Chat history now has {len(self.chat_history)} messages")
+            # Only tool-free answers are safe to replay; tool output is live data
+            if "intermediate_steps" in result and not result["intermediate_steps"]:
+                self._store_cached_response(cache_key, response)
+
+            self._remember_turn(user_input, response)
 
             logger.info("Successfully generated response")
             return response
@@ -527,7 +606,8 @@ Always maintain context from earlier in the conversation.{disabled_categories_no
             user_input: Natural language input from user
 
         Yields:
-            Chunks of the AI assistant response as they're generated.
+            Chunks of the AI assistant response as they're generated,
+            coalesced so each yield carries a few tokens rather than one.
             Also yields tool events in the format:
             - [TOOL_START] tool_name
             - [TOOL_END] tool_name
@@ -543,21 +623,33 @@ Always maintain context from earlier in the conversation.{disabled_categories_no
         try:
             logger.info(f"Processing user input (streaming): {user_input}")
 
-            # Build the invoke payload
-            invoke_payload: Dict[str, Any] = {"input": user_input}
+            cache_key = self._response_cache_key(user_input)
+            cached = self._get_cached_response(cache_key)
+            if cached is not None:
+                logger.info("Serving cached response (streaming)")
+                self._remember_turn(user_input, cached)
+                yield cached
+                return
 
-            # Include chat history if memory is enabled
-            if self.enable_memory:
-                invoke_payload["chat_history"] = self.chat_history
-                logger.debug(f"Including {len(self.chat_history)} messages in chat history")
+            invoke_payload = self._build_invoke_payload(user_input)
 
             # Stream the response using astream_events
             full_response = ""
+            used_tools = False
+            # Pending tokens not yet yielded; flushed by size, age, or before a tool marker
+            buffer: List[str] = []
+            buffered_chars = 0
+            last_flush = time.monotonic()
             async for event in self.agent.astream_events(invoke_payload, version="v2"):
                 kind = event.get("event")
 
                 # Emit tool start events
                 if kind == "on_tool_start":
+                    if buffer:
+                        yield "".join(buffer)
+                        buffer.clear()
+                        buffered_chars = 0
+                        last_flush = time.monotonic()
                     tool_name = event.get("name", "unknown")
                     logger.debug(f"Tool started: {tool_name}")
                     yield f"[TOOL_START] {tool_name}"
@@ -568,21 +660,34 @@ Always maintain context from earlier in the conversation.{disabled_categories_no
                     if hasattr(content, "content") and content.content:
                         chunk = content.content
                         full_response += chunk
-                        yield chunk
+                        buffer.append(chunk)
+                        buffered_chars += len(chunk)
+                        now = time.monotonic()
+                        if (
+                            buffered_chars >= STREAM_COALESCE_CHARS
+                            or now - last_flush >= STREAM_COALESCE_INTERVAL
+                        ):
+                            yield "".join(buffer)
+                            buffer.clear()
+                            buffered_chars = 0
+                            last_flush = now
 
                 # Emit tool end events
                 elif kind == "on_tool_end":
+                    used_tools = True
                     tool_name = event.get("name", "unknown")
                     tool_output = event.get("data", {}).get("output")
                     if tool_output:
                         logger.debug(f"Tool completed: {tool_name}")
                     yield f"[TOOL_END] {tool_name}"
 
-            # Store the conversation in memory if enabled
-            if self.enable_memory and full_response:
-                self.chat_history.append(HumanMessage(content=user_input))
-                self.chat_history.append(AIMessage(content=full_response))
-                logger.debug(f"Chat history now has {len(self.chat_history)} messages")
+            if buffer:
+                yield "".join(buffer)
+
+            if full_response:
+                if not used_tools:
+                    self._store_cached_response(cache_key, full_response)
+                self._remember_turn(user_input, full_response)
 
             logger.info("Successfully generated streaming response")
 
@@ -604,20 +709,102 @@ Always maintain context from earlier in the conversation.{disabled_categories_no
             # Use the morning briefing tool through the agent if available
             if self.agent:
                 result = await self.agent.ainvoke({
-                    "input": "Give me my complete morning briefing with weather, calendar, todos, and commute information. Make it conversational and highlight the most important things."
+                    "input": "Give me my complete morning briefing with weather, calendar, todos, and commute information. Make it conversational and highlight the most important things.",
+                    **self._date_context(),
                 })
                 return result.get("output", "Error generating briefing")
             else:
                 # Fallback to direct tool call
                 from ..services.mcp_client import MCPClient
-                client = MCPClient()
-                data = await client.get_all_morning_data(today)
+                data = await MCPClient().get_all_morning_data(today)
                 return await self.llm_service.generate_morning_briefing(data)
 
         except Exception as e:
             logger.error(f"Error generating smart briefing: {e}")
             return f"Error generating briefing: {str(e)}"
 
+    @staticmethod
+    def _date_context() -> Dict[str, str]:
+        """Today's date for the prompt's {current_date}/{current_day} variables."""
+        now = datetime.now()
+        return {
+            "current_date": now.strftime("%Y-%m-%d"),
+            "current_day": now.strftime("%A, %B %d, %Y"),
+        }
+
+    def _build_invoke_payload(self, user_input: str) -> Dict[str, Any]:
+        """Build the agent input: the message, today's date and, if enabled, history."""
+        invoke_payload: Dict[str, Any] = {"input": user_input, **self._date_context()}
+
+        # Include chat history if memory is enabled
+        if self.enable_memory:
+            history = self._trim_history(self.settings.max_history_tokens)
+            invoke_payload["chat_history"] = history
+            logger.debug(
+                f"Including {len(history)}/{len(self.chat_history)} messages in chat history"
+            )
+
+        return invoke_payload
+
+    def _trim_history(self, budget_tokens: int) -> List[BaseMessage]:
+        """Return the newest messages that fit an approximate token budget.
+
+        Uses a 4-characters-per-token estimate. The latest message is always
+        kept so short follow-ups ("yes, do it") keep their context. Memory
+        itself is left intact for get_chat_history().
+        """
+        trimmed: List[BaseMessage] = []
+        used = 0
+        for message in reversed(self.chat_history):
+            cost = len(str(message.content)) // 4
+            if trimmed and used + cost > budget_tokens:
+                break
+            trimmed.append(message)
+            used += cost
+        trimmed.reverse()
+        return trimmed
+
+    def _remember_turn(self, user_input: str, response: str) -> None:
+        """Store an exchange in conversation memory if enabled."""
+        if self.enable_memory:
+            self.chat_history.append(HumanMessage(content=user_input))
+            self.chat_history.append(AIMessage(content=response))
+            logger.debug(f"Chat history now has {len(self.chat_history)} messages")
+
+    def _response_cache_key(self, user_input: str) -> str:
+        """Key a question by its normalized text, today's date, the enabled
+        tool set, and the previous assistant reply (so "yes" to two different
+        offers never collides)."""
+        last_reply = ""
+        if self.enable_memory and self.chat_history:
+            last_reply = str(self.chat_history[-1].content)
+        parts = (
+            " ".join(user_input.lower().split()),
+            datetime.now().strftime("%Y-%m-%d"),
+            repr(self._last_enabled_categories),
+            last_reply,
+        )
+        return hashlib.sha1("\x00".join(parts).encode()).hexdigest()
+
+    def _get_cached_response(self, key: str) -> Optional[str]:
+        """Return a cached response if it is still fresh."""
+        entry = self._response_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, response = entry
+        if time.monotonic() - stored_at > CHAT_RESPONSE_CACHE_TTL:
+            del self._response_cache[key]
+            return None
+        self._response_cache.move_to_end(key)
+        return response
+
+    def _store_cached_response(self, key: str, response: str) -> None:
+        """Cache a response, evicting the least recently used entry when full."""
+        self._response_cache[key] = (time.monotonic(), response)
+        self._response_cache.move_to_end(key)
+        while len(self._response_cache) > CHAT_RESPONSE_CACHE_MAX_ENTRIES:
+            self._response_cache.popitem(last=False)
+
     def is_conversational(self) -> bool:
         """Check if conversational features are available."""
         return self.agent is not None
@@ -625,6 +812,7 @@ Always maintain context from earlier in the conversation.{disabled_categories_no
     def clear_memory(self) -> None:
         """Clear the conversation history to start a fresh session."""
         self.chat_history.clear()
+        self._response_cache.clear()
         logger.info("Conversation memory cleared")
 
     def get_memory_length(self) -> int:
@@ -1,13 +1,13 @@
 """Flask API for the AI agent - provides web endpoints for all agent functionality."""
 
-import asyncio
 import hmac
-import json
 import uuid
 import time
 from datetime import datetime
+from functools import wraps
 from zoneinfo import ZoneInfo
 from flask import Flask, request, jsonify, make_response, g, Response
+import orjson
 
 # Date defaults for tools like `/tools/calendar` must reflect the *user's*
 # local day, not the container clock (UTC in Docker). The MCP server's
@@ -38,12 +38,30 @@ from .utils.constants import (
     REQUEST_ID_HEADER,
     RATE_LIMIT_HEADERS,
 )
+from .utils.async_helpers import run_in_background_loop
 from .utils.error_handlers import handle_api_error, APIError
 
 
+class AuraFlask(Flask):
+    """Flask app that runs every `async def` view on one persistent event loop.
+
+    Flask's default wraps each async view in asgiref's `async_to_sync`, which
+    builds and tears down an event loop per request — and with it the MCP SSE
+    session and pooled connections the view just opened. A view blocks its
+    WSGI worker thread while the loop runs its coroutine, as before.
+    """
+
+    def async_to_sync(self, func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return run_in_background_loop(func(*args, **kwargs))
+
+        return wrapper
+
+
 def create_app(testing: bool = False) -> Flask:
     """Create and configure the Flask application."""
-    app = Flask(__name__)
+    app = AuraFlask(__name__)
     settings = get_settings()
 
     # Configure CORS with full preflight support
@@ -403,6 +421,8 @@ def create_app(testing: bool = False) -> Flask:
                 }), 503
 
             logger.info(f"[{g.request_id}] Streaming chat request: {message[:100]}...")
+            # The request context is gone by the time the body is streamed
+            request_id = g.get('request_id', 'unknown')
 
             async def generate():
                 """Generate SSE events from streaming response."""
@@ -411,32 +431,25 @@ def create_app(testing: bool = False) -> Flask:
                         # JSON-encode the chunk so newlines/special chars survive the
                         # single-line `data:` frame — the model's line breaks were
                         # being stripped, mashing plans into one paragraph.
-                        yield f"data: {json.dumps(chunk)}\n\n"
+                        yield f"data: {orjson.dumps(chunk).decode()}\n\n"
                     # Send done event
                     yield "data: [DONE]\n\n"
                 except Exception as e:
-                    logger.error(f"[{g.request_id}] Streaming error: {e}")
+                    logger.error(f"[{request_id}] Streaming error: {e}")
                     yield f"data: [ERROR] {str(e)}\n\n"
 
-            # Run async generator in event loop
-            async def stream_wrapper():
-                async for item in generate():
-                    yield item
-
-            # Create synchronous generator for Flask
+            # Flask iterates a sync generator; step the async one on the shared
+            # loop so the stream reuses the warm MCP session like every other view
             def sync_generator():
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+                gen = generate()
                 try:
-                    gen = generate()
                     while True:
                         try:
-                            chunk = loop.run_until_complete(gen.__anext__())
-                            yield chunk
+                            yield run_in_background_loop(gen.__anext__())
                         except StopAsyncIteration:
                             break
                 finally:
-                    loop.close()
+                    run_in_background_loop(gen.aclose())
 
             return Response(
                 sync_generator(),
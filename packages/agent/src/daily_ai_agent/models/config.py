@@ -40,6 +40,7 @@ class Settings(BaseSettings):
     # MCP Server Connection
     mcp_server_url: str = "http://localhost:8000"
     mcp_server_timeout: int = 45
+    max_concurrent_tools: int = 4  # Tool calls in flight at once during fan-outs
 
     # Navi (planning orchestrator) — external service Aura calls for outing/
     # weekend plans. Auth: send X-Internal-Auth = navi_internal_auth_secret,
@@ -52,6 +53,8 @@ class Settings(BaseSettings):
     # Agent Configuration
     log_level: str = "INFO"
     enable_memory: bool = True
+    max_history_turns: int = 20  # User/assistant exchanges kept in conversation memory
+    max_history_tokens: int = 2000  # Approximate token budget for history sent per turn
     debug: bool = False
     environment: str = "development"
 
@@ -4,14 +4,29 @@ This client connects to the MCP server using Server-Sent Events (SSE),
 enabling standards-compliant communication and dynamic tool discovery.
 
 Falls back to HTTP REST API if SSE connection fails.
+
+Performance: tool calls are I/O-bound on network round trips, not Python
+CPU. Prefer removing round trips (the shared SSE session, the pooled HTTP
+client, morning_get_bundle, singleflight and the result cache) over
+micro-optimizing the code around them. Everything pooled here is released
+by MCPClient.close_client().
 """
 
-import json
+import re
+import time
+import random
 import asyncio
-from typing import Dict, Any, Optional, List, ClassVar
-from dataclasses import dataclass
-
+import importlib.util
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, List, ClassVar, Awaitable, Tuple
+from dataclasses import dataclass, field
+from functools import lru_cache
+
+import anyio
 import httpx
+import orjson
 from loguru import logger
 
 from ..models.config import get_settings
@@ -20,7 +35,14 @@ from ..utils.constants import (
     RETRY_BASE_DELAY,
     RETRY_MAX_DELAY,
     RETRY_EXPONENTIAL_BASE,
+    RETRYABLE_CLIENT_ERRORS,
+    FATAL_UPSTREAM_STATUSES,
     HEALTH_CHECK_TIMEOUT,
+    MCP_SESSION_IDLE_TIMEOUT,
+    MCP_SESSION_JANITOR_INTERVAL,
+    TOOL_RESULT_CACHE_TTLS,
+    DEPARTURE_RELATIVE_TOOLS,
+    TOOL_RESULT_CACHE_MAX_ENTRIES,
 )
 from ..utils.error_handlers import MCPError
 
@@ -30,17 +52,89 @@ try:
     from mcp import ClientSession
     from mcp.client.sse import sse_client
     from mcp.types import Tool
+    from mcp.shared.exceptions import McpError
     MCP_SDK_AVAILABLE = True
 except ImportError:
     MCP_SDK_AVAILABLE = False
+
+    class McpError(Exception):  # type: ignore[no-redef]
+        """Placeholder so except clauses work without the SDK."""
     logger.warning("MCP SDK not available, using HTTP-only mode")
 
+# Tool results that can be JSON (an object or array, after optional whitespace)
+_JSON_START = re.compile(r"\s*[\[{]")
+
+# Errors from a pooled SSE session whose streams were already closed
+_STALE_SESSION_ERRORS = (anyio.ClosedResourceError, anyio.BrokenResourceError, anyio.EndOfStream)
+
+# Transport failures worth another SSE attempt; anything else goes
+# straight to the HTTP fallback
+_TRANSIENT_SSE_ERRORS = (asyncio.TimeoutError, OSError, RuntimeError, httpx.TransportError, MCPError)
+
+# Briefing sections returned by get_all_morning_data, in display order
+_MORNING_SECTIONS = ("weather", "calendar", "todos", "commute")
+
+# How servers word "no such tool": the MCP SDK's "Unknown tool: x" and our
+# server's "Tool 'x' not found"
+_UNKNOWN_TOOL = re.compile(r"unknown tool|tool '[^']*' not found", re.IGNORECASE)
+
+
+def _names_unknown_tool(message: str, tool_name: str) -> bool:
+    """Whether an error message says the server has no tool called `tool_name`."""
+    return tool_name in message and _UNKNOWN_TOOL.search(message) is not None
+
+
+@lru_cache(maxsize=1)
+def _server_urls(server_url: str) -> Tuple[str, str, str, str]:
+    """Derive (base, SSE, health, MCP health) URLs from the configured server URL."""
+    base = server_url.rstrip('/')
+    return base, f"{base}/mcp/sse", f"{base}/health", f"{base}/mcp/health"
+
+
+# HTTP/2 needs the optional `h2` package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
-@dataclass
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date), if present."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass(slots=True)
 class MCPConnection:
     """Represents an active MCP SSE connection."""
     session: Any  # ClientSession when MCP SDK available
-    tools: List[Any]
+    tools: Tuple[Any, ...]
+    url: str = ""  # SSE endpoint the session is connected to
+    last_used: float = field(default_factory=time.monotonic)  # For idle eviction
+    # The connection lives inside a background task (the SSE transport's task
+    # group must be entered and exited from the same task); setting `closing`
+    # lets that task unwind it.
+    task: Optional[asyncio.Task] = None
+    closing: Optional[asyncio.Event] = None
+
+    @property
+    def is_alive(self) -> bool:
+        """Whether the owning task is still running on the current event loop."""
+        if self.task is None or self.task.done():
+            return False
+        try:
+            return self.task.get_loop() is asyncio.get_running_loop()
+        except RuntimeError:
+            return False
 
 
 class MCPClient:
@@ -53,17 +147,27 @@ class MCPClient:
     # Class-level connection cache
     _connection: ClassVar[Optional[MCPConnection]] = None
     _connection_lock: ClassVar[asyncio.Lock] = asyncio.Lock()
-    _tools_cache: ClassVar[Optional[Dict[str, Any]]] = None
+    # Background task that closes the SSE session once it sits idle
+    _janitor_task: ClassVar[Optional[asyncio.Task]] = None
+    # Tools advertised by the current SSE session, by name. Only replaced
+    # between awaits, so readers never need a lock.
+    _tools_cache: ClassVar[Dict[str, "Tool"]] = {}
     _use_http_fallback: ClassVar[bool] = False
     _http_client: ClassVar[Optional[httpx.AsyncClient]] = None
+    _tool_semaphore: ClassVar[Optional[asyncio.Semaphore]] = None
+    # Singleflight: (loop, tool, encoded args) -> future of the call in flight
+    _inflight: ClassVar[Dict[Tuple[Any, str, bytes], asyncio.Future]] = {}
+    # Recent results of idempotent tools: (tool, encoded args) -> (stored_at, result)
+    _tool_result_cache: ClassVar["OrderedDict[Tuple[str, bytes], Tuple[float, Dict[str, Any]]]"] = OrderedDict()
+    # Cleared once the server turns out to predate the morning_get_bundle tool
+    _morning_bundle_supported: ClassVar[bool] = True
 
     def __init__(self) -> None:
         self.settings = get_settings()
-        self.base_url: str = self.settings.mcp_server_url.rstrip('/')
-        # SSE endpoint for MCP protocol
-        self.sse_url: str = f"{self.base_url}/mcp/sse"
-        # HTTP endpoint for health checks and fallback
-        self.health_url: str = f"{self.base_url}/health"
+        # SSE endpoint for MCP protocol; HTTP endpoints for health checks and fallback
+        self.base_url, self.sse_url, self.health_url, self.mcp_health_url = _server_urls(
+            self.settings.mcp_server_url
+        )
         self.timeout: int = self.settings.mcp_server_timeout
 
     def _auth_headers(self) -> Dict[str, str]:
@@ -81,20 +185,42 @@ class MCPClient:
                 secret = getattr(get_settings(), "internal_auth_secret", None)
                 if secret:
                     headers["X-Internal-Auth"] = secret
+                # HTTP/2 multiplexes concurrent tool calls over one TLS
+                # connection; plain-http URLs still negotiate HTTP/1.1
                 cls._http_client = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
                     timeout=httpx.Timeout(timeout),
                     limits=httpx.Limits(
-                        max_connections=100,
+                        max_connections=50,
                         max_keepalive_connections=20,
-                        keepalive_expiry=30.0,
+                        keepalive_expiry=60.0,
                     ),
                     headers=headers,
                 )
             return cls._http_client
 
+    @classmethod
+    def get_tool_semaphore(cls) -> asyncio.Semaphore:
+        """Get or create the shared semaphore bounding concurrent tool calls."""
+        if cls._tool_semaphore is None:
+            cls._tool_semaphore = asyncio.Semaphore(get_settings().max_concurrent_tools)
+        return cls._tool_semaphore
+
+    async def _guarded_call(self, call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run a tool call under the concurrency limit with a per-call deadline."""
+        async with self.get_tool_semaphore():
+            try:
+                return await asyncio.wait_for(call, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                raise MCPError(f"Tool call timed out after {self.timeout}s")
+
     @classmethod
     async def close_client(cls) -> None:
-        """Close the shared HTTP client."""
+        """Close the shared HTTP client and SSE session."""
+        if cls._janitor_task is not None:
+            cls._janitor_task.cancel()
+            cls._janitor_task = None
+        await cls._close_connection()
         async with cls._connection_lock:
             if cls._http_client is not None and not cls._http_client.is_closed:
                 await cls._http_client.aclose()
@@ -112,18 +238,26 @@ class MCPClient:
         delay = RETRY_BASE_DELAY
 
         client = await self.get_http_client(self.timeout)
+        # Encode once for all attempts; the shared client already sends
+        # Content-Type: application/json and httpx sizes a bytes body directly
+        body = orjson.dumps(arguments)
 
         for attempt in range(max_retries + 1):
+            retry_after: Optional[float] = None
             try:
-                response = await client.post(url, json=arguments)
+                response = await client.post(url, content=body)
                 response.raise_for_status()
-                return response.json()
+                return orjson.loads(response.content)
 
             except httpx.HTTPStatusError as e:
-                if 400 <= e.response.status_code < 500:
+                status = e.response.status_code
+                if 400 <= status < 500 and status not in RETRYABLE_CLIENT_ERRORS:
                     raise MCPError(
-                        f"HTTP {e.response.status_code}: {e.response.text}",
+                        f"HTTP {status}: {e.response.text}",
+                        details={"upstream_status": status},
                     )
+                if status in (429, 503):
+                    retry_after = _retry_after_seconds(e.response)
                 last_exception = e
 
             except (httpx.TimeoutException, httpx.ConnectError) as e:
@@ -133,22 +267,160 @@ class MCPClient:
                 last_exception = e
 
             if attempt < max_retries:
+                if retry_after is not None:
+                    # The server told us when to come back; don't undercut it
+                    wait = min(retry_after, RETRY_MAX_DELAY)
+                else:
+                    # Full jitter keeps concurrent callers from retrying in lockstep
+                    wait = random.uniform(0, delay)
                 logger.warning(
                     f"HTTP call attempt {attempt + 1}/{max_retries + 1} failed: {last_exception}. "
-                    f"Retrying in {delay:.1f}s..."
+                    f"Retrying in {wait:.1f}s..."
                 )
-                await asyncio.sleep(delay)
+                await asyncio.sleep(wait)
                 delay = min(delay * RETRY_EXPONENTIAL_BASE, RETRY_MAX_DELAY)
 
         raise MCPError(f"Tool {tool_name} failed after {max_retries + 1} attempts: {last_exception}")
 
+    async def _ensure_connection(self) -> MCPConnection:
+        """Get the shared SSE session, opening and initializing it if needed.
+
+        The handshake (connect + initialize + list_tools) is paid once and
+        reused by every subsequent tool call until the connection drops.
+        """
+        if not MCP_SDK_AVAILABLE:
+            raise MCPError("MCP SDK not available")
+
+        # Fast path: a healthy session needs no lock. Only (re)connecting
+        # takes it, and the check is repeated once it's held.
+        connection = MCPClient._connection
+        if connection is not None and connection.is_alive and connection.url == self.sse_url:
+            return connection
+
+        async with MCPClient._connection_lock:
+            connection = MCPClient._connection
+            if connection is not None and connection.is_alive:
+                if connection.url == self.sse_url:
+                    return connection
+                # Settings now point at a different server; don't reuse the old session
+                await self._close_connection(connection)
+            elif connection is not None:
+                # Possibly still running on another event loop, where its
+                # janitor won't see it once it's replaced: stop it there
+                self._close_foreign_connection(connection)
+
+            loop = asyncio.get_running_loop()
+            ready: asyncio.Future = loop.create_future()
+            closing = asyncio.Event()
+            task = loop.create_task(self._run_connection(ready, closing))
+            try:
+                connection = await ready
+            except BaseException:
+                task.cancel()
+                raise
+
+            connection.task = task
+            connection.closing = closing
+            MCPClient._connection = connection
+            MCPClient._tools_cache.clear()
+            MCPClient._tools_cache.update({tool.name: tool for tool in connection.tools})
+            MCPClient._start_janitor()
+            logger.info(f"MCP SSE session established ({len(connection.tools)} tools)")
+            return connection
+
+    async def _run_connection(self, ready: asyncio.Future, closing: asyncio.Event) -> None:
+        """Own the SSE transport and session for the lifetime of the connection."""
+        try:
+            async with sse_client(self.sse_url, headers=self._auth_headers()) as (read_stream, write_stream):
+                async with ClientSession(
+                    read_stream,
+                    write_stream,
+                    read_timeout_seconds=timedelta(seconds=self.timeout),
+                ) as session:
+                    await session.initialize()
+                    tools = tuple((await session.list_tools()).tools)
+                    ready.set_result(MCPConnection(session=session, tools=tools, url=self.sse_url))
+                    await closing.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            elif not closing.is_set():
+                logger.warning(f"MCP SSE session dropped: {e}")
+        finally:
+            if not ready.done():
+                ready.set_exception(MCPError("MCP SSE session closed during initialization"))
+
+    @classmethod
+    def _start_janitor(cls) -> None:
+        """Run the idle-session janitor on the current loop unless it already is."""
+        task = cls._janitor_task
+        if task is not None and not task.done() and task.get_loop() is asyncio.get_running_loop():
+            return
+        cls._janitor_task = asyncio.get_running_loop().create_task(cls._session_janitor())
+
+    @classmethod
+    async def _session_janitor(cls) -> None:
+        """Close the shared SSE session once it has been idle too long.
+
+        A stream left idle is often cut by a proxy without the client
+        noticing, so the next call would stall on a dead socket; closing
+        it first turns that into a clean reconnect. Exits with the session.
+        """
+        while True:
+            connection = cls._connection
+            if connection is None or not connection.is_alive:
+                return
+            # Wake every interval, or as soon as the session ends on its own
+            await asyncio.wait({connection.task}, timeout=MCP_SESSION_JANITOR_INTERVAL)
+            if connection.is_alive and time.monotonic() - connection.last_used > MCP_SESSION_IDLE_TIMEOUT:
+                logger.info("Closing idle MCP SSE session")
+                await cls._close_connection(connection)
+                return
+
+    @classmethod
+    async def _close_connection(cls, connection: Optional[MCPConnection] = None) -> None:
+        """Tear down `connection`, defaulting to the shared SSE session."""
+        connection = connection or cls._connection
+        if connection is None:
+            return
+        if cls._connection is connection:
+            cls._connection = None
+        if connection.closing is not None:
+            connection.closing.set()
+        if connection.task is not None and connection.is_alive:
+            try:
+                await asyncio.wait_for(connection.task, timeout=HEALTH_CHECK_TIMEOUT)
+            except Exception:
+                connection.task.cancel()
+
+    @staticmethod
+    def _close_foreign_connection(connection: MCPConnection) -> None:
+        """Ask a session owned by another event loop to unwind on that loop."""
+        task = connection.task
+        if task is None or task.done() or connection.closing is None:
+            return
+        try:
+            task.get_loop().call_soon_threadsafe(connection.closing.set)
+        except RuntimeError:
+            pass  # That loop is closed, and the session went with it
+
+    async def discover_tools(self) -> Tuple[Any, ...]:
+        """List the server's MCP tools over the shared SSE session.
+
+        The tool list is fetched during the session handshake, so this costs
+        no extra round trip once the session is open. It is returned as a
+        tuple because every caller shares it.
+        """
+        connection = await self._ensure_connection()
+        return connection.tools
+
     async def _call_tool_via_sse(
         self,
         tool_name: str,
         arguments: Dict[str, Any],
         max_retries: int = MAX_RETRIES,
     ) -> Dict[str, Any]:
-        """Call a tool via MCP SSE transport."""
+        """Call a tool via the shared MCP SSE session."""
         if not MCP_SDK_AVAILABLE:
             raise MCPError("MCP SDK not available")
 
@@ -156,39 +428,149 @@ class MCPClient:
         delay = RETRY_BASE_DELAY
 
         for attempt in range(max_retries + 1):
+            connection: Optional[MCPConnection] = None
             try:
-                async with sse_client(self.sse_url, headers=self._auth_headers()) as (read_stream, write_stream):
-                    async with ClientSession(read_stream, write_stream) as session:
-                        await session.initialize()
-                        result = await session.call_tool(tool_name, arguments)
-
-                        if result.content and len(result.content) > 0:
-                            content = result.content[0]
-                            if hasattr(content, 'text'):
-                                try:
-                                    return json.loads(content.text)
-                                except json.JSONDecodeError:
-                                    return {"result": content.text}
-
-                        return {"result": None}
+                connection = await self._ensure_connection()
+                # Hard per-attempt deadline so a wedged stream can't eat the retry budget
+                result = await asyncio.wait_for(
+                    connection.session.call_tool(tool_name, arguments),
+                    timeout=self.timeout,
+                )
+                connection.last_used = time.monotonic()
+
+                # The SDK hands back the complete message; a payload split over
+                # several text parts is joined and decoded in one pass. Non-text
+                # parts (images, resources) contribute nothing.
+                text = "".join([getattr(content, "text", "") for content in result.content or ()])
+                if not text:
+                    return {"result": None}
+                # Plain-text replies (e.g. "Error: ...") skip the JSON attempt
+                if not _JSON_START.match(text):
+                    return {"result": text}
+                try:
+                    return orjson.loads(text)
+                except orjson.JSONDecodeError:
+                    return {"result": text}
+
+            except McpError as e:
+                # The server answered with a JSON-RPC error: the session is
+                # healthy and a retry would get the same answer
+                raise MCPError(f"Tool {tool_name} rejected: {e}", details={"protocol_error": True})
+
+            except _STALE_SESSION_ERRORS as e:
+                # The pooled session died while idle (server restart, proxy
+                # timeout): reconnect right away instead of backing off
+                last_exception = e
+                logger.info(f"MCP SSE session went stale, reconnecting: {e!r}")
+                if connection is not None:
+                    await self._close_connection(connection)
 
-            except Exception as e:
+            except _TRANSIENT_SSE_ERRORS as e:
                 last_exception = e
-                logger.warning(
-                    f"SSE call attempt {attempt + 1}/{max_retries + 1} failed: {e}"
+                # Lazy: the repr is only built if DEBUG is actually emitted
+                logger.opt(lazy=True).debug(
+                    "SSE call attempt {}/{} failed: {}",
+                    lambda: attempt + 1, lambda: max_retries + 1, lambda e=e: repr(e),
                 )
+                # Drop the session so the next attempt reconnects from scratch
+                if connection is not None:
+                    await self._close_connection(connection)
 
                 if attempt < max_retries:
+                    # Decorrelated jitter: spread concurrent retries without
+                    # collapsing back toward zero like full jitter can
+                    delay = min(RETRY_MAX_DELAY, random.uniform(RETRY_BASE_DELAY, delay * RETRY_EXPONENTIAL_BASE))
                     await asyncio.sleep(delay)
-                    delay = min(delay * RETRY_EXPONENTIAL_BASE, RETRY_MAX_DELAY)
 
+        logger.error(f"SSE call to {tool_name} failed after {max_retries + 1} attempts: {last_exception}")
         raise MCPError(f"SSE call failed after {max_retries + 1} attempts: {last_exception}")
 
     async def call_tool(self, tool_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Call a specific tool on the MCP server.
 
-        Tries SSE first, falls back to HTTP if SSE fails.
+        Fresh results of idempotent tools (see TOOL_RESULT_CACHE_TTLS) are
+        served from a short-lived cache; commute and shuttle lookups only when
+        they pin a departure_time. Identical calls already in flight on
+        this event loop are joined rather than sent again; every caller gets
+        the same result (or error).
         """
+        loop = asyncio.get_running_loop()
+        try:
+            args_key = orjson.dumps(input_data, option=orjson.OPT_SORT_KEYS)
+        except TypeError:
+            return await self._dispatch_tool_call(tool_name, input_data)
+
+        cacheable = (
+            tool_name not in DEPARTURE_RELATIVE_TOOLS or "departure_time" in input_data
+        )
+        cached = self._get_cached_result(tool_name, args_key) if cacheable else None
+        if cached is not None:
+            logger.debug(f"Tool {tool_name} served from cache")
+            return cached
+
+        key = (loop, tool_name, args_key)
+
+        pending = MCPClient._inflight.get(key)
+        if pending is not None:
+            logger.debug(f"Joining in-flight call to {tool_name}")
+            # Shield so a cancelled joiner doesn't cancel the shared call
+            return await asyncio.shield(pending)
+
+        future = loop.create_future()
+        MCPClient._inflight[key] = future
+        try:
+            result = await self._dispatch_tool_call(tool_name, input_data)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark retrieved so a call nobody joined doesn't warn on GC
+            future.exception()
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            if cacheable:
+                self._store_cached_result(tool_name, args_key, result)
+            return result
+        finally:
+            MCPClient._inflight.pop(key, None)
+
+    @classmethod
+    def _get_cached_result(cls, tool_name: str, args_key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a cached tool result if it is still within its tool's TTL."""
+        ttl = TOOL_RESULT_CACHE_TTLS.get(tool_name)
+        if ttl is None:
+            return None
+        key = (tool_name, args_key)
+        entry = cls._tool_result_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at >= ttl:
+            cls._tool_result_cache.pop(key, None)
+            return None
+        cls._tool_result_cache.move_to_end(key)
+        return result
+
+    @classmethod
+    def _store_cached_result(cls, tool_name: str, args_key: bytes, result: Dict[str, Any]) -> None:
+        """Cache a successful result of an idempotent tool, evicting LRU entries."""
+        if tool_name not in TOOL_RESULT_CACHE_TTLS or "error" in result:
+            return
+        key = (tool_name, args_key)
+        cls._tool_result_cache[key] = (time.monotonic(), result)
+        cls._tool_result_cache.move_to_end(key)
+        while len(cls._tool_result_cache) > TOOL_RESULT_CACHE_MAX_ENTRIES:
+            cls._tool_result_cache.popitem(last=False)
+
+    @classmethod
+    def clear_tool_result_cache(cls) -> None:
+        """Drop all cached tool results (useful for testing)."""
+        cls._tool_result_cache.clear()
+
+    async def _dispatch_tool_call(self, tool_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a tool call: SSE first, falling back to HTTP if SSE fails."""
         logger.info(f"Calling MCP tool: {tool_name} with data: {input_data}")
 
         # If we've already determined SSE doesn't work, use HTTP
@@ -208,18 +590,25 @@ class MCPClient:
             logger.success(f"Tool {tool_name} completed via SSE")
             return result
 
-        except Exception as sse_error:
-            logger.warning(f"SSE failed, falling back to HTTP: {sse_error}")
-            MCPClient._use_http_fallback = True
-
-            try:
-                result = await self._call_tool_via_http(tool_name, input_data)
-                logger.success(f"Tool {tool_name} completed via HTTP fallback")
-                return result
-            except MCPError:
+        except MCPError as e:
+            # A protocol rejection means SSE works; don't abandon it for HTTP
+            if e.details.get("protocol_error"):
                 raise
-            except Exception as e:
-                raise MCPError(f"Both SSE and HTTP failed: SSE={sse_error}, HTTP={e}")
+            sse_error: Exception = e
+        except Exception as e:
+            sse_error = e
+
+        logger.warning(f"SSE failed, falling back to HTTP: {sse_error}")
+        MCPClient._use_http_fallback = True
+
+        try:
+            result = await self._call_tool_via_http(tool_name, input_data)
+            logger.success(f"Tool {tool_name} completed via HTTP fallback")
+            return result
+        except MCPError:
+            raise
+        except Exception as e:
+            raise MCPError(f"Both SSE and HTTP failed: SSE={sse_error}, HTTP={e}")
 
     async def get_weather(self, location: str, when: str = "today") -> Dict[str, Any]:
         """Get weather forecast for a location."""
@@ -312,87 +701,180 @@ class MCPClient:
             params["folder"] = folder
         return await self.call_tool("vault_list", params)
 
-    async def get_all_morning_data(self, date: str) -> Dict[str, Any]:
-        """Get all morning routine data in parallel for speed."""
+    async def get_morning_bundle(self, date: str) -> Dict[str, Any]:
+        """Get weather, calendar, todos and commute in a single tool call."""
         settings = get_settings()
+        return await self.call_tool("morning_get_bundle", {
+            "location": settings.user_location,
+            "date": date,
+            "todo_bucket": "work",
+            "commute_direction": "to_work"
+        })
 
-        tasks = [
-            self.get_weather(settings.user_location),
-            self.get_calendar_events(date),
-            self.get_todos("work"),
-            self.get_commute_options("to_work")
-        ]
+    def _morning_calls(self, date: str) -> Dict[str, Awaitable[Dict[str, Any]]]:
+        """Build the morning routine tool calls, keyed by briefing section."""
+        settings = get_settings()
+        return {
+            "weather": self.get_weather(settings.user_location),
+            "calendar": self.get_calendar_events(date),
+            "todos": self.get_todos("work"),
+            "commute": self.get_commute_options("to_work"),
+        }
 
-        try:
-            weather, calendar, todos, commute = await asyncio.gather(*tasks, return_exceptions=True)
+    async def _morning_section(self, name: str, call: Awaitable[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run one section's call, turning recoverable failures into an error entry.
 
-            result: Dict[str, Any] = {}
+        Auth failures are re-raised: every sibling call would fail the same
+        way, so the caller should stop waiting on them.
+        """
+        try:
+            return await self._guarded_call(call)
+        except MCPError as e:
+            if e.details.get("upstream_status") in FATAL_UPSTREAM_STATUSES:
+                raise
+            logger.warning(f"{name.capitalize()} call failed: {e}")
+            return {"error": str(e)}
+        except Exception as e:
+            logger.warning(f"{name.capitalize()} call failed: {e}")
+            return {"error": str(e)}
 
-            if isinstance(weather, Exception):
-                logger.warning(f"Weather call failed: {weather}")
-                result["weather"] = {"error": str(weather)}
-            else:
-                result["weather"] = weather
+    async def _fetch_morning_bundle(self, date: str) -> Optional[Dict[str, Any]]:
+        """Try the fused morning_get_bundle call; None means use per-section calls.
 
-            if isinstance(calendar, Exception):
-                logger.warning(f"Calendar call failed: {calendar}")
-                result["calendar"] = {"error": str(calendar)}
+        Only a definite "no such tool" answer turns the bundle off for the
+        process; any other failure falls back for this call alone.
+        """
+        try:
+            bundle = await self._guarded_call(self.get_morning_bundle(date))
+        except MCPError as e:
+            status = e.details.get("upstream_status")
+            if status in FATAL_UPSTREAM_STATUSES:
+                raise
+            if status == 404 or (
+                e.details.get("protocol_error") and _names_unknown_tool(str(e), "morning_get_bundle")
+            ):
+                self._disable_morning_bundle()
             else:
-                result["calendar"] = calendar
-
-            if isinstance(todos, Exception):
-                logger.warning(f"Todos call failed: {todos}")
-                result["todos"] = {"error": str(todos)}
+                logger.warning(f"Morning bundle failed, using per-section calls: {e}")
+            return None
+        except Exception as e:
+            logger.warning(f"Morning bundle failed, using per-section calls: {e}")
+            return None
+
+        if not isinstance(bundle, dict) or not all(name in bundle for name in _MORNING_SECTIONS):
+            # Over SSE, errors come back as plain text: "Error: Tool '...' not
+            # found" from servers that predate the tool, anything else otherwise
+            reply = bundle.get("result") if isinstance(bundle, dict) else None
+            if isinstance(reply, str) and _names_unknown_tool(reply, "morning_get_bundle"):
+                self._disable_morning_bundle()
             else:
-                result["todos"] = todos
+                logger.warning(f"Morning bundle failed, using per-section calls: {reply or bundle!r}")
+            return None
+        return {name: bundle[name] for name in _MORNING_SECTIONS}
 
-            if isinstance(commute, Exception):
-                logger.warning(f"Commute call failed: {commute}")
-                result["commute"] = {"error": str(commute)}
-            else:
-                result["commute"] = commute
+    @staticmethod
+    def _disable_morning_bundle() -> None:
+        """Stop asking a server that has no morning_get_bundle tool."""
+        MCPClient._morning_bundle_supported = False
+        logger.info("Server has no morning_get_bundle tool, using per-section calls")
 
-            return result
+    async def get_all_morning_data(self, date: str) -> Dict[str, Any]:
+        """Get all morning routine data in as few round-trips as possible.
 
-        except Exception as e:
-            logger.error(f"Error getting morning data: {e}")
-            raise
+        Prefers the server's morning_get_bundle tool, which fetches every
+        section in one call. Against servers without it, the sections are
+        fetched in parallel in a TaskGroup, so an auth failure in one cancels
+        its siblings right away instead of waiting out their timeouts.
+        """
+        if MCPClient._morning_bundle_supported:
+            try:
+                bundle = await self._fetch_morning_bundle(date)
+            except MCPError as e:
+                logger.error(f"Morning data aborted: {e}")
+                return {name: {"error": str(e)} for name in _MORNING_SECTIONS}
+            if bundle is not None:
+                return bundle
+
+        calls = self._morning_calls(date)
+        abort_error: Optional[MCPError] = None
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = {
+                    name: tg.create_task(self._morning_section(name, call))
+                    for name, call in calls.items()
+                }
+        except* MCPError as eg:
+            abort_error = eg.exceptions[0]
+            logger.error(f"Morning data aborted: {abort_error}")
+
+        if abort_error is not None:
+            return {name: {"error": str(abort_error)} for name in calls}
+        return {name: task.result() for name, task in tasks.items()}
 
     async def health_check(self) -> bool:
-        """Check if the MCP server is healthy."""
-        try:
-            async with httpx.AsyncClient(timeout=HEALTH_CHECK_TIMEOUT) as client:
-                response = await client.get(self.health_url)
-                response.raise_for_status()
-                return True
-        except Exception as e:
-            logger.error(f"MCP server health check failed: {e}")
-            return False
+        """Check if the MCP server and its SSE transport are healthy.
+
+        Both probes share the pooled client and run concurrently.
+        """
+        client = await self.get_http_client(self.timeout)
+        responses = await asyncio.gather(
+            client.get(self.health_url, timeout=HEALTH_CHECK_TIMEOUT),
+            client.get(self.mcp_health_url, timeout=HEALTH_CHECK_TIMEOUT),
+            return_exceptions=True,
+        )
+        for url, response in zip((self.health_url, self.mcp_health_url), responses):
+            if isinstance(response, Exception):
+                logger.error(f"MCP server health check failed ({url}): {response}")
+                return False
+            if response.status_code >= 400:
+                logger.error(f"MCP server health check failed ({url}): HTTP {response.status_code}")
+                return False
+        return True
 
     async def list_available_tools(self) -> List[Dict[str, Any]]:
         """List all available tools from the MCP server."""
         try:
-            async with httpx.AsyncClient(timeout=self.timeout, headers=self._auth_headers()) as client:
-                response = await client.get(f"{self.base_url}/tools")
-                response.raise_for_status()
-                data = response.json()
-                return [
-                    {"name": name, **info}
-                    for name, info in data.get("tools", {}).items()
-                ]
+            client = await self.get_http_client(self.timeout)
+            response = await client.get(f"{self.base_url}/tools")
+            response.raise_for_status()
+            data = orjson.loads(response.content)
+            return [
+                {"name": name, **info}
+                for name, info in data.get("tools", {}).items()
+            ]
         except Exception as e:
             logger.error(f"Failed to list tools: {e}")
             raise MCPError(f"Tool discovery failed: {e}")
 
 
 # Convenience function for tool discovery
-async def discover_mcp_tools(server_url: str) -> List[Dict[str, Any]]:
-    """Discover tools from an MCP server."""
-    async with httpx.AsyncClient(timeout=30) as client:
-        response = await client.get(f"{server_url.rstrip('/')}/tools")
-        response.raise_for_status()
-        data = response.json()
-        return [
-            {"name": name, **info}
-            for name, info in data.get("tools", {}).items()
-        ]
+async def discover_mcp_tools(
+    server_url: str,
+    client: Optional[httpx.AsyncClient] = None,
+) -> List[Dict[str, Any]]:
+    """Discover tools from an MCP server.
+
+    The configured MCP server is queried through the shared pooled client,
+    which carries its auth header. Any other server gets a one-off client
+    without it, so the secret never leaves for a third party. Pass `client`
+    to choose explicitly.
+    """
+    url = f"{server_url.rstrip('/')}/tools"
+    if client is not None:
+        return await _fetch_tool_list(client, url)
+    configured_base = _server_urls(get_settings().mcp_server_url)[0]
+    if server_url.rstrip('/') == configured_base:
+        return await _fetch_tool_list(await MCPClient.get_http_client(), url)
+    async with httpx.AsyncClient() as own_client:
+        return await _fetch_tool_list(own_client, url)
+
+
+async def _fetch_tool_list(client: httpx.AsyncClient, url: str) -> List[Dict[str, Any]]:
+    """GET a server's /tools listing and flatten it into one dict per tool."""
+    response = await client.get(url, timeout=30)
+    response.raise_for_status()
+    data = orjson.loads(response.content)
+    return [
+        {"name": name, **info}
+        for name, info in data.get("tools", {}).items()
+    ]
@@ -10,6 +10,7 @@ from .error_handlers import (
 )
 from .async_helpers import (
     run_async,
+    run_in_background_loop,
     gather_with_timeout,
     retry_async,
 )
@@ -32,6 +33,7 @@ __all__ = [
     "safe_async_call",
     # Async helpers
     "run_async",
+    "run_in_background_loop",
     "gather_with_timeout",
     "retry_async",
     # Constants
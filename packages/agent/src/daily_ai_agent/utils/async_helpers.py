@@ -1,12 +1,20 @@
 """Async utility functions for the Daily AI Agent."""
 
 import asyncio
-from typing import Any, Callable, TypeVar, Optional, List
+import threading
+from typing import Any, Callable, Coroutine, TypeVar, Optional, List
 from functools import wraps
 from loguru import logger
 
 T = TypeVar("T")
 
+# One event loop for the whole process, running in a daemon thread. Flask
+# views hand their coroutines to it instead of building a loop per request,
+# so loop-bound state (the MCP SSE session, pooled HTTP connections) outlives
+# the request that created it.
+_background_loop: Optional[asyncio.AbstractEventLoop] = None
+_background_loop_lock = threading.Lock()
+
 
 def run_async(func: Callable[..., T]) -> Callable[..., T]:
     """
@@ -29,6 +37,41 @@ def run_async(func: Callable[..., T]) -> Callable[..., T]:
     return wrapper
 
 
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Get the process-wide background event loop, starting it on first use.
+
+    Returns:
+        An event loop running forever in a daemon thread
+    """
+    global _background_loop
+    with _background_loop_lock:
+        if _background_loop is None or _background_loop.is_closed():
+            loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=loop.run_forever, name="aura-event-loop", daemon=True
+            ).start()
+            _background_loop = loop
+        return _background_loop
+
+
+def run_in_background_loop(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the background loop and block until it finishes.
+
+    The caller's context variables (e.g. Flask's request context) are
+    visible to the coroutine. Must not be called from the background loop
+    itself, which would deadlock.
+
+    Args:
+        coro: The coroutine to run
+
+    Returns:
+        The coroutine's result (its exception is re-raised)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
+
+
 async def gather_with_timeout(
     *coros: Any,
     timeout: float = 30.0,
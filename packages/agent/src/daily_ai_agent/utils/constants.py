@@ -12,12 +12,44 @@ DEFAULT_TIMEOUT = 30
 MCP_SERVER_TIMEOUT = 45
 HEALTH_CHECK_TIMEOUT = 10
 LLM_TIMEOUT = 60
+# Close the shared MCP SSE session after this long without a tool call,
+# checking every MCP_SESSION_JANITOR_INTERVAL (load balancers drop idle streams)
+MCP_SESSION_IDLE_TIMEOUT = 300
+MCP_SESSION_JANITOR_INTERVAL = 60
 
 # Retry configuration
 MAX_RETRIES = 3
 RETRY_BASE_DELAY = 1.0
 RETRY_MAX_DELAY = 16.0
 RETRY_EXPONENTIAL_BASE = 2.0
+# 4xx responses worth retrying (timeout, too early, rate limited); other 4xx fail fast
+RETRYABLE_CLIENT_ERRORS = frozenset({408, 425, 429})
+# Upstream statuses that will fail every sibling call too (auth), so fan-outs abort
+FATAL_UPSTREAM_STATUSES = frozenset({401, 403})
+
+# Chat response cache (tool-free answers to repeated questions)
+CHAT_RESPONSE_CACHE_TTL = 60  # seconds
+CHAT_RESPONSE_CACHE_MAX_ENTRIES = 128
+
+# Streaming: coalesce LLM tokens into chunks of at least this many chars,
+# flushing sooner if this many seconds pass since the last yield
+STREAM_COALESCE_CHARS = 32
+STREAM_COALESCE_INTERVAL = 0.02
+
+# MCP tool result cache: seconds to reuse a result, per idempotent tool.
+# Tools not listed (calendar, todos, writes) are never cached.
+TOOL_RESULT_CACHE_TTLS: Dict[str, float] = {
+    "weather_get_daily": 600,
+    "mobility_get_commute_options": 60,
+    "mobility_get_shuttle_schedule": 300,
+}
+# Tools that answer relative to "now" unless given a departure_time; only
+# calls that pin one are cached, so a stale list never shows departed shuttles
+DEPARTURE_RELATIVE_TOOLS = frozenset({
+    "mobility_get_commute_options",
+    "mobility_get_shuttle_schedule",
+})
+TOOL_RESULT_CACHE_MAX_ENTRIES = 256
 
 # Rate limiting
 DEFAULT_RATE_LIMIT_PER_MINUTE = 60
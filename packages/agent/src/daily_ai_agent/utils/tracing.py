@@ -4,6 +4,26 @@ import os
 from loguru import logger
 from typing import Optional
 
+# Environment variables LangChain reads to configure LangSmith tracing
+_LANGCHAIN_VARS = (
+    "LANGCHAIN_TRACING_V2",
+    "LANGCHAIN_API_KEY",
+    "LANGCHAIN_PROJECT",
+    "LANGCHAIN_ENDPOINT",
+)
+
+
+def _tracing_env_active() -> bool:
+    """Whether the environment currently has LangSmith tracing switched on."""
+    return os.environ.get("LANGCHAIN_TRACING_V2", "").lower() == "true" and bool(
+        os.environ.get("LANGCHAIN_API_KEY")
+    )
+
+
+# Cached is_tracing_active() answer. Seeded from the environment at import
+# and kept in sync by setup/disable, which own these variables afterwards.
+_tracing_active = _tracing_env_active()
+
 
 def setup_langsmith_tracing(
     api_key: Optional[str] = None,
@@ -26,6 +46,8 @@ def setup_langsmith_tracing(
     Returns:
         True if tracing was enabled, False otherwise
     """
+    global _tracing_active
+
     if not enabled:
         logger.debug("LangSmith tracing is disabled")
         return False
@@ -35,10 +57,13 @@ def setup_langsmith_tracing(
         return False
 
     # Set environment variables for LangChain to pick up
-    os.environ["LANGCHAIN_TRACING_V2"] = "true"
-    os.environ["LANGCHAIN_API_KEY"] = api_key
-    os.environ["LANGCHAIN_PROJECT"] = project
-    os.environ["LANGCHAIN_ENDPOINT"] = endpoint
+    os.environ.update({
+        "LANGCHAIN_TRACING_V2": "true",
+        "LANGCHAIN_API_KEY": api_key,
+        "LANGCHAIN_PROJECT": project,
+        "LANGCHAIN_ENDPOINT": endpoint,
+    })
+    _tracing_active = True
 
     logger.info(f"LangSmith tracing enabled for project: {project}")
     logger.debug(f"LangSmith endpoint: {endpoint}")
@@ -48,16 +73,19 @@ def setup_langsmith_tracing(
 
 def disable_langsmith_tracing() -> None:
     """Disable LangSmith tracing by clearing environment variables."""
-    os.environ.pop("LANGCHAIN_TRACING_V2", None)
-    os.environ.pop("LANGCHAIN_API_KEY", None)
-    os.environ.pop("LANGCHAIN_PROJECT", None)
-    os.environ.pop("LANGCHAIN_ENDPOINT", None)
+    global _tracing_active
+
+    for name in _LANGCHAIN_VARS:
+        os.environ.pop(name, None)
+    _tracing_active = False
 
     logger.debug("LangSmith tracing disabled")
 
 
 def is_tracing_active() -> bool:
-    """Check if LangSmith tracing is currently active."""
-    return os.environ.get("LANGCHAIN_TRACING_V2", "").lower() == "true" and bool(
-        os.environ.get("LANGCHAIN_API_KEY")
-    )
+    """Check if LangSmith tracing is currently active.
+
+    Reads the cached flag rather than the environment, so variables
+    changed behind setup/disable's back aren't noticed.
+    """
+    return _tracing_active
@@ -19,10 +19,20 @@ def mock_settings() -> Generator[MagicMock, None, None]:
         settings.openai_api_key = "test-api-key"
         settings.anthropic_api_key = None
         settings.default_llm = "openai"
+        settings.llm_provider = "openai"
+        settings.effective_llm_provider = "openai"
+        settings.openai_model = "gpt-4o-mini"
+        settings.anthropic_model = "claude-3-5-sonnet-20241022"
+        settings.llm_temperature = 0.1
+        settings.langchain_project = "aura"
         settings.mcp_server_url = "http://test-mcp-server:8000"
         settings.mcp_server_timeout = 30
+        settings.max_concurrent_tools = 4
         settings.log_level = "INFO"
+        settings.is_tracing_enabled = False
         settings.enable_memory = True
+        settings.max_history_turns = 20
+        settings.max_history_tokens = 2000
         settings.debug = True
         settings.environment = "testing"
         settings.host = "0.0.0.0"
@@ -44,7 +44,7 @@ class TestAgentMemoryBasics:
             orchestrator = AgentOrchestrator()
 
             assert orchestrator.enable_memory is True
-            assert orchestrator.chat_history == []
+            assert list(orchestrator.chat_history) == []
 
     def test_memory_can_be_disabled(self, mock_settings):
         """Test that memory can be explicitly disabled."""
@@ -72,7 +72,7 @@ class TestAgentMemoryBasics:
         mock_orchestrator.clear_memory()
 
         assert mock_orchestrator.get_memory_length() == 0
-        assert mock_orchestrator.chat_history == []
+        assert list(mock_orchestrator.chat_history) == []
 
     def test_get_memory_length(self, mock_orchestrator):
         """Test that get_memory_length() returns correct count."""
@@ -96,6 +96,18 @@ class TestAgentMemoryBasics:
         # Original should be unchanged
         assert mock_orchestrator.get_memory_length() == 1
 
+    def test_history_bounded_to_max_turns(self, mock_orchestrator, mock_settings):
+        """Test that the oldest messages are evicted once the turn limit is hit."""
+        from langchain_core.messages import HumanMessage
+        max_messages = 2 * mock_settings.max_history_turns
+
+        for i in range(max_messages + 4):
+            mock_orchestrator.chat_history.append(HumanMessage(content=f"msg {i}"))
+
+        history = mock_orchestrator.get_chat_history()
+        assert len(history) == max_messages
+        assert history[0].content == "msg 4"
+
     def test_has_memory_false_when_empty(self, mock_orchestrator):
         """Test has_memory() returns False when no messages stored."""
         assert mock_orchestrator.has_memory() is False
@@ -106,6 +118,100 @@ class TestAgentMemoryBasics:
         mock_orchestrator.chat_history.append(HumanMessage(content="Test"))
         assert mock_orchestrator.has_memory() is True
 
+    @pytest.mark.asyncio
+    async def test_mcp_connection_prewarmed_inside_event_loop(self, mock_settings):
+        """Test that constructing inside a running loop opens the MCP session early."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"), \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools", return_value=[]), \
+             patch("daily_ai_agent.services.mcp_client.MCPClient._use_http_fallback", False), \
+             patch("daily_ai_agent.services.mcp_client.MCPClient._ensure_connection",
+                   new_callable=AsyncMock) as mock_connect:
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(use_cached_tools=True)
+            await orchestrator._warmup_task
+
+            mock_connect.assert_awaited_once()
+
+    @pytest.mark.parametrize("debug,log_level,verbose", [
+        (False, "INFO", False),
+        (False, "debug", True),
+        (True, "INFO", True),
+    ])
+    def test_agent_verbose_only_when_debugging(self, mock_settings, debug, log_level, verbose):
+        """Test that AgentExecutor step dumps are gated on debug settings."""
+        mock_settings.debug = debug
+        mock_settings.log_level = log_level
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent"), \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor") as mock_executor, \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools", return_value=[]), \
+             patch("daily_ai_agent.agent.orchestrator.get_settings", return_value=mock_settings):
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            AgentOrchestrator(use_cached_tools=True)
+
+            assert mock_executor.call_args.kwargs["verbose"] is verbose
+
+    def test_agent_rebuild_reuses_llm(self, mock_settings):
+        """Test that rebuilding the agent after a prefs change keeps the same LLM."""
+        with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI") as mock_llm, \
+             patch("daily_ai_agent.agent.orchestrator.create_tool_calling_agent") as mock_create_agent, \
+             patch("daily_ai_agent.agent.orchestrator.AgentExecutor"), \
+             patch("daily_ai_agent.agent.orchestrator.get_cached_tools", return_value=[]), \
+             patch("daily_ai_agent.agent.orchestrator.get_settings", return_value=mock_settings):
+
+            from daily_ai_agent.agent.orchestrator import AgentOrchestrator
+            orchestrator = AgentOrchestrator(use_cached_tools=True)
+            orchestrator._init_langchain_agent()
+
+            mock_llm.assert_called_once()
+            assert mock_create_agent.call_count == 2
+            assert all(c.args[0] is orchestrator.llm for c in mock_create_agent.call_args_list)
+
+    def test_history_trimmed_to_token_budget(self, mock_orchestrator):
+        """Test that only the newest messages within the budget are sent, memory intact."""
+        from langchain_core.messages import HumanMessage, AIMessage
+
+        mock_orchestrator.chat_history.clear()
+        mock_orchestrator.chat_history.append(HumanMessage(content="a" * 400))  # ~100 tokens
+        mock_orchestrator.chat_history.append(AIMessage(content="b" * 400))
+        mock_orchestrator.chat_history.append(HumanMessage(content="c" * 40))   # ~10 tokens
+        mock_orchestrator.chat_history.append(AIMessage(content="d" * 40))
+
+        trimmed = mock_orchestrator._trim_history(budget_tokens=120)
+
+        assert [m.content[0] for m in trimmed] == ["b", "c", "d"]
+        assert mock_orchestrator.get_memory_length() == 4
+        # The newest message survives even when it alone exceeds the budget
+        assert [m.content[0] for m in mock_orchestrator._trim_history(budget_tokens=1)] == ["d"]
+
+    def test_prompt_reused_across_instances(self):
+        """Test that identical prompt inputs share one memoized template."""
+        from daily_ai_agent.agent.orchestrator import _build_prompt
+
+        args = ("Kevin", "San Francisco, CA", "Home", "Office", ())
+        with_memory = _build_prompt(True, *args)
+
+        assert _build_prompt(True, *args) is with_memory
+        assert "chat_history" in with_memory.input_variables
+        assert "chat_history" not in _build_prompt(False, *args).input_variables
+
+    def test_prompt_date_filled_per_invoke(self):
+        """Test that today's date is a template variable, not baked into the prompt."""
+        from daily_ai_agent.agent.orchestrator import _build_prompt
+
+        prompt = _build_prompt(False, "Kevin", "San Francisco, CA", "Home", "Office", ())
+        assert {"current_date", "current_day"} <= set(prompt.input_variables)
+
+        messages = prompt.format_messages(
+            input="hi", agent_scratchpad=[],
+            current_date="2025-01-15", current_day="Wednesday, January 15, 2025",
+        )
+        assert "Today's date is 2025-01-15 (Wednesday, January 15, 2025)" in messages[0].content
+
     def test_has_memory_false_when_disabled(self, mock_settings):
         """Test has_memory() returns False when memory is disabled."""
         with patch("daily_ai_agent.agent.orchestrator.ChatOpenAI"), \
@@ -262,6 +368,71 @@ class TestAgentMemoryWithChat:
             assert "chat_history" not in call_args
 
 
+    @pytest.mark.asyncio
+    async def test_repeated_tool_free_question_served_from_cache(self, orchestrator_with_mock_agent):
+        """Test that re-asking a tool-free question skips the agent."""
+        orchestrator, mock_agent = orchestrator_with_mock_agent
+        orchestrator.clear_memory()
+
+        mock_agent.ainvoke.return_value = {"output": "Hi there!", "intermediate_steps": []}
+        await orchestrator.chat("Hello")
+        # Same question after the same reply shares the conversational context
+        orchestrator.chat_history.pop()
+        orchestrator.chat_history.pop()
+        response = await orchestrator.chat("  hello ")
+
+        assert response == "Hi there!"
+        assert mock_agent.ainvoke.await_count == 1
+        assert orchestrator.get_memory_length() == 2
+
+    @pytest.mark.asyncio
+    async def test_tool_answers_not_cached(self, orchestrator_with_mock_agent):
+        """Test that answers built from tool output are never replayed."""
+        orchestrator, mock_agent = orchestrator_with_mock_agent
+        orchestrator.clear_memory()
+
+        mock_agent.ainvoke.return_value = {
+            "output": "It's sunny.",
+            "intermediate_steps": [("weather_get_daily", "sunny")],
+        }
+        await orchestrator.chat("What's the weather?")
+        orchestrator.chat_history.pop()
+        orchestrator.chat_history.pop()
+        await orchestrator.chat("What's the weather?")
+
+        assert mock_agent.ainvoke.await_count == 2
+
+
+    @pytest.mark.asyncio
+    async def test_chat_stream_coalesces_tokens(self, orchestrator_with_mock_agent):
+        """Test that single-token chunks are batched without reordering tool markers."""
+        orchestrator, mock_agent = orchestrator_with_mock_agent
+        orchestrator.clear_memory()
+
+        def token(text):
+            return {"event": "on_chat_model_stream", "data": {"chunk": MagicMock(content=text)}}
+
+        async def fake_events(payload, version):
+            yield token("Let me check. ")
+            yield {"event": "on_tool_start", "name": "get_weather"}
+            yield {"event": "on_tool_end", "name": "get_weather", "data": {"output": "sunny"}}
+            for _ in range(40):
+                yield token("a")
+
+        mock_agent.astream_events = fake_events
+        with patch("daily_ai_agent.agent.orchestrator.time.monotonic", return_value=0.0):
+            chunks = [chunk async for chunk in orchestrator.chat_stream("Weather?")]
+
+        assert chunks == [
+            "Let me check. ",
+            "[TOOL_START] get_weather",
+            "[TOOL_END] get_weather",
+            "a" * 32,
+            "a" * 8,
+        ]
+        assert orchestrator.get_chat_history()[-1].content == "Let me check. " + "a" * 40
+
+
 class TestAgentMemoryContextUnderstanding:
     """
     Tests for verifying the agent understands context from memory.
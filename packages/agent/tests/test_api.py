@@ -1,9 +1,13 @@
 """Tests for the Flask API endpoints."""
 
+import asyncio
+
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
 import json
 
+from daily_ai_agent.utils.async_helpers import get_background_loop
+
 
 class TestHealthEndpoint:
     """Tests for the /health endpoint."""
@@ -111,6 +115,26 @@ class TestWeatherEndpoint:
             response = test_client.get("/tools/weather?location=New%20York")
             assert response.status_code == 200
 
+    def test_requests_share_one_event_loop(self, client):
+        """Test async views run on a persistent loop, not one per request."""
+        loops = []
+
+        async def get_weather(location, when):
+            loops.append(asyncio.get_running_loop())
+            return {"location": location}
+
+        with patch("daily_ai_agent.api.MCPClient") as mock_client_class:
+            mock_client_class.return_value.get_weather = get_weather
+
+            from daily_ai_agent.api import create_app
+            test_client = create_app(testing=True).test_client()
+
+            test_client.get("/tools/weather")
+            response = test_client.get("/tools/weather")
+            assert response.status_code == 200
+
+        assert loops[0] is loops[1]
+
 
 class TestTodosEndpoint:
     """Tests for the /tools/todos endpoint."""
@@ -367,6 +391,35 @@ class TestChatStreamEndpoint:
             data = response.data.decode("utf-8")
             assert "data: [DONE]" in data
 
+    def test_chat_stream_runs_on_shared_loop(self, client):
+        """Test the stream is driven on the same loop as the other views."""
+        loops = []
+
+        with patch("daily_ai_agent.api.AgentOrchestrator") as mock_orch_class:
+            mock_orch = MagicMock()
+            mock_orch.is_conversational.return_value = True
+
+            async def mock_stream(msg):
+                loops.append(asyncio.get_running_loop())
+                yield "Hello"
+                loops.append(asyncio.get_running_loop())
+                yield " world"
+
+            mock_orch.chat_stream = mock_stream
+            mock_orch_class.return_value = mock_orch
+
+            from daily_ai_agent.api import create_app
+            test_client = create_app(testing=True).test_client()
+
+            response = test_client.post(
+                "/chat/stream",
+                data=json.dumps({"message": "Hello"}),
+                content_type="application/json",
+            )
+            assert "data: [DONE]" in response.data.decode("utf-8")
+
+        assert loops == [get_background_loop()] * 2
+
     def test_chat_stream_unavailable_without_llm(self, client):
         """Test chat stream returns 503 when LLM is not available."""
         with patch("daily_ai_agent.api.AgentOrchestrator") as mock_orch_class:
@@ -1,10 +1,16 @@
 """Tests for the MCP client service."""
 
+import asyncio
+import threading
+import time
 import pytest
+from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, patch, MagicMock
 import httpx
+import orjson
 
-from daily_ai_agent.services.mcp_client import MCPClient
+from daily_ai_agent.services.mcp_client import MCPClient, MCPConnection, discover_mcp_tools
+from daily_ai_agent.utils.error_handlers import MCPError
 
 
 class TestMCPClient:
@@ -13,13 +19,29 @@ class TestMCPClient:
     @pytest.fixture
     def client(self, mock_settings) -> MCPClient:
         """Create MCPClient instance with mocked settings."""
+        MCPClient.clear_tool_result_cache()
         return MCPClient()
 
+    @pytest.fixture
+    def legacy_server(self, monkeypatch):
+        """Pretend the server predates the morning_get_bundle tool."""
+        monkeypatch.setattr(MCPClient, "_morning_bundle_supported", False)
+
+    def test_urls_derived_from_settings(self, mock_settings):
+        """Test that endpoint URLs ignore a trailing slash on the server URL."""
+        mock_settings.mcp_server_url = "http://test-mcp-server:8000/"
+        client = MCPClient()
+
+        assert client.base_url == "http://test-mcp-server:8000"
+        assert client.sse_url == "http://test-mcp-server:8000/mcp/sse"
+        assert client.health_url == "http://test-mcp-server:8000/health"
+        assert client.mcp_health_url == "http://test-mcp-server:8000/mcp/health"
+
     @pytest.mark.asyncio
     async def test_call_tool_success(self, client, sample_weather_data):
         """Test successful tool call."""
         mock_response = MagicMock()
-        mock_response.json.return_value = sample_weather_data
+        mock_response.content = orjson.dumps(sample_weather_data)
         mock_response.raise_for_status = MagicMock()
 
         with patch("httpx.AsyncClient") as mock_client_class:
@@ -69,6 +91,65 @@ class TestMCPClient:
                 await client.call_tool("weather_get_daily", {"location": "SF"})
             assert "Timeout" in str(exc_info.value)
 
+    @staticmethod
+    def _status_error(status: int, headers=None) -> MagicMock:
+        response = MagicMock()
+        response.status_code = status
+        response.text = f"HTTP {status}"
+        response.headers = httpx.Headers(headers or {})
+        response.raise_for_status.side_effect = httpx.HTTPStatusError(
+            f"HTTP {status}", request=MagicMock(), response=response
+        )
+        return response
+
+    @pytest.mark.asyncio
+    async def test_http_retry_honors_retry_after(self, client, sample_weather_data):
+        """Test that a 429 waits for the server's Retry-After before retrying."""
+        ok = MagicMock()
+        ok.content = orjson.dumps(sample_weather_data)
+        http = AsyncMock()
+        http.post.side_effect = [self._status_error(429, {"Retry-After": "3"}), ok]
+
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=http)), \
+             patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client._call_tool_via_http("weather_get_daily", {})
+
+        assert result == sample_weather_data
+        mock_sleep.assert_awaited_once_with(3.0)
+        # Both attempts send the same pre-encoded body
+        bodies = [call.kwargs["content"] for call in http.post.await_args_list]
+        assert bodies[0] is bodies[1]
+        assert orjson.loads(bodies[0]) == {}
+
+    @pytest.mark.asyncio
+    async def test_http_client_error_not_retried(self, client):
+        """Test that non-retryable 4xx responses fail on the first attempt."""
+        http = AsyncMock()
+        http.post.return_value = self._status_error(404)
+
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=http)), \
+             patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(Exception, match="HTTP 404"):
+                await client._call_tool_via_http("weather_get_daily", {})
+
+        assert http.post.await_count == 1
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_http_retry_backoff_is_jittered(self, client):
+        """Test that server errors back off by a random amount within the cap."""
+        http = AsyncMock()
+        http.post.return_value = self._status_error(500)
+
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=http)), \
+             patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            with pytest.raises(Exception):
+                await client._call_tool_via_http("weather_get_daily", {}, max_retries=3)
+
+        waits = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(waits) == 3
+        assert all(0 <= wait <= cap for wait, cap in zip(waits, (1.0, 2.0, 4.0)))
+
     @pytest.mark.asyncio
     async def test_get_weather(self, client, sample_weather_data):
         """Test get_weather convenience method."""
@@ -138,7 +219,7 @@ class TestMCPClient:
     @pytest.mark.asyncio
     async def test_get_all_morning_data_success(
         self, client, sample_weather_data, sample_calendar_data,
-        sample_todos_data, sample_commute_options_data, mock_settings
+        sample_todos_data, sample_commute_options_data, mock_settings, legacy_server
     ):
         """Test get_all_morning_data fetches all data in parallel."""
         with patch.object(client, "get_weather", new_callable=AsyncMock) as mock_weather, \
@@ -160,7 +241,7 @@ class TestMCPClient:
 
     @pytest.mark.asyncio
     async def test_get_all_morning_data_partial_failure(
-        self, client, sample_weather_data, sample_calendar_data, mock_settings
+        self, client, sample_weather_data, sample_calendar_data, mock_settings, legacy_server
     ):
         """Test get_all_morning_data handles partial failures gracefully."""
         with patch.object(client, "get_weather", new_callable=AsyncMock) as mock_weather, \
@@ -180,35 +261,279 @@ class TestMCPClient:
             assert "error" in result["todos"]
             assert "error" in result["commute"]
 
+    @pytest.mark.asyncio
+    async def test_get_all_morning_data_slow_call_times_out(
+        self, client, sample_weather_data, sample_calendar_data,
+        sample_todos_data, mock_settings, legacy_server
+    ):
+        """Test that one slow tool call degrades to an error instead of stalling."""
+        async def slow_commute(*args, **kwargs):
+            await asyncio.sleep(5)
+
+        client.timeout = 0.05
+        with patch.object(client, "get_weather", new_callable=AsyncMock) as mock_weather, \
+             patch.object(client, "get_calendar_events", new_callable=AsyncMock) as mock_cal, \
+             patch.object(client, "get_todos", new_callable=AsyncMock) as mock_todos, \
+             patch.object(client, "get_commute_options", side_effect=slow_commute):
+
+            mock_weather.return_value = sample_weather_data
+            mock_cal.return_value = sample_calendar_data
+            mock_todos.return_value = sample_todos_data
+
+            result = await client.get_all_morning_data("2025-01-15")
+
+            assert result["weather"] == sample_weather_data
+            assert result["todos"] == sample_todos_data
+            assert "timed out" in result["commute"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_get_all_morning_data_auth_failure_cancels_siblings(
+        self, client, sample_weather_data, mock_settings, legacy_server
+    ):
+        """Test that an auth error aborts the other calls instead of waiting them out."""
+        async def slow(*args, **kwargs):
+            await asyncio.sleep(5)
+
+        auth_error = MCPError("HTTP 401: unauthorized", details={"upstream_status": 401})
+        with patch.object(client, "get_weather", new_callable=AsyncMock) as mock_weather, \
+             patch.object(client, "get_calendar_events", side_effect=auth_error), \
+             patch.object(client, "get_todos", side_effect=slow), \
+             patch.object(client, "get_commute_options", side_effect=slow):
+
+            mock_weather.return_value = sample_weather_data
+
+            result = await asyncio.wait_for(client.get_all_morning_data("2025-01-15"), timeout=1)
+
+            assert list(result) == ["weather", "calendar", "todos", "commute"]
+            assert all("401" in section["error"] for section in result.values())
+
+    @pytest.mark.asyncio
+    async def test_get_all_morning_data_uses_bundle(
+        self, client, sample_morning_data, mock_settings, monkeypatch
+    ):
+        """Test that a server with morning_get_bundle is asked once, not four times."""
+        monkeypatch.setattr(MCPClient, "_morning_bundle_supported", True)
+        with patch.object(client, "call_tool", new_callable=AsyncMock) as mock_call, \
+             patch.object(client, "get_weather", new_callable=AsyncMock) as mock_weather:
+            mock_call.return_value = sample_morning_data
+
+            result = await client.get_all_morning_data("2025-01-15")
+
+            assert result == sample_morning_data
+            mock_call.assert_awaited_once()
+            tool_name, args = mock_call.await_args.args
+            assert tool_name == "morning_get_bundle"
+            assert args["date"] == "2025-01-15"
+            mock_weather.assert_not_called()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("bundle_failure", [
+        {"side_effect": MCPError("HTTP 404: not found", details={"upstream_status": 404})},
+        {"side_effect": MCPError(
+            "Tool morning_get_bundle rejected: Unknown tool: morning_get_bundle",
+            details={"protocol_error": True},
+        )},
+        {"return_value": {"result": "Error: Tool 'morning_get_bundle' not found."}},
+    ])
+    async def test_get_all_morning_data_falls_back_without_bundle(
+        self, client, sample_weather_data, sample_calendar_data,
+        sample_todos_data, sample_commute_options_data, mock_settings, monkeypatch, bundle_failure
+    ):
+        """Test that older servers get per-section calls and aren't asked again."""
+        monkeypatch.setattr(MCPClient, "_morning_bundle_supported", True)
+        with patch.object(client, "get_morning_bundle", new_callable=AsyncMock, **bundle_failure) as mock_bundle, \
+             patch.object(client, "get_weather", new_callable=AsyncMock, return_value=sample_weather_data), \
+             patch.object(client, "get_calendar_events", new_callable=AsyncMock, return_value=sample_calendar_data), \
+             patch.object(client, "get_todos", new_callable=AsyncMock, return_value=sample_todos_data), \
+             patch.object(client, "get_commute_options", new_callable=AsyncMock, return_value=sample_commute_options_data):
+
+            first = await client.get_all_morning_data("2025-01-15")
+            second = await client.get_all_morning_data("2025-01-15")
+
+            assert first["weather"] == sample_weather_data
+            assert second["commute"] == sample_commute_options_data
+            mock_bundle.assert_awaited_once()
+            assert MCPClient._morning_bundle_supported is False
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("transient_failure", [
+        {"return_value": {"result": "Internal error calling morning_get_bundle: upstream timeout"}},
+        {"return_value": {"result": "Error: 1 validation error for MorningBundleInput"}},
+        {"side_effect": MCPError("HTTP 500: boom", details={"upstream_status": 500})},
+    ])
+    async def test_transient_bundle_error_falls_back_once(
+        self, client, sample_morning_data, sample_weather_data, sample_calendar_data,
+        sample_todos_data, sample_commute_options_data, mock_settings, monkeypatch, transient_failure
+    ):
+        """Test that a one-off bundle failure doesn't switch the bundle off."""
+        monkeypatch.setattr(MCPClient, "_morning_bundle_supported", True)
+        failure = transient_failure.get("side_effect") or transient_failure["return_value"]
+        with patch.object(
+            client, "get_morning_bundle", new_callable=AsyncMock,
+            side_effect=[failure, sample_morning_data],
+        ) as mock_bundle, \
+             patch.object(client, "get_weather", new_callable=AsyncMock, return_value=sample_weather_data), \
+             patch.object(client, "get_calendar_events", new_callable=AsyncMock, return_value=sample_calendar_data), \
+             patch.object(client, "get_todos", new_callable=AsyncMock, return_value=sample_todos_data), \
+             patch.object(client, "get_commute_options", new_callable=AsyncMock, return_value=sample_commute_options_data):
+
+            first = await client.get_all_morning_data("2025-01-15")
+            second = await client.get_all_morning_data("2025-01-15")
+
+        assert first["weather"] == sample_weather_data
+        assert second == sample_morning_data
+        assert mock_bundle.await_count == 2
+        assert MCPClient._morning_bundle_supported is True
+
+    @pytest.mark.asyncio
+    async def test_identical_concurrent_calls_share_one_request(self, client, sample_weather_data):
+        """Test that duplicate in-flight tool calls are sent only once."""
+        async def slow_dispatch(tool_name, input_data):
+            await asyncio.sleep(0.01)
+            return sample_weather_data
+
+        with patch.object(client, "_dispatch_tool_call", side_effect=slow_dispatch) as mock_dispatch:
+            results = await asyncio.gather(
+                client.call_tool("weather_get_daily", {"location": "SF", "when": "today"}),
+                client.call_tool("weather_get_daily", {"when": "today", "location": "SF"}),
+                client.call_tool("weather_get_daily", {"location": "NYC", "when": "today"}),
+            )
+
+        assert results == [sample_weather_data] * 3
+        assert mock_dispatch.call_count == 2
+        assert MCPClient._inflight == {}
+
+    @pytest.mark.asyncio
+    async def test_joined_call_sees_shared_error(self, client):
+        """Test that a failure reaches every caller of the shared call."""
+        async def failing_dispatch(tool_name, input_data):
+            await asyncio.sleep(0.01)
+            raise MCPError("server down")
+
+        with patch.object(client, "_dispatch_tool_call", side_effect=failing_dispatch) as mock_dispatch:
+            results = await asyncio.gather(
+                client.call_tool("todo_list", {}),
+                client.call_tool("todo_list", {}),
+                return_exceptions=True,
+            )
+
+        assert all(isinstance(r, MCPError) for r in results)
+        mock_dispatch.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_idempotent_tool_result_cached(self, client, sample_weather_data):
+        """Test that repeat weather lookups within the TTL skip the server."""
+        with patch.object(client, "_dispatch_tool_call", new_callable=AsyncMock) as mock_dispatch:
+            mock_dispatch.return_value = sample_weather_data
+
+            first = await client.call_tool("weather_get_daily", {"location": "SF", "when": "today"})
+            second = await client.call_tool("weather_get_daily", {"location": "SF", "when": "today"})
+
+            assert first == second == sample_weather_data
+            mock_dispatch.assert_called_once()
+
+            with patch("daily_ai_agent.services.mcp_client.time.monotonic", return_value=time.monotonic() + 601):
+                await client.call_tool("weather_get_daily", {"location": "SF", "when": "today"})
+            assert mock_dispatch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_non_idempotent_tool_not_cached(self, client, sample_todos_data):
+        """Test that tools without a TTL always reach the server."""
+        with patch.object(client, "_dispatch_tool_call", new_callable=AsyncMock) as mock_dispatch:
+            mock_dispatch.return_value = sample_todos_data
+
+            await client.call_tool("todo_list", {"bucket": "work"})
+            await client.call_tool("todo_list", {"bucket": "work"})
+
+            assert mock_dispatch.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_shuttle_schedule_cached_only_with_departure_time(self, client):
+        """Test that "next shuttles after now" lookups always reach the server."""
+        with patch.object(client, "_dispatch_tool_call", new_callable=AsyncMock) as mock_dispatch:
+            mock_dispatch.return_value = {"departures": []}
+            relative = {"origin": "mountain_view_caltrain", "destination": "linkedin_transit_center"}
+            pinned = {**relative, "departure_time": "08:30"}
+
+            await client.call_tool("mobility_get_shuttle_schedule", relative)
+            await client.call_tool("mobility_get_shuttle_schedule", relative)
+            assert mock_dispatch.call_count == 2
+
+            await client.call_tool("mobility_get_shuttle_schedule", pinned)
+            await client.call_tool("mobility_get_shuttle_schedule", pinned)
+            assert mock_dispatch.call_count == 3
+
     @pytest.mark.asyncio
     async def test_health_check_success(self, client):
         """Test health_check returns True when server is healthy."""
-        mock_response = MagicMock()
-        mock_response.raise_for_status = MagicMock()
+        mock_response = MagicMock(status_code=200)
 
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get.return_value = mock_response
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client.get.return_value = mock_response
 
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=mock_client)):
             result = await client.health_check()
             assert result is True
 
+        probed = [call.args[0] for call in mock_client.get.await_args_list]
+        assert probed == [client.health_url, client.mcp_health_url]
+
+    @pytest.mark.asyncio
+    async def test_health_check_unhealthy_transport(self, client):
+        """Test health_check fails when only the SSE transport is down."""
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = [MagicMock(status_code=200), MagicMock(status_code=503)]
+
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=mock_client)):
+            assert await client.health_check() is False
+
     @pytest.mark.asyncio
     async def test_health_check_failure(self, client):
         """Test health_check returns False when server is unhealthy."""
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client.get.side_effect = Exception("Connection refused")
-            mock_client.__aenter__.return_value = mock_client
-            mock_client.__aexit__.return_value = None
-            mock_client_class.return_value = mock_client
+        mock_client = AsyncMock()
+        mock_client.get.side_effect = Exception("Connection refused")
 
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=mock_client)):
             result = await client.health_check()
             assert result is False
 
+    @pytest.mark.asyncio
+    async def test_discover_tools_uses_shared_client(self, client):
+        """Test that tool discovery goes through the pooled client."""
+        mock_response = MagicMock()
+        mock_response.content = orjson.dumps({"tools": {"weather_get_daily": {"description": "Weather"}}})
+        mock_client = AsyncMock()
+        mock_client.get.return_value = mock_response
+
+        with patch.object(MCPClient, "get_http_client", AsyncMock(return_value=mock_client)):
+            tools = await discover_mcp_tools("http://test-mcp-server:8000/")
+
+        assert tools == [{"name": "weather_get_daily", "description": "Weather"}]
+        assert mock_client.get.call_args.args[0] == "http://test-mcp-server:8000/tools"
+
+    @pytest.mark.asyncio
+    async def test_discover_tools_elsewhere_sends_no_auth(self, client):
+        """Test that probing another server doesn't use the authenticated pool."""
+        seen = {}
+
+        def handler(request):
+            seen["url"] = str(request.url)
+            seen["auth"] = request.headers.get("X-Internal-Auth")
+            return httpx.Response(200, json={"tools": {"search": {"description": "Search"}}})
+
+        real_async_client = httpx.AsyncClient
+
+        def unpooled_client(**kwargs):
+            return real_async_client(transport=httpx.MockTransport(handler), **kwargs)
+
+        with patch.object(MCPClient, "get_http_client", AsyncMock()) as pooled, \
+             patch("daily_ai_agent.services.mcp_client.httpx.AsyncClient", side_effect=unpooled_client):
+            tools = await discover_mcp_tools("https://third-party.example.com")
+
+        assert tools == [{"name": "search", "description": "Search"}]
+        assert seen == {"url": "https://third-party.example.com/tools", "auth": None}
+        pooled.assert_not_awaited()
+
     @pytest.mark.asyncio
     async def test_vault_search_with_folder(self, client):
         """vault_search forwards the folder scope and limit."""
@@ -259,3 +584,242 @@ class TestMCPClient:
             mock_call.return_value = {"folder": "Projects", "entries": [], "total": 0}
             await client.vault_list(folder="Projects")
             mock_call.assert_called_once_with("vault_list", {"folder": "Projects"})
+
+
+class TestMCPClientSSESession:
+    """Tests for the shared MCP SSE session."""
+
+    @pytest.fixture
+    def fake_session(self):
+        """A ClientSession stand-in whose tool calls return JSON text."""
+        session = MagicMock()
+        session.initialize = AsyncMock()
+        session.list_tools = AsyncMock(return_value=MagicMock(tools=[MagicMock()]))
+        session.call_tool = AsyncMock(
+            return_value=MagicMock(content=[MagicMock(text='{"ok": true}')])
+        )
+        session.__aenter__ = AsyncMock(return_value=session)
+        session.__aexit__ = AsyncMock(return_value=None)
+        return session
+
+    @pytest.fixture
+    def sse_client(self, mock_settings, fake_session):
+        """MCPClient wired to a fake SSE transport."""
+        @asynccontextmanager
+        async def fake_sse_client(url, headers=None):
+            yield MagicMock(), MagicMock()
+
+        with patch("daily_ai_agent.services.mcp_client.sse_client", fake_sse_client), \
+             patch("daily_ai_agent.services.mcp_client.ClientSession", return_value=fake_session):
+            yield MCPClient()
+
+    def test_connection_record_has_no_instance_dict(self):
+        """Test that MCPConnection uses slots."""
+        connection = MCPConnection(session=MagicMock(), tools=())
+
+        assert not hasattr(connection, "__dict__")
+        assert connection.last_used <= time.monotonic()
+
+    @pytest.mark.asyncio
+    async def test_session_reused_across_calls(self, sse_client, fake_session):
+        """Test that initialize runs once for several tool calls."""
+        try:
+            first = await sse_client._call_tool_via_sse("weather_get_daily", {})
+            second = await sse_client._call_tool_via_sse("todo_list", {})
+
+            assert first == second == {"ok": True}
+            fake_session.initialize.assert_awaited_once()
+            assert fake_session.call_tool.await_count == 2
+        finally:
+            await MCPClient.close_client()
+
+        assert MCPClient._connection is None
+
+    @pytest.mark.asyncio
+    async def test_discover_tools_uses_shared_session(self, sse_client, fake_session):
+        """Test that tool discovery reuses the session opened for tool calls."""
+        try:
+            await sse_client._call_tool_via_sse("weather_get_daily", {})
+            tools = await sse_client.discover_tools()
+        finally:
+            await MCPClient.close_client()
+
+        assert isinstance(tools, tuple) and len(tools) == 1
+        fake_session.initialize.assert_awaited_once()
+        fake_session.list_tools.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_tools_cache_indexed_by_name(self, sse_client, fake_session):
+        """Test that connecting refreshes the class-level tool lookup."""
+        weather = MagicMock()
+        weather.name = "weather_get_daily"
+        fake_session.list_tools.return_value = MagicMock(tools=[weather])
+        MCPClient._tools_cache["stale_tool"] = MagicMock()
+        try:
+            await sse_client.discover_tools()
+        finally:
+            await MCPClient.close_client()
+
+        assert MCPClient._tools_cache == {"weather_get_daily": weather}
+
+    @pytest.mark.asyncio
+    async def test_session_replaced_when_server_url_changes(self, sse_client, fake_session):
+        """Test that a session opened for another SSE URL isn't reused."""
+        try:
+            await sse_client._call_tool_via_sse("weather_get_daily", {})
+            sse_client.sse_url = "http://other-mcp-server:8000/mcp/sse"
+            await sse_client._call_tool_via_sse("weather_get_daily", {})
+            assert MCPClient._connection.url == "http://other-mcp-server:8000/mcp/sse"
+        finally:
+            await MCPClient.close_client()
+
+        assert fake_session.initialize.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_live_session_skips_connection_lock(self, sse_client, fake_session):
+        """Test that reusing a healthy session doesn't wait on the connection lock."""
+        try:
+            first = await sse_client._ensure_connection()
+            async with MCPClient._connection_lock:
+                second = await asyncio.wait_for(sse_client._ensure_connection(), timeout=0.5)
+        finally:
+            await MCPClient.close_client()
+
+        assert second is first
+        fake_session.initialize.assert_awaited_once()
+
+    def test_session_from_other_loop_closed_on_its_loop(self, sse_client, fake_session):
+        """Test that alternating event loops doesn't leave old sessions open."""
+        loops = [asyncio.new_event_loop() for _ in range(2)]
+        threads = [threading.Thread(target=loop.run_forever, daemon=True) for loop in loops]
+        for thread in threads:
+            thread.start()
+
+        def on(loop, coro):
+            return asyncio.run_coroutine_threadsafe(coro, loop).result(timeout=5)
+
+        try:
+            connections = [on(loops[i % 2], sse_client._ensure_connection()) for i in range(3)]
+            # Let each loop run the close callbacks it was handed
+            for loop in loops:
+                on(loop, asyncio.sleep(0.05))
+
+            first, second, third = connections
+            assert first.task.done() and second.task.done()
+            assert MCPClient._connection is third and not third.task.done()
+            assert fake_session.initialize.await_count == 3
+        finally:
+            on(loops[0], MCPClient.close_client())
+            for loop in loops:
+                loop.call_soon_threadsafe(loop.stop)
+            for thread in threads:
+                thread.join(timeout=5)
+            for loop in loops:
+                loop.close()
+
+    @pytest.mark.asyncio
+    async def test_stale_session_reconnects_without_backoff(self, sse_client, fake_session):
+        """Test that a session closed while idle is replaced immediately."""
+        import anyio
+
+        fake_session.call_tool.side_effect = [
+            anyio.ClosedResourceError(),
+            MagicMock(content=[MagicMock(text='{"ok": true}')]),
+        ]
+        with patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            try:
+                result = await sse_client._call_tool_via_sse("weather_get_daily", {})
+            finally:
+                await MCPClient.close_client()
+
+        assert result == {"ok": True}
+        assert fake_session.initialize.await_count == 2
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_non_transport_error_not_retried(self, sse_client, fake_session):
+        """Test that only transport failures are retried over SSE."""
+        fake_session.call_tool.side_effect = ValueError("bad payload")
+        try:
+            with pytest.raises(ValueError):
+                await sse_client._call_tool_via_sse("weather_get_daily", {}, max_retries=3)
+        finally:
+            await MCPClient.close_client()
+
+        fake_session.call_tool.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_protocol_error_not_retried(self, sse_client, fake_session):
+        """Test that a JSON-RPC error fails fast and keeps the session open."""
+        from mcp.shared.exceptions import McpError
+        from mcp.types import ErrorData
+
+        fake_session.call_tool.side_effect = McpError(ErrorData(code=-32602, message="Unknown tool"))
+        try:
+            with pytest.raises(MCPError, match="Unknown tool"):
+                await sse_client._call_tool_via_sse("nope", {})
+            assert MCPClient._connection is not None
+        finally:
+            await MCPClient.close_client()
+
+        fake_session.call_tool.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_retry_backoff_decorrelated_jitter(self, sse_client, fake_session):
+        """Test that SSE retry delays stay within the growing jitter window."""
+        fake_session.call_tool.side_effect = ConnectionError("stream closed")
+
+        with patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            try:
+                with pytest.raises(MCPError):
+                    await sse_client._call_tool_via_sse("weather_get_daily", {}, max_retries=3)
+            finally:
+                await MCPClient.close_client()
+
+        waits = [call.args[0] for call in mock_sleep.await_args_list]
+        assert len(waits) == 3
+        previous = 1.0
+        for wait in waits:
+            assert 1.0 <= wait <= previous * 2
+            previous = wait
+
+    @pytest.mark.asyncio
+    async def test_multi_part_content_decoded_together(self, sse_client, fake_session):
+        """Test that JSON split across text parts is joined before decoding, skipping non-text parts."""
+        fake_session.call_tool.return_value = MagicMock(
+            content=[MagicMock(text='{"events": [1, '), MagicMock(spec=[]), MagicMock(text='2]}')]
+        )
+        try:
+            result = await sse_client._call_tool_via_sse("calendar_list_events", {})
+        finally:
+            await MCPClient.close_client()
+
+        assert result == {"events": [1, 2]}
+
+    @pytest.mark.asyncio
+    async def test_plain_text_content_returned_as_result(self, sse_client, fake_session):
+        """Test that non-JSON replies are wrapped rather than raising."""
+        fake_session.call_tool.return_value = MagicMock(content=[MagicMock(text="Error: unknown tool")])
+        try:
+            result = await sse_client._call_tool_via_sse("nope", {})
+        finally:
+            await MCPClient.close_client()
+
+        assert result == {"result": "Error: unknown tool"}
+
+    @pytest.mark.asyncio
+    async def test_session_reopened_after_failure(self, sse_client, fake_session):
+        """Test that a failed call drops the session and the retry reconnects."""
+        fake_session.call_tool.side_effect = [
+            ConnectionError("stream closed"),
+            MagicMock(content=[MagicMock(text='{"ok": true}')]),
+        ]
+
+        with patch("daily_ai_agent.services.mcp_client.asyncio.sleep", new_callable=AsyncMock):
+            try:
+                result = await sse_client._call_tool_via_sse("weather_get_daily", {})
+            finally:
+                await MCPClient.close_client()
+
+        assert result == {"ok": True}
+        assert fake_session.initialize.await_count == 2
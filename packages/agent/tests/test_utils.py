@@ -3,6 +3,7 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 import asyncio
+import os
 
 from daily_ai_agent.utils.error_handlers import (
     APIError,
@@ -14,9 +15,15 @@ from daily_ai_agent.utils.error_handlers import (
 )
 from daily_ai_agent.utils.async_helpers import (
     run_async,
+    run_in_background_loop,
     gather_with_timeout,
     retry_async,
 )
+from daily_ai_agent.utils.tracing import (
+    disable_langsmith_tracing,
+    is_tracing_active,
+    setup_langsmith_tracing,
+)
 from daily_ai_agent.utils.constants import (
     APP_VERSION,
     FINANCIAL_SYMBOLS,
@@ -112,6 +119,23 @@ class TestAsyncHelpers:
         result = async_func(5)
         assert result == 10
 
+    def test_run_in_background_loop_reuses_one_loop(self):
+        """Test run_in_background_loop runs every coroutine on the same loop."""
+        async def current_loop():
+            return asyncio.get_running_loop()
+
+        first = run_in_background_loop(current_loop())
+        assert run_in_background_loop(current_loop()) is first
+        assert first.is_running()
+
+    def test_run_in_background_loop_raises(self):
+        """Test run_in_background_loop re-raises the coroutine's exception."""
+        async def fail():
+            raise ValueError("boom")
+
+        with pytest.raises(ValueError, match="boom"):
+            run_in_background_loop(fail())
+
     @pytest.mark.asyncio
     async def test_gather_with_timeout_success(self):
         """Test gather_with_timeout runs coroutines concurrently."""
@@ -189,6 +213,30 @@ class TestAsyncHelpers:
             )
 
 
+class TestTracing:
+    """Tests for LangSmith tracing setup."""
+
+    def test_setup_and_disable_update_active_flag(self, monkeypatch):
+        """Test that is_tracing_active follows setup and disable."""
+        for name in ("LANGCHAIN_TRACING_V2", "LANGCHAIN_API_KEY", "LANGCHAIN_PROJECT", "LANGCHAIN_ENDPOINT"):
+            monkeypatch.delenv(name, raising=False)
+
+        assert setup_langsmith_tracing(api_key="ls_test", project="aura-test", enabled=True) is True
+        assert is_tracing_active() is True
+        assert os.environ["LANGCHAIN_PROJECT"] == "aura-test"
+
+        disable_langsmith_tracing()
+        assert is_tracing_active() is False
+        assert "LANGCHAIN_API_KEY" not in os.environ
+
+    def test_setup_without_key_stays_inactive(self):
+        """Test that enabling without an API key leaves tracing off."""
+        disable_langsmith_tracing()
+
+        assert setup_langsmith_tracing(api_key=None, enabled=True) is False
+        assert is_tracing_active() is False
+
+
 class TestConstants:
     """Tests for constants module."""
 
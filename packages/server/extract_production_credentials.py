@@ -6,11 +6,22 @@ This script helps you get the credentials data needed for Railway environment va
 """
 
 import json
-import pickle
 import os
 from pathlib import Path
 
 
+def _read_refresh_token(token_file):
+    """Read the refresh token from a token.json or legacy token.pickle cache."""
+    if token_file.endswith(".json"):
+        with open(token_file, 'r') as f:
+            return json.load(f)["refresh_token"]
+    
+    # Only unpickle when there's no JSON cache: loading a pickle can run code
+    import pickle
+    with open(token_file, 'rb') as f:
+        return pickle.load(f).refresh_token
+
+
 def extract_credentials():
     """Extract credentials for production deployment."""
     
@@ -19,15 +30,16 @@ def extract_credentials():
     
     # Check if credentials files exist
     creds_file = "google_calendar_credentials.json"
-    token_file = "token.pickle"
+    # Prefer the JSON token cache; token.pickle is the legacy format
+    token_file = next((f for f in ("token.json", "token.pickle") if os.path.exists(f)), None)
     
     if not os.path.exists(creds_file):
         print(f"❌ {creds_file} not found!")
         print("   Please run the Google Calendar setup first.")
         return
     
-    if not os.path.exists(token_file):
-        print(f"❌ {token_file} not found!")
+    if token_file is None:
+        print("❌ token.json / token.pickle not found!")
         print("   Please complete the OAuth flow first (run the server locally).")
         return
     
@@ -36,25 +48,27 @@ def extract_credentials():
         with open(creds_file, 'r') as f:
             original_creds = json.load(f)
         
-        # Read the token pickle to get refresh token
-        with open(token_file, 'rb') as f:
-            token_data = pickle.load(f)
+        # Read the token cache to get refresh token
+        refresh_token = _read_refresh_token(token_file)
         
         # Create production credentials JSON
         production_creds = {
             "client_id": original_creds["installed"]["client_id"],
             "client_secret": original_creds["installed"]["client_secret"],
-            "refresh_token": token_data.refresh_token,
+            "refresh_token": refresh_token,
             "token_uri": "https://oauth2.googleapis.com/token",
             "type": "oauth2"
         }
         
+        # Serialized once: printed for copying and saved below
+        creds_json = json.dumps(production_creds, indent=2)
+        
         print("✅ Successfully extracted credentials!")
         print("\n🚀 Add this to your Railway environment variables:")
         print("=" * 50)
         print("Variable Name: GOOGLE_CALENDAR_CREDENTIALS_JSON")
         print("Variable Value:")
-        print(json.dumps(production_creds, indent=2))
+        print(creds_json)
         
         print("\n📋 Other required environment variables:")
         print("=" * 50)
@@ -71,7 +85,7 @@ def extract_credentials():
         
         # Save to a temporary file for easy copying
         with open("production_credentials.json", "w") as f:
-            json.dump(production_creds, f, indent=2)
+            f.write(creds_json)
         
         print(f"\n💾 Credentials also saved to: production_credentials.json")
         print("   (Remember to delete this file after use!)")
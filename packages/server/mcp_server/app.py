@@ -7,22 +7,26 @@ This module provides a FastAPI-based REST API with:
 - Rate limiting and CORS support
 """
 
+import asyncio
+import hashlib
 import os
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import Optional
 
+import anyio.to_thread
+import orjson
 from fastapi import FastAPI, HTTPException, Query, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
-from slowapi import Limiter
-from slowapi.util import get_remote_address
-from slowapi.errors import RateLimitExceeded
+from fastapi.responses import ORJSONResponse, Response
+from starlette.concurrency import run_in_threadpool
 
 from .config import get_settings
 from .auth import InternalAuthMiddleware
+from .rate_limit import RateLimitMiddleware
 from .utils.logging import setup_logging, get_logger
 from .utils.cache import get_cache_service
+from .utils.http_client import close_shared_client
 
 
 def _weekend_prefs_path() -> Path:
@@ -53,7 +57,7 @@ def _weekend_prefs_path() -> Path:
             return candidate
 
     return Path.cwd() / "data" / "weekend_preferences.json"
-from .server import get_mcp_server
+from .server import MCPServer, get_mcp_server
 from .mcp_sse import router as mcp_router
 from .schemas import (
     WeatherInput,
@@ -64,13 +68,231 @@ from .schemas import (
     FinancialInput,
     TrailSearchInput, ConcertSearchInput, ItineraryInput,
     VaultSearchInput, VaultReadInput, VaultListInput,
+    MorningBundleInput,
 )
 
 # Initialize logger
 logger = get_logger("fastapi_app")
 
-# Rate limiter
-limiter = Limiter(key_func=get_remote_address)
+# Every POST /tools/<name> endpoint as (tool name, input schema, OpenAPI tag,
+# description). Each validates its schema and forwards to the MCP server.
+TOOL_ENDPOINTS = (
+    # Weather
+    (
+        "weather_get_daily", WeatherInput, "Weather",
+        "Get current weather and daily forecast.\n\n"
+        "Returns real-time weather data from OpenWeatherMap including "
+        "temperature, conditions, humidity, and wind speed.",
+    ),
+
+    # Mobility
+    (
+        "mobility_get_commute", MobilityInput, "Mobility",
+        "Get commute information with travel times and route options.\n\n"
+        "Returns driving, walking, transit, or bicycling directions with "
+        "real-time traffic data from Google Maps.",
+    ),
+    (
+        "mobility_get_commute_options", CommuteInput, "Mobility",
+        "Get comprehensive commute analysis with driving AND transit options.\n\n"
+        "Returns complete analysis including real-time traffic, Caltrain "
+        "schedules, shuttle connections, fuel estimates, and AI "
+        "recommendations.",
+    ),
+    (
+        "mobility_get_shuttle_schedule", ShuttleScheduleInput, "Mobility",
+        "Get MV Connector shuttle schedules.\n\n"
+        "Returns shuttle times between Mountain View Caltrain, LinkedIn "
+        "Transit Center, and LinkedIn 950|1000.",
+    ),
+
+    # Calendar
+    (
+        "calendar_list_events", CalendarInput, "Calendar",
+        "List calendar events for a specific date.\n\n"
+        "Returns all events from Google Calendar for the specified date, "
+        "including title, time, location, and attendees.",
+    ),
+    (
+        "calendar_list_events_range", CalendarRangeInput, "Calendar",
+        "List calendar events for a date range.\n\n"
+        "More efficient than multiple single-date calls. Returns all events "
+        "between start_date and end_date inclusive.",
+    ),
+    (
+        "calendar_create_event", CalendarCreateInput, "Calendar",
+        "Create a new calendar event.\n\n"
+        "Creates an event in Google Calendar with optional attendees, "
+        "location, and conflict detection.",
+    ),
+    (
+        "calendar_update_event", CalendarUpdateInput, "Calendar",
+        "Update an existing calendar event.\n\n"
+        "Updates specified fields of an existing Google Calendar event. "
+        "Returns the updated event and list of changes made.",
+    ),
+    (
+        "calendar_delete_event", CalendarDeleteInput, "Calendar",
+        "Delete a calendar event.\n\n"
+        "Permanently removes an event from Google Calendar. Returns the "
+        "deleted event details for confirmation.",
+    ),
+    (
+        "calendar_find_free_time", CalendarFindFreeTimeInput, "Calendar",
+        "Find available time slots for scheduling.\n\n"
+        "Searches for free time slots across specified calendars, with "
+        "optional time preferences and duration requirements.",
+    ),
+
+    # Todo
+    (
+        "todo_list", TodoInput, "Todo",
+        "List todo items from Todoist.\n\n"
+        "Returns todos from specified bucket (work, home, errands, "
+        "personal) or all buckets if none specified. Supports filtering "
+        "completed items.",
+    ),
+    (
+        "todo_create", TodoCreateInput, "Todo",
+        "Create a new todo item in Todoist.\n\n"
+        'Supports natural language due dates (e.g., "next Friday"), '
+        "priority levels, and bucket categorization.",
+    ),
+    (
+        "todo_update", TodoUpdateInput, "Todo",
+        "Update an existing todo item.\n\n"
+        "Update title, priority, due date, or other properties. Returns the "
+        "updated todo and list of changes made.",
+    ),
+    (
+        "todo_complete", TodoCompleteInput, "Todo",
+        "Mark a todo item as completed or uncompleted.\n\n"
+        "Toggle the completion status of a todo item.",
+    ),
+    (
+        "todo_delete", TodoDeleteInput, "Todo",
+        "Delete a todo item permanently.\n\n"
+        "Removes the todo from Todoist. Returns deleted item for audit "
+        "trail.",
+    ),
+
+    # Financial
+    (
+        "financial_get_data", FinancialInput, "Financial",
+        "Get real-time financial data for stocks and cryptocurrencies.\n\n"
+        "Returns current prices, changes, and market status for specified "
+        "symbols from Alpha Vantage and CoinGecko.",
+    ),
+
+    # Weekend
+    (
+        "weekend_get_trails", TrailSearchInput, "Weekend",
+        "Scout outdoor trails near a location.\n\n"
+        "Returns matching trails filtered by activity type, max distance, "
+        "and difficulty. Phase 1: returns mock data when no API key is "
+        "configured.",
+    ),
+    (
+        "weekend_get_concerts", ConcertSearchInput, "Weekend",
+        "Find upcoming concerts and live music events.\n\n"
+        "Returns events for tracked artists or all events within radius. "
+        "Filters by date range. Phase 1: returns mock data when Bandsintown "
+        "is not configured.",
+    ),
+    (
+        "weekend_generate_itinerary", ItineraryInput, "Weekend",
+        "Generate a multi-day itinerary with points of interest.\n\n"
+        "Returns POIs grouped by category plus optional drive-time "
+        "estimates from a base location. The agent's LLM is responsible for "
+        "stitching these into a day-by-day narrative. Phase 1: returns mock "
+        "data.",
+    ),
+
+    # Vault
+    (
+        "vault_search", VaultSearchInput, "Vault",
+        "Search Kevin's personal markdown vault.\n\n"
+        "Ripgrep-backed full-text search across the brain-vault. Returns "
+        "ranked snippets with vault-relative paths, line numbers, and the "
+        "nearest preceding markdown heading for orientation. Scope a search "
+        "with `folder` (e.g., 'Projects', 'Career') for faster, more "
+        "focused results.",
+    ),
+    (
+        "vault_read", VaultReadInput, "Vault",
+        "Read a single markdown file from Kevin's vault.\n\n"
+        "Returns the raw file contents. Use vault_search first to discover "
+        "the path, then vault_read to load the full note. Files larger than "
+        "1 MB are rejected.",
+    ),
+    (
+        "vault_list", VaultListInput, "Vault",
+        "List immediate children of a vault folder (one level deep).\n\n"
+        "Use to explore vault structure — e.g., list 'Projects' to find a "
+        "project note, or list with no folder to see top-level layout "
+        "(Activity/, Career/, Projects/, etc.). Dotfiles are hidden.",
+    ),
+
+    # Morning
+    (
+        "morning_get_bundle", MorningBundleInput, "Morning",
+        "Get everything a morning briefing needs in one call.\n\n"
+        "Runs weather, calendar, todo and commute lookups concurrently and "
+        "returns one section per tool. A failing section comes back as "
+        '{"error": "..."} instead of failing the whole request.',
+    ),
+)
+
+# Tools that report a missing target as an unsuccessful result; the REST
+# endpoint turns that into a 404.
+_NOT_FOUND_AS_404 = frozenset({"calendar_update_event", "calendar_delete_event"})
+
+
+def _add_tool_endpoint(
+    app: FastAPI,
+    mcp_server: MCPServer,
+    tool_name: str,
+    input_schema: type,
+    tag: str,
+    description: str,
+) -> None:
+    """Register POST /tools/<tool_name>, forwarding the validated input to the tool."""
+    not_found_as_404 = tool_name in _NOT_FOUND_AS_404
+
+    async def endpoint(input_data: input_schema):
+        try:
+            result = await mcp_server.call_tool(tool_name, input_data)
+        except Exception as e:
+            logger.error(f"Error in {tool_name}: {e}")
+            raise HTTPException(status_code=500, detail=str(e))
+        if (
+            not_found_as_404
+            and not result.get('success')
+            and 'not found' in result.get('message', '').lower()
+        ):
+            raise HTTPException(status_code=404, detail=result.get('message'))
+        return result
+
+    app.post(
+        f"/tools/{tool_name}",
+        response_model=None,
+        tags=[tag],
+        name=tool_name,
+        description=description,
+    )(endpoint)
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag for a response body."""
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def _static_json(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """Serve a pre-serialized JSON body, answering 304 when the ETag matches."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(body, media_type="application/json", headers=headers)
 
 
 @asynccontextmanager
@@ -79,6 +301,12 @@ async def lifespan(app: FastAPI):
     # Startup
     setup_logging()
     logger.info("Starting MCP Server...")
+    loop = asyncio.get_running_loop()
+    logger.info(f"Event loop: {type(loop).__module__}.{type(loop).__name__}")
+
+    # Google client calls are sync and run in the threadpool; give them more
+    # room than anyio's default 40 threads so they don't queue behind each other
+    anyio.to_thread.current_default_thread_limiter().total_tokens = 100
 
     # Initialize cache
     cache_service = await get_cache_service()
@@ -97,6 +325,7 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down MCP Server...")
     await vault_sync.stop_periodic_sync()
+    await close_shared_client()
 
 
 def create_app() -> FastAPI:
@@ -127,8 +356,20 @@ def create_app() -> FastAPI:
         redoc_url="/redoc",
         openapi_url="/openapi.json",
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
+    # Per-client token bucket shared across workers through Redis. Opt-in, and
+    # added before CORS so it runs inside it and 429s still carry CORS headers.
+    if settings.rate_limit_enabled:
+        app.add_middleware(
+            RateLimitMiddleware,
+            redis_url=settings.redis_url,
+            requests_per_minute=settings.rate_limit_per_minute,
+            internal_auth_secret=settings.internal_auth_secret,
+            trust_proxy_headers=settings.rate_limit_trust_proxy,
+        )
+
     # Configure CORS
     app.add_middleware(
         CORSMiddleware,
@@ -143,16 +384,6 @@ def create_app() -> FastAPI:
     # the secret is set in prod. Added after CORS so it runs outermost.
     app.add_middleware(InternalAuthMiddleware, secret=settings.internal_auth_secret)
 
-    # Add rate limiter
-    app.state.limiter = limiter
-
-    @app.exception_handler(RateLimitExceeded)
-    async def rate_limit_handler(request: Request, exc: RateLimitExceeded):
-        return JSONResponse(
-            status_code=429,
-            content={"error": "Rate limit exceeded"}
-        )
-
     # Get MCP server instance
     mcp_server = get_mcp_server()
 
@@ -161,29 +392,38 @@ def create_app() -> FastAPI:
 
     # ==================== System Endpoints ====================
 
+    # Both bodies are fixed for the process lifetime: serialize them once and
+    # let clients revalidate by ETag instead of re-downloading.
+    health_body = orjson.dumps({
+        "status": "healthy",
+        "version": "2.0.0",
+        "environment": settings.environment
+    })
+    tools_body = orjson.dumps(mcp_server.list_tools())
+    health_etag, tools_etag = _etag(health_body), _etag(tools_body)
+
     @app.get("/health", tags=["System"])
-    async def health_check():
+    async def health_check(request: Request):
         """Check service health status."""
-        return {
-            "status": "healthy",
-            "version": "2.0.0",
-            "environment": settings.environment
-        }
+        # Probes must always reach the server, so revalidate every time
+        return _static_json(request, health_body, health_etag, "no-cache")
 
     @app.get("/tools", tags=["System"])
-    async def list_tools():
+    async def list_tools(request: Request):
         """List all available MCP tools and their schemas."""
-        return mcp_server.list_tools()
+        return _static_json(request, tools_body, tools_etag, "public, max-age=60")
 
     @app.get("/calendars", tags=["System"])
     async def list_calendars():
         """List all available Google calendars."""
         try:
-            from .tools.calendar import CalendarTool
-            calendar_tool = CalendarTool()
+            # The instance MCPServer registered, so there's one Google client
+            calendar_tool = mcp_server.tools["calendar_list_events"]["tool"]
 
             if calendar_tool.google_calendar_client:
-                calendars = calendar_tool.google_calendar_client.get_calendar_list()
+                calendars = await run_in_threadpool(
+                    calendar_tool.google_calendar_client.get_calendar_list
+                )
                 return {
                     "available_calendars": calendars,
                     "total_calendars": len(calendars),
@@ -204,175 +444,10 @@ def create_app() -> FastAPI:
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
 
-    # ==================== Weather Endpoints ====================
+    # ==================== Tool Endpoints ====================
 
-    @app.post("/tools/weather_get_daily", response_model=None, tags=["Weather"])
-    async def weather_get_daily(input_data: WeatherInput):
-        """Get current weather and daily forecast.
-
-        Returns real-time weather data from OpenWeatherMap including
-        temperature, conditions, humidity, and wind speed.
-        """
-        try:
-            result = await mcp_server.call_tool("weather_get_daily", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in weather_get_daily: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    # ==================== Mobility Endpoints ====================
-
-    @app.post("/tools/mobility_get_commute", response_model=None, tags=["Mobility"])
-    async def mobility_get_commute(input_data: MobilityInput):
-        """Get commute information with travel times and route options.
-
-        Returns driving, walking, transit, or bicycling directions
-        with real-time traffic data from Google Maps.
-        """
-        try:
-            result = await mcp_server.call_tool("mobility_get_commute", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in mobility_get_commute: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/mobility_get_commute_options", response_model=None, tags=["Mobility"])
-    async def mobility_get_commute_options(input_data: CommuteInput):
-        """Get comprehensive commute analysis with driving AND transit options.
-
-        Returns complete analysis including real-time traffic, Caltrain schedules,
-        shuttle connections, fuel estimates, and AI recommendations.
-        """
-        try:
-            result = await mcp_server.call_tool("mobility_get_commute_options", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in mobility_get_commute_options: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/mobility_get_shuttle_schedule", response_model=None, tags=["Mobility"])
-    async def mobility_get_shuttle_schedule(input_data: ShuttleScheduleInput):
-        """Get MV Connector shuttle schedules.
-
-        Returns shuttle times between Mountain View Caltrain,
-        LinkedIn Transit Center, and LinkedIn 950|1000.
-        """
-        try:
-            result = await mcp_server.call_tool("mobility_get_shuttle_schedule", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in mobility_get_shuttle_schedule: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    # ==================== Calendar Endpoints ====================
-
-    @app.post("/tools/calendar_list_events", response_model=None, tags=["Calendar"])
-    async def calendar_list_events(input_data: CalendarInput):
-        """List calendar events for a specific date.
-
-        Returns all events from Google Calendar for the specified date,
-        including title, time, location, and attendees.
-        """
-        try:
-            result = await mcp_server.call_tool("calendar_list_events", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in calendar_list_events: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/calendar_list_events_range", response_model=None, tags=["Calendar"])
-    async def calendar_list_events_range(input_data: CalendarRangeInput):
-        """List calendar events for a date range.
-
-        More efficient than multiple single-date calls. Returns all events
-        between start_date and end_date inclusive.
-        """
-        try:
-            result = await mcp_server.call_tool("calendar_list_events_range", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in calendar_list_events_range: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/calendar_create_event", response_model=None, tags=["Calendar"])
-    async def calendar_create_event(input_data: CalendarCreateInput):
-        """Create a new calendar event.
-
-        Creates an event in Google Calendar with optional attendees,
-        location, and conflict detection.
-        """
-        try:
-            result = await mcp_server.call_tool("calendar_create_event", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in calendar_create_event: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/calendar_update_event", response_model=None, tags=["Calendar"])
-    async def calendar_update_event(input_data: CalendarUpdateInput):
-        """Update an existing calendar event.
-
-        Updates specified fields of an existing Google Calendar event.
-        Returns the updated event and list of changes made.
-        """
-        try:
-            result = await mcp_server.call_tool("calendar_update_event", input_data.model_dump())
-            if not result.get('success') and 'not found' in result.get('message', '').lower():
-                raise HTTPException(status_code=404, detail=result.get('message'))
-            return result
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error in calendar_update_event: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/calendar_delete_event", response_model=None, tags=["Calendar"])
-    async def calendar_delete_event(input_data: CalendarDeleteInput):
-        """Delete a calendar event.
-
-        Permanently removes an event from Google Calendar.
-        Returns the deleted event details for confirmation.
-        """
-        try:
-            result = await mcp_server.call_tool("calendar_delete_event", input_data.model_dump())
-            if not result.get('success') and 'not found' in result.get('message', '').lower():
-                raise HTTPException(status_code=404, detail=result.get('message'))
-            return result
-        except HTTPException:
-            raise
-        except Exception as e:
-            logger.error(f"Error in calendar_delete_event: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/calendar_find_free_time", response_model=None, tags=["Calendar"])
-    async def calendar_find_free_time(input_data: CalendarFindFreeTimeInput):
-        """Find available time slots for scheduling.
-
-        Searches for free time slots across specified calendars,
-        with optional time preferences and duration requirements.
-        """
-        try:
-            result = await mcp_server.call_tool("calendar_find_free_time", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in calendar_find_free_time: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    # ==================== Todo Endpoints ====================
-
-    @app.post("/tools/todo_list", response_model=None, tags=["Todo"])
-    async def todo_list(input_data: TodoInput):
-        """List todo items from Todoist.
-
-        Returns todos from specified bucket (work, home, errands, personal)
-        or all buckets if none specified. Supports filtering completed items.
-        """
-        try:
-            result = await mcp_server.call_tool("todo_list", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in todo_list: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
+    for tool_name, input_schema, tag, description in TOOL_ENDPOINTS:
+        _add_tool_endpoint(app, mcp_server, tool_name, input_schema, tag, description)
 
     @app.get("/tools/todos", response_model=None, tags=["Todo"])
     async def todos_get(
@@ -382,82 +457,12 @@ def create_app() -> FastAPI:
         """GET endpoint for todos - frontend compatibility."""
         try:
             input_data = TodoInput(bucket=bucket, include_completed=include_completed)
-            result = await mcp_server.call_tool("todo_list", input_data.model_dump())
+            result = await mcp_server.call_tool("todo_list", input_data)
             return result
         except Exception as e:
             logger.error(f"Error in todos GET: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    @app.post("/tools/todo_create", response_model=None, tags=["Todo"])
-    async def todo_create(input_data: TodoCreateInput):
-        """Create a new todo item in Todoist.
-
-        Supports natural language due dates (e.g., "next Friday"),
-        priority levels, and bucket categorization.
-        """
-        try:
-            result = await mcp_server.call_tool("todo_create", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in todo_create: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/todo_update", response_model=None, tags=["Todo"])
-    async def todo_update(input_data: TodoUpdateInput):
-        """Update an existing todo item.
-
-        Update title, priority, due date, or other properties.
-        Returns the updated todo and list of changes made.
-        """
-        try:
-            result = await mcp_server.call_tool("todo_update", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in todo_update: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/todo_complete", response_model=None, tags=["Todo"])
-    async def todo_complete(input_data: TodoCompleteInput):
-        """Mark a todo item as completed or uncompleted.
-
-        Toggle the completion status of a todo item.
-        """
-        try:
-            result = await mcp_server.call_tool("todo_complete", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in todo_complete: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/todo_delete", response_model=None, tags=["Todo"])
-    async def todo_delete(input_data: TodoDeleteInput):
-        """Delete a todo item permanently.
-
-        Removes the todo from Todoist. Returns deleted item for audit trail.
-        """
-        try:
-            result = await mcp_server.call_tool("todo_delete", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in todo_delete: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    # ==================== Financial Endpoints ====================
-
-    @app.post("/tools/financial_get_data", response_model=None, tags=["Financial"])
-    async def financial_get_data(input_data: FinancialInput):
-        """Get real-time financial data for stocks and cryptocurrencies.
-
-        Returns current prices, changes, and market status for
-        specified symbols from Alpha Vantage and CoinGecko.
-        """
-        try:
-            result = await mcp_server.call_tool("financial_get_data", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in financial_get_data: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
     # ==================== Weekend Endpoints ====================
 
     @app.get("/weekend/preferences", tags=["Weekend"])
@@ -581,111 +586,20 @@ def create_app() -> FastAPI:
             ]
         }
 
-    @app.post("/tools/weekend_get_trails", response_model=None, tags=["Weekend"])
-    async def weekend_get_trails(input_data: TrailSearchInput):
-        """Scout outdoor trails near a location.
-
-        Returns matching trails filtered by activity type, max distance, and difficulty.
-        Phase 1: returns mock data when no API key is configured.
-        """
-        try:
-            result = await mcp_server.call_tool("weekend_get_trails", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in weekend_get_trails: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/weekend_get_concerts", response_model=None, tags=["Weekend"])
-    async def weekend_get_concerts(input_data: ConcertSearchInput):
-        """Find upcoming concerts and live music events.
-
-        Returns events for tracked artists or all events within radius. Filters by
-        date range. Phase 1: returns mock data when Bandsintown is not configured.
-        """
-        try:
-            result = await mcp_server.call_tool("weekend_get_concerts", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in weekend_get_concerts: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/weekend_generate_itinerary", response_model=None, tags=["Weekend"])
-    async def weekend_generate_itinerary(input_data: ItineraryInput):
-        """Generate a multi-day itinerary with points of interest.
-
-        Returns POIs grouped by category plus optional drive-time estimates from a
-        base location. The agent's LLM is responsible for stitching these into a
-        day-by-day narrative. Phase 1: returns mock data.
-        """
-        try:
-            result = await mcp_server.call_tool("weekend_generate_itinerary", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in weekend_generate_itinerary: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    # ==================== Vault Endpoints ====================
-
-    @app.post("/tools/vault_search", response_model=None, tags=["Vault"])
-    async def vault_search(input_data: VaultSearchInput):
-        """Search Kevin's personal markdown vault.
-
-        Ripgrep-backed full-text search across the brain-vault. Returns ranked
-        snippets with vault-relative paths, line numbers, and the nearest
-        preceding markdown heading for orientation. Scope a search with `folder`
-        (e.g., 'Projects', 'Career') for faster, more focused results.
-        """
-        try:
-            result = await mcp_server.call_tool("vault_search", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in vault_search: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/vault_read", response_model=None, tags=["Vault"])
-    async def vault_read(input_data: VaultReadInput):
-        """Read a single markdown file from Kevin's vault.
-
-        Returns the raw file contents. Use vault_search first to discover
-        the path, then vault_read to load the full note. Files larger than 1 MB
-        are rejected.
-        """
-        try:
-            result = await mcp_server.call_tool("vault_read", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in vault_read: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
-    @app.post("/tools/vault_list", response_model=None, tags=["Vault"])
-    async def vault_list(input_data: VaultListInput):
-        """List immediate children of a vault folder (one level deep).
-
-        Use to explore vault structure — e.g., list 'Projects' to find a project
-        note, or list with no folder to see top-level layout (Activity/, Career/,
-        Projects/, etc.). Dotfiles are hidden.
-        """
-        try:
-            result = await mcp_server.call_tool("vault_list", input_data.model_dump())
-            return result
-        except Exception as e:
-            logger.error(f"Error in vault_list: {e}")
-            raise HTTPException(status_code=500, detail=str(e))
-
     # ==================== Error Handlers ====================
 
     @app.exception_handler(404)
     async def not_found_handler(request: Request, exc: HTTPException):
-        return JSONResponse(status_code=404, content={"error": "Endpoint not found"})
+        return ORJSONResponse(status_code=404, content={"error": "Endpoint not found"})
 
     @app.exception_handler(405)
     async def method_not_allowed_handler(request: Request, exc: HTTPException):
-        return JSONResponse(status_code=405, content={"error": "Method not allowed"})
+        return ORJSONResponse(status_code=405, content={"error": "Method not allowed"})
 
     @app.exception_handler(500)
     async def internal_error_handler(request: Request, exc: HTTPException):
         logger.error(f"Internal server error: {exc}")
-        return JSONResponse(status_code=500, content={"error": "Internal server error"})
+        return ORJSONResponse(status_code=500, content={"error": "Internal server error"})
 
     logger.info("FastAPI application created successfully")
     return app
@@ -316,7 +316,7 @@ class GoogleCalendarClient:
                 if email:
                     attendees.append(email)
             
-            return CalendarEvent(
+            return CalendarEvent.build_trusted(
                 id=event_id,
                 title=title,
                 start_time=start_time,
@@ -67,8 +67,12 @@ class Settings(BaseSettings):
         "https://web-production-66f9.up.railway.app"
     ]
     
-    # Rate limiting
+    # Rate limiting (opt-in; needs REDIS_URL). Set rate_limit_trust_proxy
+    # behind Fly/Render so clients are keyed by the address the proxy reports
+    # rather than the proxy's own.
+    rate_limit_enabled: bool = False
     rate_limit_per_minute: int = 60
+    rate_limit_trust_proxy: bool = False
 
     class Config:
         env_file = ".env"
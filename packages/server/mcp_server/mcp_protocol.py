@@ -9,10 +9,10 @@ Transports supported:
 - stdio for local process communication
 """
 
-import json
 import asyncio
 from typing import Any
 
+import orjson
 from mcp.server import Server
 from mcp.types import Tool, TextContent
 
@@ -28,24 +28,27 @@ mcp_app = Server("aura-mcp-server")
 _mcp_server = get_mcp_server()
 
 
+# The tool registry is fixed at import, so the MCP Tool list (and the JSON
+# schema generation behind it) is built once rather than on every tools/list
+_tools: list[Tool] = [
+    Tool(
+        name=name,
+        description=info["description"],
+        inputSchema=info["input_schema"].model_json_schema()
+    )
+    for name, info in _mcp_server.tools.items()
+]
+
+
 @mcp_app.list_tools()
 async def handle_list_tools() -> list[Tool]:
     """List all available tools in MCP protocol format.
 
-    Converts our internal tool registry to the official MCP Tool format.
+    Returns the shared list built from our internal tool registry at import;
+    callers must not mutate it.
     """
-    tools = []
-
-    for name, info in _mcp_server.tools.items():
-        tool = Tool(
-            name=name,
-            description=info["description"],
-            inputSchema=info["input_schema"].model_json_schema()
-        )
-        tools.append(tool)
-
-    logger.info(f"MCP list_tools: returning {len(tools)} tools")
-    return tools
+    logger.info(f"MCP list_tools: returning {len(_tools)} tools")
+    return _tools
 
 
 @mcp_app.call_tool()
@@ -61,8 +64,9 @@ async def handle_call_tool(name: str, arguments: dict[str, Any]) -> list[TextCon
         # Call the tool through our existing MCPServer
         result = await _mcp_server.call_tool(name, arguments)
 
-        # Convert result to JSON string for MCP response
-        result_json = json.dumps(result, indent=2, default=str)
+        # Convert result to JSON string for MCP response. Compact, and
+        # datetimes come out ISO 8601 like the REST endpoints'.
+        result_json = orjson.dumps(result, default=str, option=orjson.OPT_NON_STR_KEYS).decode()
 
         logger.info(f"MCP call_tool: {name} completed successfully")
         return [TextContent(type="text", text=result_json)]
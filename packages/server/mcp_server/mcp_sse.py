@@ -10,20 +10,30 @@ Protocol flow:
 3. Client sends JSON-RPC messages to POST /messages
 4. Server responds via SSE stream
 
+With several uvicorn workers the POST can land on a worker that doesn't own
+the stream. When REDIS_URL is set, sessions are registered in Redis
+(``mcp:session:{id}``, kept alive by the owner) and such a worker handles the
+message itself and RPUSHes the response onto ``mcp:session:{id}:queue``; the
+owner BLPOPs that list into the session's local queue. Without Redis,
+sessions are worker-local as before.
+
 Reference: https://modelcontextprotocol.io/docs/concepts/transports#server-sent-events-sse
 """
 
-import json
 import asyncio
-import uuid
-from typing import Optional, AsyncGenerator
+import secrets
+from typing import Any, Awaitable, Callable, Optional, AsyncGenerator
 from dataclasses import dataclass, field
 
+import orjson
+import redis.asyncio as aioredis
 from fastapi import APIRouter, Request, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
+from sse_starlette.event import ServerSentEvent
 from sse_starlette.sse import EventSourceResponse
 
-from .mcp_protocol import get_mcp_app
+from .config import get_settings
+from .mcp_protocol import get_mcp_app, handle_call_tool, handle_list_tools
 from .utils.logging import get_logger
 
 logger = get_logger("mcp_sse")
@@ -32,28 +42,123 @@ logger = get_logger("mcp_sse")
 router = APIRouter()
 
 
-@dataclass
+@dataclass(slots=True)
 class SSESession:
     """Represents an active SSE client session."""
 
     session_id: str
-    message_queue: asyncio.Queue = field(default_factory=asyncio.Queue)
+    # Serialized JSON-RPC messages, ready to go out as SSE data
+    message_queue: asyncio.Queue[str] = field(default_factory=asyncio.Queue)
     connected: bool = True
+    relay_task: Optional[asyncio.Task] = None
+    # Bounds the session's concurrently running requests
+    in_flight: asyncio.Semaphore = field(
+        default_factory=lambda: asyncio.Semaphore(MAX_IN_FLIGHT_PER_SESSION)
+    )
 
 
-# Active SSE sessions
+# Active SSE sessions owned by this worker
 _sessions: dict[str, SSESession] = {}
 
+# Strong references to running message handlers, so they aren't collected
+_dispatch_tasks: set[asyncio.Task] = set()
+
+# A session's Redis keys outlive its owner by at most this long
+SESSION_TTL_SECONDS = 90
+# Keepalive comment interval on idle streams
+SSE_PING_SECONDS = 30
+# Most queued messages sent in a single stream write
+_MAX_BATCH = 16
+# Most requests from one session handled at the same time
+MAX_IN_FLIGHT_PER_SESSION = 8
+# Most requests handled at the same time for sessions owned by other workers
+MAX_REMOTE_IN_FLIGHT = 32
+# How long the relay blocks on BLPOP before refreshing the session TTL
+_RELAY_BLOCK_SECONDS = 30
+
+# Bounds requests for sessions whose stream another worker holds; those have
+# no local SSESession to carry a per-session limit
+_remote_in_flight = asyncio.Semaphore(MAX_REMOTE_IN_FLIGHT)
+
+_redis: Optional[aioredis.Redis] = None
+
+
+def _get_redis() -> Optional[aioredis.Redis]:
+    """Redis client for cross-worker session delivery, or None without REDIS_URL."""
+    global _redis
+    if _redis is None:
+        redis_url = get_settings().redis_url
+        if not redis_url:
+            return None
+        # No socket_timeout: BLPOP legitimately blocks for _RELAY_BLOCK_SECONDS
+        _redis = aioredis.from_url(redis_url, socket_connect_timeout=5)
+    return _redis
+
 
-def create_session() -> SSESession:
-    """Create a new SSE session."""
-    session_id = str(uuid.uuid4())
+def _session_key(session_id: str) -> str:
+    return f"mcp:session:{session_id}"
+
+
+async def create_session() -> SSESession:
+    """Create a new SSE session, registering it in Redis when configured."""
+    session_id = secrets.token_hex(16)
     session = SSESession(session_id=session_id)
     _sessions[session_id] = session
+
+    redis = _get_redis()
+    if redis is not None:
+        try:
+            await redis.set(_session_key(session_id), 1, ex=SESSION_TTL_SECONDS)
+            session.relay_task = asyncio.create_task(_relay_remote_messages(session, redis))
+        except Exception as e:
+            logger.warning(f"Session {session_id} not shared across workers: {e}")
+
     logger.info(f"Created MCP SSE session: {session_id}")
     return session
 
 
+async def _relay_remote_messages(session: SSESession, redis: aioredis.Redis) -> None:
+    """Move responses queued in Redis by other workers into the local queue."""
+    key = _session_key(session.session_id)
+    queue_key = f"{key}:queue"
+    while session.connected:
+        try:
+            await redis.expire(key, SESSION_TTL_SECONDS)
+            # The stubs type blpop for both the sync and the asyncio client
+            item = await redis.blpop(  # type: ignore[misc]
+                [queue_key], timeout=_RELAY_BLOCK_SECONDS
+            )
+        except Exception as e:
+            logger.warning(f"Session relay error for {session.session_id}: {e}")
+            await asyncio.sleep(1)
+            continue
+        if item is not None:
+            await session.message_queue.put(item[1].decode())
+
+
+async def _remote_session_exists(session_id: str) -> bool:
+    """Whether another worker owns a live session with this id."""
+    redis = _get_redis()
+    if redis is None:
+        return False
+    try:
+        return bool(await redis.exists(_session_key(session_id)))
+    except Exception as e:
+        logger.warning(f"Could not look up session {session_id} in Redis: {e}")
+        return False
+
+
+async def _push_remote(session_id: str, data: bytes) -> None:
+    """Queue a response for the worker that owns the session's stream."""
+    redis = _get_redis()
+    assert redis is not None
+    queue_key = f"{_session_key(session_id)}:queue"
+    async with redis.pipeline(transaction=False) as pipe:
+        pipe.rpush(queue_key, data)
+        pipe.expire(queue_key, SESSION_TTL_SECONDS)
+        await pipe.execute()
+
+
 def get_session(session_id: str) -> Optional[SSESession]:
     """Get an existing SSE session."""
     return _sessions.get(session_id)
@@ -61,41 +166,44 @@ def get_session(session_id: str) -> Optional[SSESession]:
 
 def remove_session(session_id: str) -> None:
     """Remove an SSE session."""
-    if session_id in _sessions:
-        _sessions[session_id].connected = False
-        del _sessions[session_id]
-        logger.info(f"Removed MCP SSE session: {session_id}")
+    session = _sessions.pop(session_id, None)
+    if session is None:
+        return
+    session.connected = False
+    # The Redis keys are left to expire via their TTL
+    if session.relay_task is not None:
+        session.relay_task.cancel()
+    logger.info(f"Removed MCP SSE session: {session_id}")
+
+
+# Same for every handshake; responses share it and must not mutate it
+_INITIALIZE_RESULT = {
+    "protocolVersion": "2024-11-05",
+    "serverInfo": {
+        "name": "aura-mcp-server",
+        "version": "2.0.0"
+    },
+    "capabilities": {
+        "tools": {"listChanged": False}
+    }
+}
 
 
-async def handle_jsonrpc_message(message: dict, session: SSESession) -> Optional[dict]:
-    """Process a JSON-RPC message and return the response.
+async def _handle_initialize(params: dict, msg_id: Any) -> Optional[dict]:
+    return {"jsonrpc": "2.0", "id": msg_id, "result": _INITIALIZE_RESULT}
 
-    Routes messages to the appropriate MCP handlers.
-    """
-    method = message.get("method", "")
-    msg_id = message.get("id")
-    params = message.get("params", {})
 
-    try:
-        if method == "initialize":
-            # Handle initialization
-            result = {
-                "protocolVersion": "2024-11-05",
-                "serverInfo": {
-                    "name": "aura-mcp-server",
-                    "version": "2.0.0"
-                },
-                "capabilities": {
-                    "tools": {"listChanged": False}
-                }
-            }
-            return {"jsonrpc": "2.0", "id": msg_id, "result": result}
+# The tool registry never changes after startup, so the tools/list result is
+# built on first request and shared by every later response
+_tools_list_result: Optional[dict] = None
 
-        elif method == "tools/list":
-            # List available tools
-            from .mcp_protocol import handle_list_tools
-            tools = await handle_list_tools()
-            tools_data = [
+
+async def _handle_tools_list(params: dict, msg_id: Any) -> Optional[dict]:
+    global _tools_list_result
+    if _tools_list_result is None:
+        tools = await handle_list_tools()
+        _tools_list_result = {
+            "tools": [
                 {
                     "name": t.name,
                     "description": t.description,
@@ -103,38 +211,61 @@ async def handle_jsonrpc_message(message: dict, session: SSESession) -> Optional
                 }
                 for t in tools
             ]
-            return {"jsonrpc": "2.0", "id": msg_id, "result": {"tools": tools_data}}
+        }
+    return {"jsonrpc": "2.0", "id": msg_id, "result": _tools_list_result}
 
-        elif method == "tools/call":
-            # Call a tool
-            tool_name = params.get("name", "")
-            arguments = params.get("arguments", {})
 
-            from .mcp_protocol import handle_call_tool
-            content = await handle_call_tool(tool_name, arguments)
+async def _handle_tools_call(params: dict, msg_id: Any) -> Optional[dict]:
+    tool_name = params.get("name", "")
+    arguments = params.get("arguments", {})
 
-            content_data = [{"type": c.type, "text": c.text} for c in content]
-            return {"jsonrpc": "2.0", "id": msg_id, "result": {"content": content_data}}
+    content = await handle_call_tool(tool_name, arguments)
 
-        elif method == "notifications/initialized":
-            # Client acknowledges initialization - no response needed
-            return None
+    content_data = [{"type": c.type, "text": c.text} for c in content]
+    return {"jsonrpc": "2.0", "id": msg_id, "result": {"content": content_data}}
 
-        elif method == "ping":
-            # Health check
-            return {"jsonrpc": "2.0", "id": msg_id, "result": {}}
-
-        else:
-            # Unknown method
-            return {
-                "jsonrpc": "2.0",
-                "id": msg_id,
-                "error": {
-                    "code": -32601,
-                    "message": f"Method not found: {method}"
-                }
+
+async def _handle_initialized(params: dict, msg_id: Any) -> Optional[dict]:
+    # Client acknowledges initialization - no response needed
+    return None
+
+
+async def _handle_ping(params: dict, msg_id: Any) -> Optional[dict]:
+    return {"jsonrpc": "2.0", "id": msg_id, "result": {}}
+
+
+# JSON-RPC method -> handler(params, msg_id) returning the response, or None
+# for notifications
+_HANDLERS: dict[str, Callable[[dict, Any], Awaitable[Optional[dict]]]] = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "notifications/initialized": _handle_initialized,
+    "ping": _handle_ping,
+}
+
+
+async def handle_jsonrpc_message(message: dict, session: Optional[SSESession]) -> Optional[dict]:
+    """Process a JSON-RPC message and return the response.
+
+    Routes messages to the appropriate MCP handlers.
+    """
+    method = message.get("method", "")
+    msg_id = message.get("id")
+
+    handler = _HANDLERS.get(method)
+    if handler is None:
+        return {
+            "jsonrpc": "2.0",
+            "id": msg_id,
+            "error": {
+                "code": -32601,
+                "message": f"Method not found: {method}"
             }
+        }
 
+    try:
+        return await handler(message.get("params", {}), msg_id)
     except Exception as e:
         logger.error(f"Error handling JSON-RPC message: {e}")
         return {
@@ -147,12 +278,12 @@ async def handle_jsonrpc_message(message: dict, session: SSESession) -> Optional
         }
 
 
-async def event_generator(session: SSESession, request: Request) -> AsyncGenerator[dict, None]:
+async def event_generator(session: SSESession) -> AsyncGenerator[dict | bytes, None]:
     """Generate SSE events for the MCP protocol.
 
     Yields events in the format expected by sse-starlette:
     - {"event": "endpoint", "data": "/mcp/messages?session_id=xxx"}
-    - {"event": "message", "data": "...json..."}
+    - message events, pre-encoded as bytes so a batch is one write
     """
     try:
         # Send the endpoint URL for client messages
@@ -160,25 +291,19 @@ async def event_generator(session: SSESession, request: Request) -> AsyncGenerat
         yield {"event": "endpoint", "data": endpoint_url}
         logger.debug(f"Sent endpoint URL: {endpoint_url}")
 
-        # Keep connection alive and send queued messages
-        while session.connected:
-            # Check if client disconnected
-            if await request.is_disconnected():
-                logger.info(f"Client disconnected: {session.session_id}")
-                break
-
-            try:
-                # Wait for messages with timeout for keepalive
-                message = await asyncio.wait_for(
-                    session.message_queue.get(),
-                    timeout=30.0
-                )
-                yield {"event": "message", "data": json.dumps(message)}
-                logger.debug(f"Sent message to client: {session.session_id}")
-
-            except asyncio.TimeoutError:
-                # Send keepalive comment
-                yield {"comment": "keepalive"}
+        # Send queued messages. The generator sleeps in get() until there is
+        # one: EventSourceResponse sends the keepalive pings from its own task
+        # and cancels this generator when the client disconnects. Messages
+        # that queued up meanwhile go out together in one write.
+        queue = session.message_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < _MAX_BATCH and not queue.empty():
+                batch.append(queue.get_nowait())
+            yield b"".join(
+                ServerSentEvent(data=data, event="message").encode() for data in batch
+            )
+            logger.debug(f"Sent {len(batch)} message(s) to client: {session.session_id}")
 
     except asyncio.CancelledError:
         logger.info(f"SSE stream cancelled: {session.session_id}")
@@ -196,10 +321,11 @@ async def sse_endpoint(request: Request):
     The server sends an 'endpoint' event with the URL for posting messages,
     then streams 'message' events for responses.
     """
-    session = create_session()
+    session = await create_session()
 
     return EventSourceResponse(
-        event_generator(session, request),
+        event_generator(session),
+        ping=SSE_PING_SECONDS,
         headers={
             "Cache-Control": "no-cache",
             "Connection": "keep-alive",
@@ -208,6 +334,27 @@ async def sse_endpoint(request: Request):
     )
 
 
+async def _dispatch_and_enqueue(
+    message: dict, session_id: str, session: Optional[SSESession]
+) -> None:
+    """Handle one JSON-RPC message and queue its response for the stream."""
+    in_flight = session.in_flight if session is not None else _remote_in_flight
+    try:
+        async with in_flight:
+            response = await handle_jsonrpc_message(message, session)
+
+        if response:
+            # Queue response for SSE delivery, via Redis if another worker
+            # holds the stream
+            data = orjson.dumps(response)
+            if session is not None:
+                await session.message_queue.put(data.decode())
+            else:
+                await _push_remote(session_id, data)
+    except Exception as e:
+        logger.error(f"Error delivering MCP response for session {session_id}: {e}")
+
+
 @router.post("/messages")
 async def messages_endpoint(request: Request, session_id: str):
     """Receive JSON-RPC messages from MCP clients.
@@ -219,25 +366,24 @@ async def messages_endpoint(request: Request, session_id: str):
         raise HTTPException(status_code=400, detail="session_id required")
 
     session = get_session(session_id)
-    if not session:
+    if not session and not await _remote_session_exists(session_id):
         raise HTTPException(status_code=404, detail="Invalid or expired session")
 
     try:
-        message = await request.json()
+        message = orjson.loads(await request.body())
         if not message:
             raise HTTPException(status_code=400, detail="JSON body required")
 
         logger.debug(f"Received MCP message: {message.get('method', 'unknown')}")
 
-        # Process the message
-        response = await handle_jsonrpc_message(message, session)
-
-        if response:
-            # Queue response for SSE delivery
-            await session.message_queue.put(response)
+        # Process the message in the background so slow tool calls neither
+        # hold up the 202 nor serialize a session's concurrent requests
+        task = asyncio.create_task(_dispatch_and_enqueue(message, session_id, session))
+        _dispatch_tasks.add(task)
+        task.add_done_callback(_dispatch_tasks.discard)
 
         # Return 202 Accepted - response will come via SSE
-        return JSONResponse(status_code=202, content={})
+        return Response(status_code=202)
 
     except HTTPException:
         raise
@@ -251,7 +397,7 @@ async def mcp_health():
     """Health check for MCP SSE transport.
 
     Returns health status of the MCP SSE transport layer,
-    including number of active sessions.
+    including number of active sessions on this worker.
     """
     return {
         "status": "healthy",
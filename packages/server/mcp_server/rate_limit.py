@@ -0,0 +1,160 @@
+"""Per-client request rate limiting for the MCP server.
+
+A token bucket per remote address, kept in Redis so every uvicorn worker (and
+every Fly machine) enforces the same limit. The whole read-refill-decrement
+step runs as one Lua script, so each request costs a single O(1) round trip
+and concurrent requests can't race each other past the limit. The script is
+sent once (``SCRIPT LOAD``) and then invoked by SHA with ``EVALSHA``; redis-py's
+``Script`` object reloads it transparently if Redis restarts and forgets it.
+
+Like the auth middleware this is **pure ASGI**, so the long-lived `/mcp/sse`
+stream passes through unbuffered.
+
+Behavior:
+  - Opt-in: only installed when `RATE_LIMIT_ENABLED` is set.
+  - `REDIS_URL` unset -> open (local dev; a per-process counter would
+    under-enforce by the worker count anyway).
+  - Redis unreachable -> fail open and log; the limiter must never take the
+    API down with it.
+  - `/health`, `/mcp/*` (one SSE stream plus its posted messages per client)
+    and CORS preflights are never limited, nor are internal callers that
+    present a valid `X-Internal-Auth` secret.
+  - Clients are keyed by socket address. Behind Fly/Render that is the proxy,
+    so set `RATE_LIMIT_TRUST_PROXY` to key on the address the proxy reports
+    (`Fly-Client-IP`, else the last `X-Forwarded-For` hop) instead.
+"""
+
+from __future__ import annotations
+
+import hmac
+import time
+from typing import Optional
+
+import redis.asyncio as aioredis
+from redis.commands.core import AsyncScript
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from .utils.logging import get_logger
+
+logger = get_logger("rate_limit")
+
+EXEMPT_PATHS = frozenset({"/health"})
+EXEMPT_PREFIXES = ("/mcp/",)
+
+# KEYS[1] = bucket key; ARGV = capacity, refill rate (tokens/sec), now (sec).
+# Returns 1 if a token was taken, 0 if the bucket is empty.
+TOKEN_BUCKET_LUA = """
+local capacity = tonumber(ARGV[1])
+local rate = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+
+local bucket = redis.call('HMGET', KEYS[1], 'tokens', 'last_refill')
+local tokens = tonumber(bucket[1]) or capacity
+local last_refill = tonumber(bucket[2]) or now
+
+tokens = math.min(capacity, tokens + math.max(0, now - last_refill) * rate)
+
+local allowed = 0
+if tokens >= 1 then
+    tokens = tokens - 1
+    allowed = 1
+end
+
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'last_refill', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(capacity / rate) + 1)
+return allowed
+"""
+
+
+class RateLimitMiddleware:
+    """Answer 429 once a client exhausts its token bucket. No-op without Redis."""
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        redis_url: str | None,
+        requests_per_minute: int,
+        internal_auth_secret: str | None = None,
+        trust_proxy_headers: bool = False,
+        key_prefix: str = "ratelimit:",
+    ) -> None:
+        self.app = app
+        self.redis_url = redis_url or None  # treat "" as unset
+        self.capacity = requests_per_minute
+        self.refill_rate = requests_per_minute / 60.0
+        self.internal_auth_secret = internal_auth_secret or None
+        self.trust_proxy_headers = trust_proxy_headers
+        self.key_prefix = key_prefix
+        self._script: Optional[AsyncScript] = None
+
+    def _is_exempt(self, scope: Scope, headers: dict[bytes, bytes]) -> bool:
+        """Whether the request bypasses the limiter entirely."""
+        path = scope.get("path", "")
+        if scope.get("method") == "OPTIONS" or path in EXEMPT_PATHS:
+            return True
+        if path.startswith(EXEMPT_PREFIXES):
+            return True
+        if self.internal_auth_secret is None:
+            return False
+        provided = headers.get(b"x-internal-auth", b"").decode("latin-1")
+        return hmac.compare_digest(provided, self.internal_auth_secret)
+
+    def _client_id(self, scope: Scope, headers: dict[bytes, bytes]) -> str:
+        """The address the bucket is keyed on."""
+        if self.trust_proxy_headers:
+            fly_client_ip = headers.get(b"fly-client-ip")
+            if fly_client_ip:
+                return fly_client_ip.decode("latin-1")
+            forwarded_for = headers.get(b"x-forwarded-for")
+            if forwarded_for:
+                # The last hop is the one our proxy appended; earlier ones are
+                # whatever the client chose to send.
+                return forwarded_for.decode("latin-1").rsplit(",", 1)[-1].strip()
+        client = scope.get("client")
+        return str(client[0]) if client else "unknown"
+
+    def _get_script(self) -> AsyncScript:
+        """Bind the Lua script to a client, creating both on first use."""
+        if self._script is None:
+            client = aioredis.from_url(
+                self.redis_url,
+                socket_connect_timeout=1,
+                socket_timeout=1,
+            )
+            self._script = client.register_script(TOKEN_BUCKET_LUA)
+        return self._script
+
+    async def _allow(self, client_id: str) -> bool:
+        """Take a token for ``client_id``; fail open if Redis misbehaves."""
+        try:
+            allowed = await self._get_script()(
+                keys=[self.key_prefix + client_id],
+                args=[self.capacity, self.refill_rate, time.time()],
+            )
+        except Exception as e:
+            logger.warning(f"Rate limiter unavailable, allowing request: {e}")
+            return True
+        return bool(allowed)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.redis_url is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers", []))
+        if self._is_exempt(scope, headers):
+            await self.app(scope, receive, send)
+            return
+
+        if not await self._allow(self._client_id(scope, headers)):
+            response = JSONResponse(
+                {"error": "Rate limit exceeded"},
+                status_code=429,
+                headers={"Retry-After": str(max(1, round(1 / self.refill_rate)))},
+            )
+            await response(scope, receive, send)
+            return
+
+        await self.app(scope, receive, send)
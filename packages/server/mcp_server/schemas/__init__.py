@@ -1,41 +1,62 @@
-"""Pydantic schemas for MCP tool validation."""
-
-from .weather import WeatherInput, WeatherOutput
-from .mobility import MobilityInput, MobilityOutput, CommuteInput, CommuteOutput, ShuttleScheduleInput, ShuttleScheduleOutput
-from .calendar import CalendarInput, CalendarOutput, CalendarRangeInput, CalendarRangeOutput, CalendarCreateInput, CalendarCreateOutput, CalendarUpdateInput, CalendarUpdateOutput, CalendarDeleteInput, CalendarDeleteOutput, CalendarFindFreeTimeInput, CalendarFindFreeTimeOutput, FreeTimeSlot
-from .todo import (
-    TodoInput, TodoOutput, TodoCreateInput, TodoCreateOutput,
-    TodoUpdateInput, TodoUpdateOutput, TodoCompleteInput, TodoCompleteOutput,
-    TodoDeleteInput, TodoDeleteOutput
-)
-from .financial import FinancialInput, FinancialOutput
-from .weekend import (
-    TrailSearchInput, TrailSearchOutput,
-    ConcertSearchInput, ConcertSearchOutput,
-    ItineraryInput, ItineraryOutput,
-    Trail, ConcertEvent, POI, TransitEstimate,
-    ActivityType, TrailDifficulty, TicketStatus, POICategory,
-)
-from .vault import (
-    VaultSearchInput, VaultSearchOutput, VaultSearchHit,
-    VaultReadInput, VaultReadOutput,
-    VaultListInput, VaultListOutput, VaultEntry,
-)
-
-__all__ = [
-    "WeatherInput", "WeatherOutput",
-    "MobilityInput", "MobilityOutput", "CommuteInput", "CommuteOutput", "ShuttleScheduleInput", "ShuttleScheduleOutput",
-    "CalendarInput", "CalendarOutput", "CalendarRangeInput", "CalendarRangeOutput", "CalendarCreateInput", "CalendarCreateOutput", "CalendarUpdateInput", "CalendarUpdateOutput", "CalendarDeleteInput", "CalendarDeleteOutput", "CalendarFindFreeTimeInput", "CalendarFindFreeTimeOutput", "FreeTimeSlot",
-    "TodoInput", "TodoOutput", "TodoCreateInput", "TodoCreateOutput",
-    "TodoUpdateInput", "TodoUpdateOutput", "TodoCompleteInput", "TodoCompleteOutput",
-    "TodoDeleteInput", "TodoDeleteOutput",
-    "FinancialInput", "FinancialOutput",
-    "TrailSearchInput", "TrailSearchOutput",
-    "ConcertSearchInput", "ConcertSearchOutput",
-    "ItineraryInput", "ItineraryOutput",
-    "Trail", "ConcertEvent", "POI", "TransitEstimate",
-    "ActivityType", "TrailDifficulty", "TicketStatus", "POICategory",
-    "VaultSearchInput", "VaultSearchOutput", "VaultSearchHit",
-    "VaultReadInput", "VaultReadOutput",
-    "VaultListInput", "VaultListOutput", "VaultEntry",
-]
+"""Pydantic schemas for MCP tool validation.
+
+Schemas are imported lazily (PEP 562): ``from mcp_server.schemas import
+WeatherInput`` only builds the models in ``schemas/weather.py``, not every
+tool's.
+"""
+
+from importlib import import_module
+from typing import Any
+
+_SUBMODULE_EXPORTS = {
+    "weather": ("WeatherInput", "WeatherOutput"),
+    "mobility": (
+        "MobilityInput", "MobilityOutput", "CommuteInput", "CommuteOutput",
+        "ShuttleScheduleInput", "ShuttleScheduleOutput",
+    ),
+    "calendar": (
+        "CalendarInput", "CalendarOutput", "CalendarRangeInput", "CalendarRangeOutput",
+        "CalendarCreateInput", "CalendarCreateOutput", "CalendarUpdateInput", "CalendarUpdateOutput",
+        "CalendarDeleteInput", "CalendarDeleteOutput", "CalendarFindFreeTimeInput",
+        "CalendarFindFreeTimeOutput", "FreeTimeSlot",
+    ),
+    "todo": (
+        "TodoInput", "TodoOutput", "TodoCreateInput", "TodoCreateOutput",
+        "TodoUpdateInput", "TodoUpdateOutput", "TodoCompleteInput", "TodoCompleteOutput",
+        "TodoDeleteInput", "TodoDeleteOutput",
+    ),
+    "financial": ("FinancialInput", "FinancialOutput"),
+    "weekend": (
+        "TrailSearchInput", "TrailSearchOutput",
+        "ConcertSearchInput", "ConcertSearchOutput",
+        "ItineraryInput", "ItineraryOutput",
+        "Trail", "ConcertEvent", "POI", "TransitEstimate",
+        "ActivityType", "TrailDifficulty", "TicketStatus", "POICategory",
+    ),
+    "vault": (
+        "VaultSearchInput", "VaultSearchOutput", "VaultSearchHit",
+        "VaultReadInput", "VaultReadOutput",
+        "VaultListInput", "VaultListOutput", "VaultEntry",
+    ),
+    "morning": ("MorningBundleInput", "MorningBundleOutput"),
+}
+
+# Exported name -> submodule that defines it
+_LAZY_MAP = {
+    name: module for module, names in _SUBMODULE_EXPORTS.items() for name in names
+}
+
+__all__ = list(_LAZY_MAP)
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_MAP.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value  # later lookups skip __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,7 +1,7 @@
 """Pydantic schemas for calendar tool validation."""
 
 from pydantic import BaseModel, Field, field_validator, model_validator
-from typing import List, Optional
+from typing import Any, List, Optional
 from datetime import datetime, timezone
 import datetime as dt  # Import module to avoid name clash
 import pytz
@@ -45,7 +45,17 @@ class CalendarEvent(BaseModel):
     all_day: bool = Field(default=False, description="Whether this is an all-day event")
     attendees: Optional[List[str]] = Field(default=None, description="List of attendee emails")
     calendar_source: Optional[str] = Field(default=None, description="Source calendar name (e.g., 'Work', 'Runna', 'primary')")
-    
+
+    @classmethod
+    def build_trusted(cls, **data: Any) -> "CalendarEvent":
+        """Build an event from values our own code already typed, skipping validation.
+
+        For Google API responses we have parsed ourselves. Events that crossed a
+        JSON boundary (e.g. Redis-cached dicts, whose datetimes come back as
+        strings) must go through the normal constructor instead.
+        """
+        return cls.model_construct(**data)
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -375,46 +385,29 @@ class CalendarDeleteOutput(BaseModel):
 
 class CalendarFindFreeTimeInput(BaseModel):
     """Input schema for calendar_find_free_time tool."""
-    duration_minutes: int = Field(description="Duration needed in minutes (e.g., 30, 60, 120)")
-    start_date: str = Field(description="Start date to search from (YYYY-MM-DD format)")
-    end_date: Optional[str] = Field(default=None, description="End date to search until (YYYY-MM-DD format, defaults to start_date)")
-    earliest_time: Optional[str] = Field(default="09:00", description="Earliest time to consider (HH:MM format, 24-hour)")
-    latest_time: Optional[str] = Field(default="18:00", description="Latest time to consider (HH:MM format, 24-hour)")
+    duration_minutes: int = Field(
+        gt=0,
+        le=480,  # 8 hours
+        description="Duration needed in minutes (e.g., 30, 60, 120)",
+        examples=[30, 60, 120]
+    )
+    start_date: dt.date = Field(description="Start date to search from (YYYY-MM-DD format)")
+    end_date: Optional[dt.date] = Field(
+        default=None,
+        description="End date to search until (YYYY-MM-DD format, defaults to start_date)"
+    )
+    earliest_time: dt.time = Field(
+        default=dt.time(9, 0),
+        description="Earliest time to consider (HH:MM format, 24-hour)"
+    )
+    latest_time: dt.time = Field(
+        default=dt.time(18, 0),
+        description="Latest time to consider (HH:MM format, 24-hour)"
+    )
     calendar_names: Optional[List[str]] = Field(default=None, description="Calendars to check for conflicts (defaults to all)")
     max_results: Optional[int] = Field(default=5, description="Maximum number of time slots to return")
     preferred_time: Optional[str] = Field(default=None, description="Preferred time preference: 'morning', 'afternoon', 'evening'")
 
-    @field_validator('duration_minutes')
-    @classmethod
-    def validate_duration(cls, v):
-        if v <= 0:
-            raise ValueError('duration_minutes must be positive')
-        if v > 480:  # 8 hours
-            raise ValueError('duration_minutes cannot exceed 480 (8 hours)')
-        return v
-
-    @field_validator('start_date', 'end_date')
-    @classmethod
-    def validate_date_format(cls, v):
-        if v is None:
-            return v
-        try:
-            datetime.strptime(v, '%Y-%m-%d')
-            return v
-        except ValueError:
-            raise ValueError('Date must be in YYYY-MM-DD format')
-
-    @field_validator('earliest_time', 'latest_time')
-    @classmethod
-    def validate_time_format(cls, v):
-        if v is None:
-            return v
-        try:
-            datetime.strptime(v, '%H:%M')
-            return v
-        except ValueError:
-            raise ValueError('Time must be in HH:MM format (24-hour)')
-
     class Config:
         json_schema_extra = {
             "example": {
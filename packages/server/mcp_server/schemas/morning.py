@@ -0,0 +1,45 @@
+"""Pydantic schemas for the morning bundle tool."""
+
+import datetime as dt
+from typing import Any, Dict, Optional
+
+from pydantic import BaseModel, Field
+
+from .mobility import CommuteDirection
+from .todo import TodoBucket
+
+
+class MorningBundleInput(BaseModel):
+    """Input schema for morning_get_bundle tool."""
+
+    location: str = Field(
+        description="Location for the weather forecast",
+        examples=["San Francisco, CA"]
+    )
+    date: dt.date = Field(
+        description="Date to list calendar events for (YYYY-MM-DD format)",
+        examples=["2024-01-15"]
+    )
+    todo_bucket: Optional[TodoBucket] = Field(
+        default=TodoBucket.WORK,
+        description="Todo bucket to include. If null, includes todos from all buckets."
+    )
+    commute_direction: CommuteDirection = Field(
+        default=CommuteDirection.TO_WORK,
+        description="Direction of the commute to plan"
+    )
+
+
+class MorningBundleOutput(BaseModel):
+    """Output schema for morning_get_bundle tool.
+
+    Each section holds the matching tool's output, or {"error": "..."} if
+    that tool failed, so one flaky upstream doesn't sink the whole bundle.
+    """
+
+    weather: Dict[str, Any] = Field(description="weather_get_daily output for the location")
+    calendar: Dict[str, Any] = Field(description="calendar_list_events output for the date")
+    todos: Dict[str, Any] = Field(description="todo_list output for the bucket")
+    commute: Dict[str, Any] = Field(
+        description="mobility_get_commute_options output for the direction"
+    )
@@ -4,11 +4,16 @@ This module provides a simple MCP-like interface for the morning routine tools.
 It can be extended to use the official MCP SDK when available.
 """
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Union
 import json
 from datetime import datetime
 
-from .tools import WeatherTool, MobilityTool, CalendarTool, TodoTool, FinancialTool, WeekendTools, VaultTool
+from pydantic import BaseModel
+
+from .tools import (
+    WeatherTool, MobilityTool, CalendarTool, TodoTool, FinancialTool, WeekendTools, VaultTool,
+    MorningTool,
+)
 from .schemas import (
     WeatherInput, WeatherOutput,
     MobilityInput, MobilityOutput, CommuteInput, CommuteOutput,
@@ -26,6 +31,7 @@ from .schemas import (
     VaultSearchInput, VaultSearchOutput,
     VaultReadInput, VaultReadOutput,
     VaultListInput, VaultListOutput,
+    MorningBundleInput, MorningBundleOutput,
 )
 from .utils.logging import get_logger
 
@@ -42,160 +48,181 @@ class MCPServer:
     
     def __init__(self):
         """Initialize the MCP server with available tools."""
+        # One instance per tool class, shared by all of its entries (and by
+        # the morning bundle), so each upstream gets a single client
+        weather_tool = WeatherTool()
+        mobility_tool = MobilityTool()
+        calendar_tool = CalendarTool()
+        todo_tool = TodoTool()
+        financial_tool = FinancialTool()
+        weekend_tools = WeekendTools()
+        vault_tool = VaultTool()
+        morning_tool = MorningTool(weather_tool, calendar_tool, todo_tool, mobility_tool)
+
         self.tools = {
             "weather_get_daily": {
-                "tool": WeatherTool(),
+                "tool": weather_tool,
                 "input_schema": WeatherInput,
                 "output_schema": WeatherOutput,
                 "description": "Get daily weather forecast for a location",
                 "method": "get_daily"
             },
             "mobility_get_commute": {
-                "tool": MobilityTool(),
+                "tool": mobility_tool,
                 "input_schema": MobilityInput,
                 "output_schema": MobilityOutput,
                 "description": "Get commute information between two locations",
                 "method": "get_commute"
             },
             "mobility_get_commute_options": {
-                "tool": MobilityTool(),
+                "tool": mobility_tool,
                 "input_schema": CommuteInput,
                 "output_schema": CommuteOutput,
                 "description": "Get comprehensive commute options with driving and transit (Caltrain + shuttle) for morning/evening commutes",
                 "method": "get_commute_options"
             },
             "mobility_get_shuttle_schedule": {
-                "tool": MobilityTool(),
+                "tool": mobility_tool,
                 "input_schema": ShuttleScheduleInput,
                 "output_schema": ShuttleScheduleOutput,
                 "description": "Get MV Connector shuttle schedule between Mountain View Caltrain, LinkedIn Transit Center, and LinkedIn 950|1000",
                 "method": "get_shuttle_schedule"
             },
             "calendar_list_events": {
-                "tool": CalendarTool(),
+                "tool": calendar_tool,
                 "input_schema": CalendarInput,
                 "output_schema": CalendarOutput,
                 "description": "List calendar events for a specific date",
                 "method": "list_events"
             },
             "calendar_list_events_range": {
-                "tool": CalendarTool(),
+                "tool": calendar_tool,
                 "input_schema": CalendarRangeInput,
                 "output_schema": CalendarRangeOutput,
                 "description": "List calendar events for a date range (more efficient than multiple single-date calls)",
                 "method": "list_events_range"
             },
             "calendar_create_event": {
-                "tool": CalendarTool(),
+                "tool": calendar_tool,
                 "input_schema": CalendarCreateInput,
                 "output_schema": CalendarCreateOutput,
                 "description": "Create a new calendar event with conflict detection and smart scheduling",
                 "method": "create_event"
             },
             "calendar_update_event": {
-                "tool": CalendarTool(),
+                "tool": calendar_tool,
                 "input_schema": CalendarUpdateInput,
                 "output_schema": CalendarUpdateOutput,
                 "description": "Update an existing calendar event with conflict detection",
                 "method": "update_event"
             },
             "calendar_delete_event": {
-                "tool": CalendarTool(),
+                "tool": calendar_tool,
                 "input_schema": CalendarDeleteInput,
                 "output_schema": CalendarDeleteOutput,
                 "description": "Delete a calendar event",
                 "method": "delete_event"
             },
             "calendar_find_free_time": {
-                "tool": CalendarTool(),
+                "tool": calendar_tool,
                 "input_schema": CalendarFindFreeTimeInput,
                 "output_schema": CalendarFindFreeTimeOutput,
                 "description": "Find available time slots based on duration and constraints for smart scheduling",
                 "method": "find_free_time"
             },
             "todo_list": {
-                "tool": TodoTool(),
+                "tool": todo_tool,
                 "input_schema": TodoInput,
                 "output_schema": TodoOutput,
                 "description": "List todo items from a specific bucket",
                 "method": "list_todos"
             },
             "todo_create": {
-                "tool": TodoTool(),
+                "tool": todo_tool,
                 "input_schema": TodoCreateInput,
                 "output_schema": TodoCreateOutput,
                 "description": "Create a new todo item with smart categorization and natural language due dates",
                 "method": "create_todo"
             },
             "todo_update": {
-                "tool": TodoTool(),
+                "tool": todo_tool,
                 "input_schema": TodoUpdateInput,
                 "output_schema": TodoUpdateOutput,
                 "description": "Update an existing todo item (title, priority, due date, tags)",
                 "method": "update_todo"
             },
             "todo_complete": {
-                "tool": TodoTool(),
+                "tool": todo_tool,
                 "input_schema": TodoCompleteInput,
                 "output_schema": TodoCompleteOutput,
                 "description": "Mark a todo item as completed or uncompleted",
                 "method": "complete_todo"
             },
             "todo_delete": {
-                "tool": TodoTool(),
+                "tool": todo_tool,
                 "input_schema": TodoDeleteInput,
                 "output_schema": TodoDeleteOutput,
                 "description": "Delete a todo item permanently",
                 "method": "delete_todo"
             },
             "financial_get_data": {
-                "tool": FinancialTool(),
+                "tool": financial_tool,
                 "input_schema": FinancialInput,
                 "output_schema": FinancialOutput,
                 "description": "Get financial data for stocks and cryptocurrencies",
                 "method": "get_financial_data"
             },
             "weekend_get_trails": {
-                "tool": WeekendTools(),
+                "tool": weekend_tools,
                 "input_schema": TrailSearchInput,
                 "output_schema": TrailSearchOutput,
                 "description": "Scout outdoor trails near a location, filtered by activity type and difficulty",
                 "method": "get_trails"
             },
             "weekend_get_concerts": {
-                "tool": WeekendTools(),
+                "tool": weekend_tools,
                 "input_schema": ConcertSearchInput,
                 "output_schema": ConcertSearchOutput,
                 "description": "Find upcoming concerts and live music events for tracked artists or by location",
                 "method": "get_concerts"
             },
             "weekend_generate_itinerary": {
-                "tool": WeekendTools(),
+                "tool": weekend_tools,
                 "input_schema": ItineraryInput,
                 "output_schema": ItineraryOutput,
                 "description": "Generate a structured multi-day itinerary with points of interest and transit estimates",
                 "method": "generate_itinerary"
             },
             "vault_search": {
-                "tool": VaultTool(),
+                "tool": vault_tool,
                 "input_schema": VaultSearchInput,
                 "output_schema": VaultSearchOutput,
                 "description": "Search Kevin's personal markdown vault (projects, career, meetings, decisions) by keyword or regex; returns ranked snippets with file paths and line numbers",
                 "method": "search"
             },
             "vault_read": {
-                "tool": VaultTool(),
+                "tool": vault_tool,
                 "input_schema": VaultReadInput,
                 "output_schema": VaultReadOutput,
                 "description": "Read a single markdown file from Kevin's personal vault by vault-relative path (use vault_search first to discover paths)",
                 "method": "read"
             },
             "vault_list": {
-                "tool": VaultTool(),
+                "tool": vault_tool,
                 "input_schema": VaultListInput,
                 "output_schema": VaultListOutput,
                 "description": "List immediate children of a folder in Kevin's vault (one level deep) — use to explore vault structure (e.g., list Projects/ to find a project note)",
                 "method": "list"
+            },
+            "morning_get_bundle": {
+                "tool": morning_tool,
+                "input_schema": MorningBundleInput,
+                "output_schema": MorningBundleOutput,
+                "description": (
+                    "Get weather, calendar events, todos and commute options for a morning "
+                    "briefing in one call"
+                ),
+                "method": "get_bundle"
             }
         }
     
@@ -225,13 +252,16 @@ class MCPServer:
             }
         }
     
-    async def call_tool(self, tool_name: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+    async def call_tool(
+        self, tool_name: str, input_data: Union[Dict[str, Any], BaseModel]
+    ) -> Dict[str, Any]:
         """
         Call a specific tool with input data.
         
         Args:
             tool_name: Name of the tool to call
-            input_data: Input parameters for the tool
+            input_data: Input parameters for the tool, or an already-validated
+                instance of its input schema
             
         Returns:
             Tool output data
@@ -246,8 +276,14 @@ class MCPServer:
         tool_info = self.tools[tool_name]
         
         try:
-            # Validate input data
-            validated_input = tool_info["input_schema"](**input_data)
+            # Validate input data. REST endpoints pass the model FastAPI has
+            # already validated; only raw dicts (MCP protocol) need it here.
+            # model_validate hands the dict straight to the schema's compiled
+            # validator, without unpacking it into keyword arguments first.
+            if isinstance(input_data, tool_info["input_schema"]):
+                validated_input = input_data
+            else:
+                validated_input = tool_info["input_schema"].model_validate(input_data)
             
             # Get the tool instance and method
             tool_instance = tool_info["tool"]
@@ -310,7 +346,10 @@ class MCPServer:
                 "sampling": False    # Not implemented yet
             },
             "tool_count": len(self.tools),
-            "supported_tool_types": ["weather", "mobility", "calendar", "todo", "financial", "weekend", "vault"],
+            "supported_tool_types": [
+                "weather", "mobility", "calendar", "todo", "financial", "weekend", "vault",
+                "morning",
+            ],
             "created_at": datetime.now().isoformat()
         }
 
@@ -7,6 +7,7 @@ from .todo import TodoTool
 from .financial import FinancialTool
 from .weekend import WeekendTools
 from .vault import VaultTool
+from .morning import MorningTool
 
 __all__ = [
     "WeatherTool",
@@ -16,4 +17,5 @@ __all__ = [
     "FinancialTool",
     "WeekendTools",
     "VaultTool",
+    "MorningTool",
 ]
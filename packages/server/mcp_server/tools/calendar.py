@@ -94,7 +94,8 @@ class CalendarTool:
             # For now, use mock data. In production, this would integrate with Google Calendar API
             events = await self._get_events_for_date(input_data.date)
             
-            result = CalendarOutput(
+            # Events are already CalendarEvent instances; skip re-validating them
+            result = CalendarOutput.model_construct(
                 date=input_data.date,
                 events=events,
                 total_events=len(events)
@@ -144,7 +145,8 @@ class CalendarTool:
             # Use the new range method from Google Calendar client
             events = await self._get_events_for_range(input_data.start_date, input_data.end_date)
             
-            result = CalendarRangeOutput(
+            # Events are already CalendarEvent instances; skip re-validating them
+            result = CalendarRangeOutput.model_construct(
                 start_date=input_data.start_date,
                 end_date=input_data.end_date,
                 events=events,
@@ -785,13 +787,11 @@ class CalendarTool:
             CalendarFindFreeTimeOutput with available time slots
         """
         try:
-            # Parse dates
-            start_date = datetime.strptime(input_data.start_date, '%Y-%m-%d').date()
-            end_date = start_date if not input_data.end_date else datetime.strptime(input_data.end_date, '%Y-%m-%d').date()
-            
-            # Parse time constraints
-            earliest_time = datetime.strptime(input_data.earliest_time, '%H:%M').time()
-            latest_time = datetime.strptime(input_data.latest_time, '%H:%M').time()
+            # Dates and times arrive already parsed by the input schema
+            start_date = input_data.start_date
+            end_date = input_data.end_date or start_date
+            earliest_time = input_data.earliest_time
+            latest_time = input_data.latest_time
             
             # Get all events in the date range
             all_events = []
@@ -827,7 +827,7 @@ class CalendarTool:
             search_criteria = {
                 "duration": f"{input_data.duration_minutes} minutes",
                 "date_range": f"{input_data.start_date}" + (f" to {input_data.end_date}" if input_data.end_date else ""),
-                "time_window": f"{input_data.earliest_time} to {input_data.latest_time}",
+                "time_window": f"{earliest_time:%H:%M} to {latest_time:%H:%M}",
                 "calendars": input_data.calendar_names or "all",
                 "preference": input_data.preferred_time or "none"
             }
@@ -1118,7 +1118,7 @@ class CalendarTool:
                 if email:
                     attendees.append(email)
             
-            return CalendarEvent(
+            return CalendarEvent.build_trusted(
                 id=event_id,
                 title=title,
                 start_time=start_time,
@@ -0,0 +1,83 @@
+"""Morning bundle tool that fuses the morning routine calls into one."""
+
+import asyncio
+from typing import Any, Dict, cast
+
+from pydantic import BaseModel
+
+from ..schemas.morning import MorningBundleInput, MorningBundleOutput
+from ..schemas.weather import WeatherInput
+from ..schemas.calendar import CalendarInput
+from ..schemas.todo import TodoInput
+from ..schemas.mobility import CommuteInput
+from .weather import WeatherTool
+from .calendar import CalendarTool
+from .todo import TodoTool
+from .mobility import MobilityTool
+from ..utils.logging import get_logger, log_tool_call
+
+logger = get_logger("morning_tool")
+
+
+class MorningTool:
+    """Tool that gathers weather, calendar, todos and commute in one call.
+
+    Agents building a morning briefing otherwise make four round-trips;
+    this runs the same tools concurrently on the server and returns them
+    as one envelope.
+    """
+
+    def __init__(
+        self,
+        weather_tool: WeatherTool,
+        calendar_tool: CalendarTool,
+        todo_tool: TodoTool,
+        mobility_tool: MobilityTool,
+    ):
+        # The instances MCPServer registers, so the bundle shares their
+        # upstream clients (Google Calendar OAuth, Todoist, ...) instead of
+        # setting up its own
+        self.weather_tool = weather_tool
+        self.calendar_tool = calendar_tool
+        self.todo_tool = todo_tool
+        self.mobility_tool = mobility_tool
+
+    async def get_bundle(self, input_data: MorningBundleInput) -> MorningBundleOutput:
+        """
+        Get all morning routine data in a single call.
+
+        Args:
+            input_data: MorningBundleInput with location, date, todo bucket and commute direction
+
+        Returns:
+            MorningBundleOutput with one section per underlying tool
+        """
+        start_time = asyncio.get_event_loop().time()
+
+        calls = {
+            "weather": self.weather_tool.get_daily(WeatherInput(location=input_data.location)),
+            "calendar": self.calendar_tool.list_events(CalendarInput(date=input_data.date)),
+            "todos": self.todo_tool.list_todos(TodoInput(bucket=input_data.todo_bucket)),
+            "commute": self.mobility_tool.get_commute_options(
+                CommuteInput(direction=input_data.commute_direction)
+            ),
+        }
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        sections = {
+            name: self._section(name, result) for name, result in zip(calls, results)
+        }
+
+        duration_ms = (asyncio.get_event_loop().time() - start_time) * 1000
+        log_tool_call("morning_get_bundle", input_data.model_dump(mode="json"), duration_ms)
+
+        return MorningBundleOutput(**sections)
+
+    @staticmethod
+    def _section(name: str, result: Any) -> Dict[str, Any]:
+        """Convert one tool result (or its exception) into a bundle section."""
+        if isinstance(result, Exception):
+            logger.warning(f"Morning bundle {name} section failed: {result}")
+            return {"error": str(result)}
+        if isinstance(result, BaseModel):
+            return result.model_dump()
+        return cast(Dict[str, Any], result)
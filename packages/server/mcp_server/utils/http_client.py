@@ -1,5 +1,6 @@
 """HTTP client utilities for external API calls."""
 
+import asyncio
 import httpx
 import time
 from typing import Dict, Any, Optional
@@ -7,21 +8,54 @@ from .logging import get_logger, log_api_call
 
 logger = get_logger("http_client")
 
+# One pooled client for every outbound call, so repeat calls to the same API
+# reuse kept-alive connections instead of paying TCP + TLS setup each time.
+# Pooled connections belong to the loop that opened them; a new loop gets a
+# new client.
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+
+_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=100)
+
+
+def get_shared_client() -> httpx.AsyncClient:
+    """Get the process-wide pooled httpx client for the running loop."""
+    global _shared_client, _shared_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_client is None or _shared_client.is_closed or _shared_loop is not loop:
+        _shared_client = httpx.AsyncClient(limits=_POOL_LIMITS, timeout=10.0)
+        _shared_loop = loop
+    return _shared_client
+
+
+async def close_shared_client() -> None:
+    """Close the pooled client (call on application shutdown)."""
+    global _shared_client, _shared_loop
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+    _shared_client = None
+    _shared_loop = None
+
 
 class HTTPClient:
-    """Async HTTP client with logging and error handling."""
+    """Async HTTP client with logging and error handling.
+
+    Requests go through the shared connection pool; entering and leaving the
+    context is free and never closes the pool.
+    """
     
     def __init__(self, timeout: float = 10.0):
         self.timeout = timeout
         self._client = None
     
     async def __aenter__(self):
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = get_shared_client()
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        if self._client:
-            await self._client.aclose()
+        self._client = None
     
     async def get(
         self, 
@@ -53,7 +87,7 @@ class HTTPClient:
         
         try:
             logger.debug(f"Making {method} request to {url}")
-            response = await self._client.request(method, url, **kwargs)
+            response = await self._client.request(method, url, timeout=self.timeout, **kwargs)
             
             # Calculate duration
             duration_ms = (time.time() - start_time) * 1000
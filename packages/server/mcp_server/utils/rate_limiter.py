@@ -2,7 +2,7 @@
 
 import asyncio
 import time
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Dict, Optional
 from collections import deque
 from .logging import get_logger
@@ -10,7 +10,7 @@ from .logging import get_logger
 logger = get_logger("rate_limiter")
 
 
-@dataclass
+@dataclass(slots=True)
 class RateLimitConfig:
     """Configuration for a rate limiter."""
     requests_per_minute: int = 60
@@ -18,19 +18,12 @@ class RateLimitConfig:
     burst_limit: int = 10  # Max requests in a short burst
 
 
-@dataclass
-class RateLimitState:
-    """State tracking for rate limiting."""
-    minute_requests: deque = field(default_factory=deque)
-    day_requests: deque = field(default_factory=deque)
-    last_request_time: float = 0.0
-
-
 class RateLimiter:
     """
     Token bucket rate limiter for API calls.
 
-    Tracks requests per minute and per day for each API.
+    Tracks requests per minute (sliding window) and per day (fixed window
+    opened by the first request, like most providers' daily quotas) for each API.
 
     Usage:
         limiter = RateLimiter("google_maps", requests_per_minute=60)
@@ -41,6 +34,12 @@ class RateLimiter:
             # Rate limited
     """
 
+    __slots__ = (
+        'name', 'config', '_requests_per_minute', '_requests_per_day', '_burst_limit',
+        '_minute_requests', '_day_count', '_day_window_start',
+        '_last_request_time', '_cv', '_wakeup'
+    )
+
     _instances: Dict[str, 'RateLimiter'] = {}
 
     def __init__(
@@ -56,8 +55,20 @@ class RateLimiter:
             requests_per_day=requests_per_day,
             burst_limit=burst_limit
         )
-        self.state = RateLimitState()
-        self._lock = asyncio.Lock()
+        # Limits are fixed for the limiter's lifetime; bind them directly so
+        # the acquire path reads one attribute instead of going through config
+        self._requests_per_minute = requests_per_minute
+        self._requests_per_day = requests_per_day
+        self._burst_limit = burst_limit
+        # Request timestamps within the sliding minute window
+        self._minute_requests: deque = deque()
+        # Request count within the fixed day window opened by its first request
+        self._day_count = 0
+        self._day_window_start = 0.0
+        self._last_request_time = 0.0
+        # Guards the request windows; waiters sleep on it until a slot opens
+        self._cv = asyncio.Condition()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
 
         # Register this instance
         RateLimiter._instances[name] = self
@@ -80,32 +91,31 @@ class RateLimiter:
         self._cleanup_old_requests()
         return {
             "name": self.name,
-            "requests_last_minute": len(self.state.minute_requests),
-            "requests_today": len(self.state.day_requests),
+            "requests_last_minute": len(self._minute_requests),
+            "requests_today": self._day_count,
             "config": {
                 "requests_per_minute": self.config.requests_per_minute,
                 "requests_per_day": self.config.requests_per_day,
                 "burst_limit": self.config.burst_limit
             },
             "remaining": {
-                "minute": max(0, self.config.requests_per_minute - len(self.state.minute_requests)),
-                "day": max(0, self.config.requests_per_day - len(self.state.day_requests))
+                "minute": max(0, self.config.requests_per_minute - len(self._minute_requests)),
+                "day": max(0, self.config.requests_per_day - self._day_count)
             }
         }
 
     def _cleanup_old_requests(self):
-        """Remove expired request timestamps."""
+        """Remove expired request timestamps and roll over the day window."""
         current_time = time.time()
         minute_ago = current_time - 60
-        day_ago = current_time - 86400
 
         # Clean minute window
-        while self.state.minute_requests and self.state.minute_requests[0] < minute_ago:
-            self.state.minute_requests.popleft()
+        while self._minute_requests and self._minute_requests[0] < minute_ago:
+            self._minute_requests.popleft()
 
-        # Clean day window
-        while self.state.day_requests and self.state.day_requests[0] < day_ago:
-            self.state.day_requests.popleft()
+        # Reset the day window once it has elapsed
+        if self._day_count and current_time - self._day_window_start >= 86400:
+            self._day_count = 0
 
     async def acquire(self) -> bool:
         """
@@ -113,72 +123,119 @@ class RateLimiter:
 
         Returns True if request is allowed, False if rate limited.
         """
-        async with self._lock:
-            self._cleanup_old_requests()
-            current_time = time.time()
-
-            # Check minute limit
-            if len(self.state.minute_requests) >= self.config.requests_per_minute:
-                logger.warning(
-                    f"Rate limiter '{self.name}': minute limit exceeded "
-                    f"({len(self.state.minute_requests)}/{self.config.requests_per_minute})"
-                )
-                return False
+        async with self._cv:
+            return await self._try_acquire()
 
-            # Check day limit
-            if len(self.state.day_requests) >= self.config.requests_per_day:
-                logger.warning(
-                    f"Rate limiter '{self.name}': daily limit exceeded "
-                    f"({len(self.state.day_requests)}/{self.config.requests_per_day})"
-                )
-                return False
+    async def _try_acquire(self) -> bool:
+        """Check the limits and record a request. Caller must hold the condition."""
+        self._cleanup_old_requests()
+        current_time = time.time()
 
-            # Check burst limit (requests in last second)
-            recent_requests = sum(
-                1 for t in self.state.minute_requests
-                if current_time - t < 1.0
+        # Check minute limit
+        if len(self._minute_requests) >= self._requests_per_minute:
+            logger.warning(
+                f"Rate limiter '{self.name}': minute limit exceeded "
+                f"({len(self._minute_requests)}/{self._requests_per_minute})"
             )
-            if recent_requests >= self.config.burst_limit:
-                logger.debug(
-                    f"Rate limiter '{self.name}': burst limit hit, adding small delay"
-                )
-                await asyncio.sleep(0.1)  # Small delay for burst protection
+            return False
 
-            # Record request
-            self.state.minute_requests.append(current_time)
-            self.state.day_requests.append(current_time)
-            self.state.last_request_time = current_time
+        # Check day limit
+        if self._day_count >= self._requests_per_day:
+            logger.warning(
+                f"Rate limiter '{self.name}': daily limit exceeded "
+                f"({self._day_count}/{self._requests_per_day})"
+            )
+            return False
 
-            return True
+        # Check burst limit (requests in last second)
+        recent_requests = sum(
+            1 for t in self._minute_requests
+            if current_time - t < 1.0
+        )
+        if recent_requests >= self._burst_limit:
+            logger.debug(
+                f"Rate limiter '{self.name}': burst limit hit, adding small delay"
+            )
+            await asyncio.sleep(0.1)  # Small delay for burst protection
+
+        # Record request
+        self._minute_requests.append(current_time)
+        if not self._day_count:
+            self._day_window_start = current_time
+        self._day_count += 1
+        self._last_request_time = current_time
+
+        return True
 
     async def wait_and_acquire(self, max_wait: float = 60.0) -> bool:
         """
         Wait for rate limit to clear, then acquire.
 
+        Waiters sleep on a condition instead of polling; a timer wakes one
+        waiter when the oldest request is due to leave its window, and each
+        successful waiter hands the wakeup on to the next.
+
         Returns True if acquired within max_wait, False if timed out.
         """
-        start_time = time.time()
+        try:
+            return await asyncio.wait_for(self._wait_for_slot(), timeout=max_wait)
+        except asyncio.TimeoutError:
+            return False
+
+    async def _wait_for_slot(self) -> bool:
+        """Block until a request can be recorded."""
+        async with self._cv:
+            try:
+                while not await self._try_acquire():
+                    self._schedule_wakeup()
+                    await self._cv.wait()
+            except asyncio.CancelledError:
+                # Don't swallow a wakeup meant for the remaining waiters
+                self._cv.notify(1)
+                raise
+            self._cv.notify(1)
+            return True
+
+    def _schedule_wakeup(self) -> None:
+        """Arm a timer for when the next slot opens, unless one is pending."""
+        loop = asyncio.get_running_loop()
+        # An overdue handle belongs to a loop that has gone away; replace it
+        if self._wakeup is not None and self._wakeup.when() > loop.time():
+            return
+        self._wakeup = loop.call_later(
+            self._next_slot_delay(), self._on_wakeup
+        )
 
-        while time.time() - start_time < max_wait:
-            if await self.acquire():
-                return True
-            await asyncio.sleep(1.0)
+    def _next_slot_delay(self) -> float:
+        """Seconds until the blocking minute or day window frees a slot."""
+        delay = self.get_wait_time()
+        if self._day_count >= self._requests_per_day:
+            delay = max(delay, 86400 - (time.time() - self._day_window_start))
+        # Never spin if the estimate is already due
+        return max(delay, 0.05)
 
-        return False
+    def _on_wakeup(self) -> None:
+        self._wakeup = None
+        asyncio.ensure_future(self._notify_one())
+
+    async def _notify_one(self) -> None:
+        async with self._cv:
+            self._cv.notify(1)
 
     def get_wait_time(self) -> float:
-        """Get estimated wait time until next request is allowed."""
-        self._cleanup_old_requests()
+        """
+        Get estimated wait time until next request is allowed.
 
-        if len(self.state.minute_requests) < self.config.requests_per_minute:
+        Skips the cleanup pass: timestamps are appended in order, so the
+        oldest entry alone decides the wait. Expired entries can only make
+        the window look fuller, and if one is still at the head it yields a
+        wait of 0.0, which is exactly what acquire() would see after cleanup.
+        """
+        minute_requests = self._minute_requests
+        if not minute_requests or len(minute_requests) < self._requests_per_minute:
             return 0.0
 
-        if self.state.minute_requests:
-            oldest_in_minute = self.state.minute_requests[0]
-            wait_time = 60 - (time.time() - oldest_in_minute)
-            return max(0.0, wait_time)
-
-        return 0.0
+        return max(0.0, 60 - (time.time() - minute_requests[0]))
 
 
 def rate_limited(limiter: RateLimiter):
@@ -1,12 +1,35 @@
 """MV Connector shuttle schedule data extracted from official timetables."""
 
-from typing import Dict, List, Tuple
-from datetime import time, datetime, timedelta
+from typing import Dict, List, Optional, Sequence, Tuple
+from datetime import date, time, datetime, timedelta
 import re
 
 # MV Connector Schedule Data (as of 08/07/2025)
 # Source: Official MV Connector timetables
 
+
+def _parse_hhmm_ampm(time_str: str) -> Tuple[int, int]:
+    """Parse a 12-hour time string like '8:15 AM' into (hour, minute) on a 24-hour clock."""
+    clock, meridiem = time_str.rsplit(" ", 1)
+    hour_str, minute_str = clock.split(":")
+    hour, minute = int(hour_str), int(minute_str)
+    if not (1 <= hour <= 12 and 0 <= minute <= 59) or meridiem not in ("AM", "PM"):
+        raise ValueError(f"Invalid time format: {time_str}")
+    if meridiem == "PM" and hour != 12:
+        hour += 12
+    elif meridiem == "AM" and hour == 12:
+        hour = 0
+    return hour, minute
+
+
+def _build_time_table(schedule: Sequence[Tuple[str, ...]]) -> Tuple[Tuple[time, ...], ...]:
+    """Pre-parse every stop time in a schedule so searches never parse strings."""
+    return tuple(
+        tuple(time(*_parse_hhmm_ampm(stop_time)) for stop_time in departure)
+        for departure in schedule
+    )
+
+
 class MVConnectorSchedule:
     """Mountain View Connector shuttle schedule with all stops and timing data."""
     
@@ -49,8 +72,35 @@ class MVConnectorSchedule:
     
     # Stop definitions
     STOPS = {
-        "inbound": ["Mountain View Caltrain", "LinkedIn Transit Center", "LinkedIn 950|1000"],
-        "outbound": ["LinkedIn 950|1000", "LinkedIn Transit Center", "Mountain View Caltrain"]
+        "inbound": ("Mountain View Caltrain", "LinkedIn Transit Center", "LinkedIn 950|1000"),
+        "outbound": ("LinkedIn 950|1000", "LinkedIn Transit Center", "Mountain View Caltrain")
+    }
+    
+    # Parsed stop times, row-aligned with the schedules above
+    _INBOUND_TIMES = _build_time_table(INBOUND_SCHEDULE)
+    _OUTBOUND_TIMES = _build_time_table(OUTBOUND_SCHEDULE)
+    
+    # Route dispatch table: (origin, destination) -> (schedule, times, stops, origin_idx, dest_idx)
+    # Trips between the two LinkedIn stops ride the inbound/outbound shuttle partway.
+    _ROUTES: Dict[Tuple[str, str], Tuple[list, tuple, Tuple[str, ...], int, int]] = {
+        ("Mountain View Caltrain", "LinkedIn Transit Center"): (
+            INBOUND_SCHEDULE, _INBOUND_TIMES, STOPS["inbound"], 0, 1
+        ),
+        ("Mountain View Caltrain", "LinkedIn 950|1000"): (
+            INBOUND_SCHEDULE, _INBOUND_TIMES, STOPS["inbound"], 0, 2
+        ),
+        ("LinkedIn Transit Center", "LinkedIn 950|1000"): (
+            INBOUND_SCHEDULE, _INBOUND_TIMES, STOPS["inbound"], 1, 2
+        ),
+        ("LinkedIn 950|1000", "Mountain View Caltrain"): (
+            OUTBOUND_SCHEDULE, _OUTBOUND_TIMES, STOPS["outbound"], 0, 2
+        ),
+        ("LinkedIn Transit Center", "Mountain View Caltrain"): (
+            OUTBOUND_SCHEDULE, _OUTBOUND_TIMES, STOPS["outbound"], 1, 2
+        ),
+        ("LinkedIn 950|1000", "LinkedIn Transit Center"): (
+            OUTBOUND_SCHEDULE, _OUTBOUND_TIMES, STOPS["outbound"], 0, 1
+        ),
     }
     
     # Travel time matrix (in minutes)
@@ -64,14 +114,15 @@ class MVConnectorSchedule:
     }
     
     @staticmethod
-    def parse_time(time_str: str) -> datetime:
-        """Parse time string like '8:15 AM' to datetime object (today)."""
+    def parse_time(time_str: str, today: Optional[date] = None) -> datetime:
+        """Parse time string like '8:15 AM' to datetime object on `today` (default: now)."""
         try:
-            time_obj = datetime.strptime(time_str, "%I:%M %p")
-            today = datetime.now().date()
-            return datetime.combine(today, time_obj.time())
-        except ValueError:
+            hour, minute = _parse_hhmm_ampm(time_str)
+        except (AttributeError, ValueError):
             raise ValueError(f"Invalid time format: {time_str}")
+        if today is None:
+            today = datetime.now().date()
+        return datetime.combine(today, time(hour, minute))
     
     @classmethod
     def get_next_shuttles(
@@ -91,7 +142,8 @@ class MVConnectorSchedule:
             limit: Max number of departures to return
             
         Returns:
-            List of departure info with times and stops
+            List of departure info with times and stops. "all_stops" and
+            "stop_names" are the shared schedule tuples, not copies.
         """
         if after_time is None:
             after_time = datetime.now()
@@ -100,49 +152,32 @@ class MVConnectorSchedule:
         if after_time.weekday() >= 5:  # Saturday = 5, Sunday = 6
             return []  # No service on weekends
             
-        # Determine direction and schedule
-        if origin == "Mountain View Caltrain" and destination in ["LinkedIn Transit Center", "LinkedIn 950|1000"]:
-            schedule = cls.INBOUND_SCHEDULE
-            stops = cls.STOPS["inbound"]
-        elif origin in ["LinkedIn 950|1000", "LinkedIn Transit Center"] and destination == "Mountain View Caltrain":
-            schedule = cls.OUTBOUND_SCHEDULE  
-            stops = cls.STOPS["outbound"]
-        elif origin == "LinkedIn Transit Center" and destination == "LinkedIn 950|1000":
-            # Use inbound schedule but start from transit center
-            schedule = cls.INBOUND_SCHEDULE
-            stops = cls.STOPS["inbound"]
-        elif origin == "LinkedIn 950|1000" and destination == "LinkedIn Transit Center":
-            # Use outbound schedule but end at transit center  
-            schedule = cls.OUTBOUND_SCHEDULE
-            stops = cls.STOPS["outbound"]
-        else:
-            return []
-        
-        # Find origin and destination indices
-        try:
-            origin_idx = stops.index(origin)
-            dest_idx = stops.index(destination)
-        except ValueError:
+        # Determine direction, schedule and stop indices
+        route = cls._ROUTES.get((origin, destination))
+        if route is None:
             return []
+        schedule, times, stops, origin_idx, dest_idx = route
         
         # Get departures after specified time
+        today = after_time.date()
         next_departures = []
-        for departure in schedule:
-            departure_time = cls.parse_time(departure[origin_idx])
+        for departure, stop_times in zip(schedule, times):
+            scheduled_departure = datetime.combine(today, stop_times[origin_idx])
+            departure_time = scheduled_departure
             
             # Handle next day if departure time is earlier than current time
             if departure_time < after_time:
                 departure_time += timedelta(days=1)
             
             if departure_time >= after_time:
-                arrival_time = cls.parse_time(departure[dest_idx])
-                if arrival_time < cls.parse_time(departure[origin_idx]):
+                arrival_time = datetime.combine(today, stop_times[dest_idx])
+                if arrival_time < scheduled_departure:
                     arrival_time += timedelta(days=1)
                     
                 next_departures.append({
                     "departure_time": departure[origin_idx],
                     "arrival_time": departure[dest_idx],
-                    "all_stops": list(departure),
+                    "all_stops": departure,
                     "stop_names": stops,
                     "departure_datetime": departure_time,
                     "arrival_datetime": arrival_time
@@ -186,10 +221,10 @@ class MVConnectorSchedule:
         current_time = check_time.time()
         
         # Service hours
-        inbound_start = datetime.strptime("6:50 AM", "%I:%M %p").time()
-        inbound_end = datetime.strptime("11:09 AM", "%I:%M %p").time()
-        outbound_start = datetime.strptime("3:16 PM", "%I:%M %p").time()
-        outbound_end = datetime.strptime("6:55 PM", "%I:%M %p").time()
+        inbound_start = time(*_parse_hhmm_ampm("6:50 AM"))
+        inbound_end = time(*_parse_hhmm_ampm("11:09 AM"))
+        outbound_start = time(*_parse_hhmm_ampm("3:16 PM"))
+        outbound_end = time(*_parse_hhmm_ampm("6:55 PM"))
         
         return {
             "inbound": inbound_start <= current_time <= inbound_end,
@@ -0,0 +1,53 @@
+"""Tests for the MCP SDK protocol handlers."""
+
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, patch
+
+import orjson
+
+from mcp_server.mcp_protocol import handle_call_tool, handle_list_tools
+from mcp_server.server import get_mcp_server
+
+
+class TestListTools:
+    """Test the tools/list handler."""
+
+    @pytest.mark.asyncio
+    async def test_lists_every_registered_tool(self):
+        """Test that every registry entry is exposed with its input schema."""
+        tools = await handle_list_tools()
+
+        assert [tool.name for tool in tools] == list(get_mcp_server().tools)
+        weather = next(tool for tool in tools if tool.name == "weather_get_daily")
+        assert "location" in weather.inputSchema["properties"]
+
+    @pytest.mark.asyncio
+    async def test_schemas_built_once(self):
+        """Test that repeated calls reuse the list built at import."""
+        assert await handle_list_tools() is await handle_list_tools()
+
+
+class TestCallTool:
+    """Test the tools/call handler."""
+
+    @pytest.mark.asyncio
+    async def test_result_serialized_compactly(self):
+        """Test that results are compact JSON with ISO datetimes."""
+        result = {"events": [{"start": datetime(2024, 1, 15, 9, 30)}], "total_events": 1}
+
+        with patch.object(get_mcp_server(), "call_tool", AsyncMock(return_value=result)):
+            content = await handle_call_tool("calendar_list_events", {"date": "2024-01-15"})
+
+        assert len(content) == 1
+        assert "\n" not in content[0].text
+        assert orjson.loads(content[0].text) == {
+            "events": [{"start": "2024-01-15T09:30:00"}], "total_events": 1
+        }
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool_returns_error_text(self):
+        """Test that unknown tools come back as an error message, not an exception."""
+        content = await handle_call_tool("weather_get_hourly", {})
+
+        assert content[0].text.startswith("Error: Tool 'weather_get_hourly' not found")
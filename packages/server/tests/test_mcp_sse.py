@@ -0,0 +1,272 @@
+"""Tests for the MCP SSE transport's session handling."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+import pytest_asyncio
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from mcp_server import mcp_sse
+
+
+def _build_app():
+    app = FastAPI()
+    app.include_router(mcp_sse.router, prefix="/mcp")
+    return app
+
+
+@pytest.fixture
+def client():
+    return TestClient(_build_app())
+
+
+@pytest_asyncio.fixture
+async def async_client():
+    """Client on the test's own loop, so background dispatch tasks can be awaited."""
+    transport = httpx.ASGITransport(app=_build_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+
+
+async def _finish_dispatch():
+    """Wait for the background tasks handling posted messages."""
+    await asyncio.gather(*mcp_sse._dispatch_tasks)
+
+
+@pytest.fixture
+def fake_redis():
+    """Redis client stub whose pipeline records the queued commands."""
+    redis = MagicMock()
+    redis.set = AsyncMock()
+    redis.exists = AsyncMock(return_value=1)
+    redis.expire = AsyncMock()
+    pipe = MagicMock()
+    pipe.execute = AsyncMock()
+    redis.pipeline.return_value.__aenter__ = AsyncMock(return_value=pipe)
+    redis.pipeline.return_value.__aexit__ = AsyncMock(return_value=False)
+    redis.pipe = pipe
+    return redis
+
+
+class TestLocalSessions:
+    """Sessions without Redis stay worker-local."""
+
+    @pytest.mark.asyncio
+    async def test_create_and_remove(self):
+        with patch.object(mcp_sse, "_get_redis", return_value=None):
+            session = await mcp_sse.create_session()
+
+        assert mcp_sse.get_session(session.session_id) is session
+        assert session.relay_task is None
+
+        mcp_sse.remove_session(session.session_id)
+        assert mcp_sse.get_session(session.session_id) is None
+        assert session.connected is False
+
+        # A second remove (e.g. from the generator's finally) is a no-op
+        mcp_sse.remove_session(session.session_id)
+
+    def test_unknown_session_rejected(self, client):
+        with patch.object(mcp_sse, "_get_redis", return_value=None):
+            r = client.post("/mcp/messages?session_id=nope", json={"method": "ping", "id": 1})
+
+        assert r.status_code == 404
+
+
+class TestCrossWorkerSessions:
+    """Sessions shared through Redis across workers."""
+
+    @pytest.mark.asyncio
+    async def test_create_registers_and_relays(self, fake_redis):
+        payload = {"jsonrpc": "2.0", "id": 1, "result": {}}
+        fake_redis.blpop = AsyncMock(side_effect=[(b"q", orjson.dumps(payload)), None])
+
+        with patch.object(mcp_sse, "_get_redis", return_value=fake_redis):
+            session = await mcp_sse.create_session()
+        try:
+            key = f"mcp:session:{session.session_id}"
+            fake_redis.set.assert_awaited_once_with(key, 1, ex=mcp_sse.SESSION_TTL_SECONDS)
+
+            data = await asyncio.wait_for(session.message_queue.get(), timeout=1)
+            assert orjson.loads(data) == payload
+        finally:
+            mcp_sse.remove_session(session.session_id)
+
+        await asyncio.sleep(0)
+        assert session.relay_task.cancelled() or session.relay_task.done()
+
+    @pytest.mark.asyncio
+    async def test_message_for_other_worker_pushed_to_redis(self, async_client, fake_redis):
+        with patch.object(mcp_sse, "_get_redis", return_value=fake_redis):
+            r = await async_client.post(
+                "/mcp/messages?session_id=remote", json={"method": "ping", "id": 7}
+            )
+            await _finish_dispatch()
+
+        assert r.status_code == 202
+        assert r.content == b""
+        queue_key, raw = fake_redis.pipe.rpush.call_args.args
+        assert queue_key == "mcp:session:remote:queue"
+        assert orjson.loads(raw) == {"jsonrpc": "2.0", "id": 7, "result": {}}
+        fake_redis.pipe.expire.assert_called_once_with(queue_key, mcp_sse.SESSION_TTL_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_other_worker_requests_bounded(self, async_client, fake_redis):
+        running = 0
+        peak = 0
+
+        async def slow_tool(name, arguments):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return []
+
+        with patch.object(mcp_sse, "_get_redis", return_value=fake_redis), \
+                patch.object(mcp_sse, "_remote_in_flight", asyncio.Semaphore(1)), \
+                patch.object(mcp_sse, "handle_call_tool", slow_tool):
+            for i in range(3):
+                message = {"method": "tools/call", "id": i, "params": {"name": "slow"}}
+                r = await async_client.post("/mcp/messages?session_id=remote", json=message)
+                assert r.status_code == 202
+            await _finish_dispatch()
+
+        assert peak == 1
+        assert fake_redis.pipe.rpush.call_count == 3
+
+    def test_expired_remote_session_rejected(self, client, fake_redis):
+        fake_redis.exists.return_value = 0
+
+        with patch.object(mcp_sse, "_get_redis", return_value=fake_redis):
+            r = client.post("/mcp/messages?session_id=gone", json={"method": "ping", "id": 1})
+
+        assert r.status_code == 404
+
+
+class TestJsonRpcDispatch:
+    """Test JSON-RPC method routing."""
+
+    @pytest.mark.asyncio
+    async def test_initialize(self):
+        response = await mcp_sse.handle_jsonrpc_message({"method": "initialize", "id": 1}, None)
+
+        assert response["id"] == 1
+        assert response["result"]["serverInfo"]["name"] == "aura-mcp-server"
+
+        again = await mcp_sse.handle_jsonrpc_message({"method": "initialize", "id": 2}, None)
+        assert again["id"] == 2
+        assert again["result"] is response["result"]
+
+    @pytest.mark.asyncio
+    async def test_notification_has_no_response(self):
+        message = {"method": "notifications/initialized"}
+        assert await mcp_sse.handle_jsonrpc_message(message, None) is None
+
+    @pytest.mark.asyncio
+    async def test_unknown_method(self):
+        response = await mcp_sse.handle_jsonrpc_message({"method": "resources/list", "id": 3}, None)
+
+        assert response["error"]["code"] == -32601
+
+    @pytest.mark.asyncio
+    async def test_handler_error_becomes_internal_error(self):
+        message = {"method": "tools/call", "id": 4, "params": {"name": "weather_get_daily"}}
+        with patch.object(mcp_sse, "handle_call_tool", AsyncMock(side_effect=RuntimeError("boom"))):
+            response = await mcp_sse.handle_jsonrpc_message(message, None)
+
+        assert response["error"] == {"code": -32603, "message": "Internal error: boom"}
+
+    @pytest.mark.asyncio
+    async def test_tools_list_result_built_once(self):
+        first = await mcp_sse.handle_jsonrpc_message({"method": "tools/list", "id": 1}, None)
+        second = await mcp_sse.handle_jsonrpc_message({"method": "tools/list", "id": 2}, None)
+
+        assert (first["id"], second["id"]) == (1, 2)
+        assert first["result"] is second["result"]
+        names = [tool["name"] for tool in first["result"]["tools"]]
+        assert "weather_get_daily" in names
+
+
+class TestEventGenerator:
+    """Test the SSE event stream for a session."""
+
+    @pytest.mark.asyncio
+    async def test_streams_endpoint_then_queued_messages(self):
+        with patch.object(mcp_sse, "_get_redis", return_value=None):
+            session = await mcp_sse.create_session()
+        events = mcp_sse.event_generator(session)
+
+        first = await events.__anext__()
+        assert first == {
+            "event": "endpoint", "data": f"/mcp/messages?session_id={session.session_id}"
+        }
+
+        await session.message_queue.put('{"jsonrpc":"2.0","id":1,"result":{}}')
+        second = await asyncio.wait_for(events.__anext__(), timeout=1)
+        assert second == b'event: message\r\ndata: {"jsonrpc":"2.0","id":1,"result":{}}\r\n\r\n'
+
+        await events.aclose()
+        assert mcp_sse.get_session(session.session_id) is None
+
+    @pytest.mark.asyncio
+    async def test_queued_messages_sent_in_one_write(self):
+        with patch.object(mcp_sse, "_get_redis", return_value=None):
+            session = await mcp_sse.create_session()
+        events = mcp_sse.event_generator(session)
+        await events.__anext__()
+
+        for i in range(3):
+            session.message_queue.put_nowait(f'{{"id":{i}}}')
+        chunk = await asyncio.wait_for(events.__anext__(), timeout=1)
+
+        assert chunk.count(b"event: message") == 3
+        assert chunk.index(b'{"id":0}') < chunk.index(b'{"id":2}')
+        await events.aclose()
+
+
+class TestMessagesEndpoint:
+    """Test how posted messages are handled and answered."""
+
+    @pytest.mark.asyncio
+    async def test_local_response_queued_serialized(self, async_client):
+        with patch.object(mcp_sse, "_get_redis", return_value=None):
+            session = await mcp_sse.create_session()
+        try:
+            r = await async_client.post(
+                f"/mcp/messages?session_id={session.session_id}", json={"method": "ping", "id": 9}
+            )
+            assert r.status_code == 202
+            await _finish_dispatch()
+            assert session.message_queue.get_nowait() == '{"jsonrpc":"2.0","id":9,"result":{}}'
+        finally:
+            mcp_sse.remove_session(session.session_id)
+
+    @pytest.mark.asyncio
+    async def test_accepted_before_tool_finishes(self, async_client):
+        with patch.object(mcp_sse, "_get_redis", return_value=None):
+            session = await mcp_sse.create_session()
+        release = asyncio.Event()
+
+        async def slow_tool(name, arguments):
+            await release.wait()
+            return []
+
+        try:
+            with patch.object(mcp_sse, "handle_call_tool", slow_tool):
+                message = {"method": "tools/call", "id": 1, "params": {"name": "slow"}}
+                r = await async_client.post(
+                    f"/mcp/messages?session_id={session.session_id}", json=message
+                )
+                assert r.status_code == 202
+                assert session.message_queue.empty()
+
+                release.set()
+                await _finish_dispatch()
+            assert orjson.loads(session.message_queue.get_nowait())["id"] == 1
+        finally:
+            mcp_sse.remove_session(session.session_id)
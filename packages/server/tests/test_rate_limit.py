@@ -0,0 +1,149 @@
+"""Tests for the Redis token-bucket rate limit middleware.
+
+Offline: the Lua script call is replaced with an AsyncMock, so these cover
+the middleware's routing and failure handling, not Redis itself.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+from fastapi.testclient import TestClient
+
+import mcp_server.app as app_module
+from mcp_server.config import Settings
+from mcp_server.rate_limit import RateLimitMiddleware
+
+
+def _build_app(redis_url, **overrides):
+    settings = Settings(
+        environment="testing",
+        debug=True,
+        redis_url=redis_url,
+        rate_limit_enabled=True,
+        **overrides,
+    )
+    orig = app_module.get_settings
+    app_module.get_settings = lambda: settings
+    try:
+        return app_module.create_app()
+    finally:
+        app_module.get_settings = orig
+
+
+def _limiter(app) -> RateLimitMiddleware:
+    """Build the middleware stack up front and return the rate limiter in it."""
+    app.middleware_stack = app.build_middleware_stack()
+    layer = app.middleware_stack
+    while not isinstance(layer, RateLimitMiddleware):
+        layer = layer.app
+    return layer
+
+
+def _limited_client(**overrides):
+    """App with Redis configured and the token-bucket script stubbed out."""
+    app = _build_app("redis://localhost:6379", **overrides)
+    limiter = _limiter(app)
+    limiter._script = AsyncMock(return_value=1)
+    return TestClient(app), limiter._script
+
+
+@pytest.fixture
+def limited():
+    return _limited_client()
+
+
+def test_allowed_request_passes_through(limited):
+    client, script = limited
+    assert client.get("/tools").status_code == 200
+
+    kwargs = script.await_args.kwargs
+    assert kwargs["keys"] == ["ratelimit:testclient"]
+    assert kwargs["args"][:2] == [60, 1.0]
+
+
+def test_empty_bucket_returns_429(limited):
+    client, script = limited
+    script.return_value = 0
+
+    r = client.get("/tools")
+    assert r.status_code == 429
+    assert r.json() == {"error": "Rate limit exceeded"}
+    assert r.headers["Retry-After"] == "1"
+
+
+def test_health_not_limited(limited):
+    client, script = limited
+    script.return_value = 0
+
+    assert client.get("/health").status_code == 200
+    script.assert_not_awaited()
+
+
+def test_redis_failure_fails_open(limited):
+    client, script = limited
+    script.side_effect = ConnectionError("redis down")
+
+    assert client.get("/tools").status_code == 200
+
+
+def test_open_without_redis_url():
+    client = TestClient(_build_app(None))
+    assert client.get("/tools").status_code == 200
+
+
+def test_disabled_by_default():
+    settings = Settings(environment="testing", debug=True, redis_url="redis://localhost:6379")
+    orig = app_module.get_settings
+    app_module.get_settings = lambda: settings
+    try:
+        app = app_module.create_app()
+    finally:
+        app_module.get_settings = orig
+
+    assert not any(m.cls is RateLimitMiddleware for m in app.user_middleware)
+
+
+def test_429_carries_cors_headers(limited):
+    client, script = limited
+    script.return_value = 0
+
+    r = client.get("/tools", headers={"Origin": "http://localhost:3000"})
+    assert r.status_code == 429
+    assert r.headers["access-control-allow-origin"] == "http://localhost:3000"
+
+
+def test_mcp_transport_not_limited(limited):
+    client, script = limited
+    script.return_value = 0
+
+    r = client.post("/mcp/messages?session_id=nope", json={"method": "ping", "id": 1})
+    assert r.status_code == 404  # reached the router, not the limiter
+    script.assert_not_awaited()
+
+
+def test_internal_callers_not_limited():
+    client, script = _limited_client(internal_auth_secret="s3cret")
+    script.return_value = 0
+
+    r = client.get("/tools", headers={"X-Internal-Auth": "s3cret"})
+    assert r.status_code == 200
+    script.assert_not_awaited()
+
+
+def test_proxy_headers_ignored_unless_trusted(limited):
+    client, script = limited
+
+    client.get("/tools", headers={"Fly-Client-IP": "203.0.113.7"})
+    assert script.await_args.kwargs["keys"] == ["ratelimit:testclient"]
+
+
+@pytest.mark.parametrize("headers, expected", [
+    ({"Fly-Client-IP": "203.0.113.7", "X-Forwarded-For": "1.1.1.1"}, "203.0.113.7"),
+    ({"X-Forwarded-For": "6.6.6.6, 198.51.100.4"}, "198.51.100.4"),
+    ({}, "testclient"),
+])
+def test_trusted_proxy_headers_key_the_bucket(headers, expected):
+    client, script = _limited_client(rate_limit_trust_proxy=True)
+
+    client.get("/tools", headers=headers)
+    assert script.await_args.kwargs["keys"] == [f"ratelimit:{expected}"]
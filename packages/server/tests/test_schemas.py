@@ -0,0 +1,31 @@
+"""Tests for the lazily-imported schemas package."""
+
+import subprocess
+import sys
+
+import pytest
+
+import mcp_server.schemas as schemas
+
+
+def test_every_export_resolves():
+    for name in schemas.__all__:
+        assert getattr(schemas, name).__name__ == name
+
+
+def test_unknown_name_raises_attribute_error():
+    with pytest.raises(AttributeError):
+        schemas.NoSuchSchema
+
+
+def test_only_requested_submodule_imported():
+    code = (
+        "import sys\n"
+        "from mcp_server.schemas import WeatherInput\n"
+        "print('mcp_server.schemas.weather' in sys.modules, "
+        "'mcp_server.schemas.calendar' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.split() == ["True", "False"]
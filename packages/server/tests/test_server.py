@@ -0,0 +1,75 @@
+"""Tests for the MCPServer tool registry."""
+
+import pytest
+from unittest.mock import AsyncMock, patch
+from pydantic import ValidationError
+
+from mcp_server.server import MCPServer
+from mcp_server.schemas.weather import WeatherInput
+from mcp_server.tools.weather import WeatherTool
+
+
+class TestCallTool:
+    """Test MCPServer.call_tool input handling."""
+
+    @pytest.fixture
+    def server(self):
+        """Create an MCPServer instance."""
+        return MCPServer()
+
+    @pytest.mark.asyncio
+    async def test_validated_model_passed_through(self, server):
+        """Test that an input schema instance reaches the tool as-is."""
+        input_data = WeatherInput(location="San Francisco, CA")
+
+        get_daily = AsyncMock(return_value={"summary": "Sunny"})
+        with patch.object(WeatherTool, "get_daily", get_daily) as mock_get:
+            result = await server.call_tool("weather_get_daily", input_data)
+
+        assert result == {"summary": "Sunny"}
+        assert mock_get.await_args.args[0] is input_data
+
+    @pytest.mark.asyncio
+    async def test_dict_input_validated(self, server):
+        """Test that raw dict input is validated into the tool's schema."""
+        get_daily = AsyncMock(return_value={"summary": "Sunny"})
+        with patch.object(WeatherTool, "get_daily", get_daily) as mock_get:
+            await server.call_tool(
+                "weather_get_daily", {"location": "New York", "when": "tomorrow"}
+            )
+
+        validated = mock_get.await_args.args[0]
+        assert isinstance(validated, WeatherInput)
+        assert validated.when == "tomorrow"
+
+    @pytest.mark.asyncio
+    async def test_invalid_dict_input_rejected(self, server):
+        """Test that dict input failing the schema raises a ValidationError."""
+        with patch.object(WeatherTool, "get_daily", AsyncMock()) as mock_get:
+            with pytest.raises(ValidationError):
+                await server.call_tool(
+                    "weather_get_daily", {"location": "Boston", "when": "yesterday"}
+                )
+
+        mock_get.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_unknown_tool(self, server):
+        """Test that unknown tool names raise ValueError."""
+        with pytest.raises(ValueError, match="not found"):
+            await server.call_tool("weather_get_hourly", {})
+
+
+def test_tool_instances_shared():
+    """Test that each upstream gets one tool instance, shared with the morning bundle."""
+    server = MCPServer()
+    calendar_tools = {
+        id(info["tool"]) for name, info in server.tools.items() if name.startswith("calendar_")
+    }
+    morning = server.tools["morning_get_bundle"]["tool"]
+
+    assert len(calendar_tools) == 1
+    assert morning.calendar_tool is server.tools["calendar_list_events"]["tool"]
+    assert morning.todo_tool is server.tools["todo_list"]["tool"]
+    assert morning.weather_tool is server.tools["weather_get_daily"]["tool"]
+    assert morning.mobility_tool is server.tools["mobility_get_commute_options"]["tool"]
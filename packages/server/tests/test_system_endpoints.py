@@ -0,0 +1,92 @@
+"""Tests for the REST system and tool endpoints in app.py."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi.responses import ORJSONResponse
+from fastapi.testclient import TestClient
+
+import mcp_server.app as app_module
+from mcp_server.app import TOOL_ENDPOINTS
+from mcp_server.config import Settings
+from mcp_server.server import get_mcp_server
+
+
+@pytest.fixture
+def client():
+    settings = Settings(environment="testing", debug=True)
+    orig = app_module.get_settings
+    app_module.get_settings = lambda: settings
+    try:
+        return TestClient(app_module.create_app())
+    finally:
+        app_module.get_settings = orig
+
+
+def test_tools_body_and_cache_headers(client):
+    r = client.get("/tools")
+
+    assert r.status_code == 200
+    assert r.json() == get_mcp_server().list_tools()
+    assert r.headers["cache-control"] == "public, max-age=60"
+    assert r.headers["etag"]
+
+
+def test_tools_not_modified_on_matching_etag(client):
+    etag = client.get("/tools").headers["etag"]
+
+    r = client.get("/tools", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+
+
+def test_health_revalidates(client):
+    r = client.get("/health")
+
+    assert r.json() == {"status": "healthy", "version": "2.0.0", "environment": "testing"}
+    assert r.headers["cache-control"] == "no-cache"
+    assert client.get("/health", headers={"If-None-Match": '"stale"'}).status_code == 200
+
+
+def test_default_response_class_is_orjson(client):
+    assert client.app.router.default_response_class is ORJSONResponse
+    r = client.get("/no-such-endpoint")
+    assert r.status_code == 404
+    assert r.json() == {"error": "Endpoint not found"}
+
+
+def test_every_tool_endpoint_registered(client):
+    paths = client.app.openapi()["paths"]
+    for tool_name, _, tag, _ in TOOL_ENDPOINTS:
+        assert tool_name in get_mcp_server().tools
+        assert paths[f"/tools/{tool_name}"]["post"]["tags"] == [tag]
+
+
+def test_tool_endpoint_forwards_validated_input(client):
+    with patch.object(get_mcp_server(), "call_tool", AsyncMock(return_value={"ok": True})) as call:
+        r = client.post("/tools/weather_get_daily", json={"location": "Boston, MA"})
+
+    assert r.json() == {"ok": True}
+    name, input_data = call.await_args.args
+    assert name == "weather_get_daily"
+    assert input_data.location == "Boston, MA"
+
+
+def test_missing_calendar_event_maps_to_404(client):
+    result = {"success": False, "message": "Event not found"}
+    with patch.object(get_mcp_server(), "call_tool", AsyncMock(return_value=result)):
+        r = client.post("/tools/calendar_delete_event", json={"event_id": "abc"})
+
+    assert r.status_code == 404
+
+
+def test_calendars_uses_registered_calendar_tool(client):
+    calendar_tool = get_mcp_server().tools["calendar_list_events"]["tool"]
+    google = MagicMock()
+    google.get_calendar_list.return_value = {"primary": "me@example.com"}
+
+    with patch.object(calendar_tool, "google_calendar_client", google):
+        r = client.get("/calendars")
+
+    assert r.status_code == 200
+    assert r.json()["available_calendars"] == {"primary": "me@example.com"}
@@ -2,8 +2,9 @@
 
 import pytest
 from unittest.mock import AsyncMock, patch, MagicMock
-from datetime import datetime, timedelta, date
+from datetime import datetime, timedelta, date, time
 import pytz
+from pydantic import ValidationError
 
 from mcp_server.tools.calendar import CalendarTool
 from mcp_server.clients.google_calendar import GoogleCalendarAuthError, GoogleCalendarClient
@@ -270,6 +271,57 @@ class TestFindFreeTime:
 
         assert len(result.free_slots) <= 10
 
+    def test_find_free_time_input_parses_dates_and_times(self):
+        """Test dates and times are parsed into date/time objects by the schema."""
+        input_data = CalendarFindFreeTimeInput(
+            duration_minutes=30, start_date="2024-01-15", latest_time="17:30"
+        )
+
+        assert input_data.start_date == date(2024, 1, 15)
+        assert input_data.earliest_time == time(9, 0)
+        assert input_data.latest_time == time(17, 30)
+
+    @pytest.mark.parametrize("field, value", [
+        ("start_date", "01/15/2024"),
+        ("end_date", "2024-13-01"),
+        ("earliest_time", "9am"),
+        ("latest_time", "25:00"),
+        ("earliest_time", None),
+        ("latest_time", None),
+    ])
+    def test_find_free_time_input_rejects_bad_formats(self, field, value):
+        """Test malformed dates and times are rejected."""
+        data = {"duration_minutes": 30, "start_date": "2024-01-15", field: value}
+
+        with pytest.raises(ValidationError):
+            CalendarFindFreeTimeInput(**data)
+
+    @pytest.mark.parametrize("duration, error_type", [
+        (0, "greater_than"),
+        (481, "less_than_equal"),
+    ])
+    def test_find_free_time_input_duration_bounds(self, duration, error_type):
+        """Test duration must be positive and at most 8 hours."""
+        with pytest.raises(ValidationError) as exc_info:
+            CalendarFindFreeTimeInput(duration_minutes=duration, start_date="2024-01-15")
+
+        assert exc_info.value.errors()[0]["type"] == error_type
+        assert CalendarFindFreeTimeInput(duration_minutes=480, start_date="2024-01-15")
+
+    @pytest.mark.asyncio
+    async def test_find_free_time_reports_time_window(self, calendar_tool):
+        """Test the search criteria keep the HH:MM time window format."""
+        input_data = CalendarFindFreeTimeInput(
+            duration_minutes=30,
+            start_date=date.today().isoformat(),
+            earliest_time="10:00",
+            latest_time="16:00",
+        )
+
+        result = await calendar_tool.find_free_time(input_data)
+
+        assert result.search_criteria["time_window"] == "10:00 to 16:00"
+
 
 class TestCalendarHelperMethods:
     """Test helper methods of the CalendarTool."""
@@ -315,6 +367,25 @@ class TestCalendarHelperMethods:
         dt = calendar_tool._parse_datetime("")
         assert dt is not None  # Returns now()
 
+    def test_convert_google_event_from_api(self, calendar_tool):
+        """Test API events are converted into fully-typed CalendarEvents."""
+        event = calendar_tool._convert_google_event_from_api(
+            {
+                "id": "evt_1",
+                "summary": "Standup",
+                "start": {"dateTime": "2024-01-15T10:00:00-08:00"},
+                "end": {"dateTime": "2024-01-15T10:15:00-08:00"},
+                "attendees": [{"email": "a@example.com"}, {}],
+            },
+            "Work",
+        )
+
+        assert isinstance(event, CalendarEvent)
+        assert event.start_time == datetime.fromisoformat("2024-01-15T10:00:00-08:00")
+        assert event.attendees == ["a@example.com"]
+        assert event.location is None
+        assert event.model_dump() == CalendarEvent(**event.model_dump()).model_dump()
+
     @pytest.mark.asyncio
     async def test_calculate_preference_score(self, calendar_tool):
         """Test preference score calculation."""
@@ -0,0 +1,72 @@
+"""Tests for the morning bundle tool."""
+
+import pytest
+from datetime import date
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from mcp_server.tools.morning import MorningTool
+from mcp_server.schemas.morning import MorningBundleInput, MorningBundleOutput
+from mcp_server.schemas.weather import WeatherOutput
+
+
+class TestMorningTool:
+    """Test the MorningTool class."""
+
+    @pytest.fixture
+    def morning_tool(self):
+        """Create a MorningTool with its underlying tools stubbed out."""
+        weather_tool, calendar_tool, todo_tool, mobility_tool = (MagicMock() for _ in range(4))
+        weather_tool.get_daily = AsyncMock(return_value=WeatherOutput(
+            temp_hi=72.0, temp_lo=55.0, summary="Sunny",
+            location="San Francisco, CA", date="2024-01-15",
+        ))
+        calendar_tool.list_events = AsyncMock(return_value={"events": [], "total_events": 0})
+        todo_tool.list_todos = AsyncMock(return_value={"items": [], "pending_count": 0})
+        mobility_tool.get_commute_options = AsyncMock(return_value={"direction": "to_work"})
+        return MorningTool(weather_tool, calendar_tool, todo_tool, mobility_tool)
+
+    @pytest.mark.asyncio
+    async def test_get_bundle_returns_all_sections(self, morning_tool):
+        """Test that one call returns every morning section."""
+        input_data = MorningBundleInput(location="San Francisco, CA", date=date(2024, 1, 15))
+
+        result = await morning_tool.get_bundle(input_data)
+
+        assert isinstance(result, MorningBundleOutput)
+        assert result.weather["summary"] == "Sunny"
+        assert result.calendar["total_events"] == 0
+        assert result.todos["pending_count"] == 0
+        assert result.commute["direction"] == "to_work"
+
+        todo_input = morning_tool.todo_tool.list_todos.await_args.args[0]
+        assert todo_input.bucket == "work"
+        calendar_input = morning_tool.calendar_tool.list_events.await_args.args[0]
+        assert calendar_input.date == date(2024, 1, 15)
+
+    @pytest.mark.asyncio
+    async def test_get_bundle_isolates_section_failures(self, morning_tool):
+        """Test that a failing tool only turns its own section into an error."""
+        morning_tool.calendar_tool.list_events.side_effect = RuntimeError("calendar down")
+        input_data = MorningBundleInput(location="San Francisco, CA", date=date(2024, 1, 15))
+
+        result = await morning_tool.get_bundle(input_data)
+
+        assert result.calendar == {"error": "calendar down"}
+        assert result.weather["summary"] == "Sunny"
+        assert "error" not in result.todos
+
+    @pytest.mark.asyncio
+    async def test_registered_on_server(self):
+        """Test that the bundle is reachable through the MCP server registry."""
+        from mcp_server.server import get_mcp_server
+
+        server = get_mcp_server()
+        assert "morning_get_bundle" in server.tools
+
+        bundle = MorningBundleOutput(weather={}, calendar={}, todos={}, commute={})
+        with patch.object(MorningTool, "get_bundle", AsyncMock(return_value=bundle)):
+            result = await server.call_tool(
+                "morning_get_bundle", {"location": "San Francisco, CA", "date": "2024-01-15"}
+            )
+
+        assert set(result) == {"weather", "calendar", "todos", "commute"}
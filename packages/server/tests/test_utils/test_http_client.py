@@ -0,0 +1,49 @@
+"""Tests for the HTTP client utility."""
+
+import pytest
+import httpx
+
+from mcp_server.utils.http_client import (
+    HTTPClient, get_shared_client, close_shared_client
+)
+
+
+class TestSharedClient:
+    """Test the pooled client shared by every HTTPClient."""
+
+    @pytest.mark.asyncio
+    async def test_contexts_share_one_pool(self):
+        """Test that separate HTTPClient contexts reuse the same httpx client."""
+        async with HTTPClient() as first:
+            pooled = first._client
+        async with HTTPClient(timeout=5.0) as second:
+            assert second._client is pooled
+
+        assert not pooled.is_closed
+        await close_shared_client()
+        assert pooled.is_closed
+
+    @pytest.mark.asyncio
+    async def test_recreated_after_close(self):
+        """Test that a closed pool is replaced on next use."""
+        client = get_shared_client()
+        await close_shared_client()
+
+        assert get_shared_client() is not client
+        await close_shared_client()
+
+    @pytest.mark.asyncio
+    async def test_per_request_timeout(self):
+        """Test that each HTTPClient applies its own timeout to requests."""
+        seen = {}
+
+        def handler(request):
+            seen["timeout"] = request.extensions["timeout"]
+            return httpx.Response(200, json={"ok": True})
+
+        async with HTTPClient(timeout=3.0) as client:
+            client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            response = await client.get("https://example.com/api")
+
+        assert response.json() == {"ok": True}
+        assert seen["timeout"]["read"] == 3.0
@@ -44,13 +44,28 @@ class TestRateLimiter:
     async def test_cleanup_old_requests(self, limiter):
         """Test that old requests are cleaned up."""
         # Add some fake old timestamps
-        limiter.state.minute_requests.append(time.time() - 120)  # 2 minutes ago
-        limiter.state.day_requests.append(time.time() - 100000)  # More than a day ago
+        limiter._minute_requests.append(time.time() - 120)  # 2 minutes ago
+        limiter._day_count = 1
+        limiter._day_window_start = time.time() - 100000  # More than a day ago
 
         limiter._cleanup_old_requests()
 
-        assert len(limiter.state.minute_requests) == 0
-        assert len(limiter.state.day_requests) == 0
+        assert len(limiter._minute_requests) == 0
+        assert limiter._day_count == 0
+
+    @pytest.mark.asyncio
+    async def test_blocks_when_day_limit_exceeded(self):
+        """Test that requests are blocked once the daily count is used up."""
+        limiter = RateLimiter(
+            name="test_day_limiter",
+            requests_per_minute=10,
+            requests_per_day=2
+        )
+
+        assert await limiter.acquire() is True
+        assert await limiter.acquire() is True
+        assert await limiter.acquire() is False
+        assert limiter.get_stats()["remaining"]["day"] == 0
 
     def test_get_stats(self, limiter):
         """Test getting rate limiter statistics."""
@@ -78,6 +93,13 @@ class TestRateLimiter:
         assert wait_time > 0.0
         assert wait_time <= 60.0
 
+    def test_get_wait_time_with_expired_head(self, limiter):
+        """Test that an expired oldest request means no wait, without cleanup."""
+        now = time.time()
+        limiter._minute_requests.extend([now - 120] + [now] * 4)
+
+        assert limiter.get_wait_time() == 0.0
+
     @pytest.mark.asyncio
     async def test_wait_and_acquire_timeout(self, limiter):
         """Test wait_and_acquire with timeout."""
@@ -89,6 +111,20 @@ class TestRateLimiter:
         acquired = await limiter.wait_and_acquire(max_wait=0.1)
         assert acquired is False
 
+    @pytest.mark.asyncio
+    async def test_wait_and_acquire_wakes_when_slot_opens(self, limiter):
+        """Test that waiters are woken once the oldest request expires."""
+        # Oldest request leaves the minute window in ~0.2s
+        now = time.time()
+        limiter._minute_requests.extend([now - 59.8] + [now] * 4)
+
+        results = await asyncio.gather(
+            limiter.wait_and_acquire(max_wait=2.0),
+            limiter.wait_and_acquire(max_wait=0.5),
+        )
+
+        assert results == [True, False]
+
 
 class TestRateLimitedDecorator:
     """Test the @rate_limited decorator."""
@@ -0,0 +1,87 @@
+"""Tests for the MV Connector shuttle schedule data."""
+
+import pytest
+from datetime import datetime
+
+from mcp_server.utils.shuttle_data import MVConnectorSchedule
+
+
+# A Wednesday, before the first inbound and outbound departures
+WEEKDAY_MORNING = datetime(2025, 8, 6, 6, 0)
+WEEKDAY_AFTERNOON = datetime(2025, 8, 6, 15, 0)
+
+
+class TestParseTime:
+    """Test the schedule time parser."""
+
+    def test_parse_morning_and_evening(self):
+        """Test parsing AM and PM times."""
+        today = WEEKDAY_MORNING.date()
+
+        assert MVConnectorSchedule.parse_time("6:50 AM", today) == datetime(2025, 8, 6, 6, 50)
+        assert MVConnectorSchedule.parse_time("6:42 PM", today) == datetime(2025, 8, 6, 18, 42)
+
+    def test_parse_noon_and_midnight(self):
+        """Test the 12 AM / 12 PM edge cases."""
+        today = WEEKDAY_MORNING.date()
+
+        assert MVConnectorSchedule.parse_time("12:05 AM", today).hour == 0
+        assert MVConnectorSchedule.parse_time("12:30 PM", today).hour == 12
+
+    @pytest.mark.parametrize("time_str", ["invalid", "8:15", "13:00 PM", "8:15 XM"])
+    def test_parse_invalid(self, time_str):
+        """Test that malformed times raise ValueError."""
+        with pytest.raises(ValueError):
+            MVConnectorSchedule.parse_time(time_str)
+
+
+class TestGetNextShuttles:
+    """Test the get_next_shuttles route lookup."""
+
+    def test_inbound_route(self):
+        """Test departures from Mountain View Caltrain to the transit center."""
+        departures = MVConnectorSchedule.get_next_shuttles(
+            "Mountain View Caltrain", "LinkedIn Transit Center", WEEKDAY_MORNING, limit=2
+        )
+
+        assert len(departures) == 2
+        assert departures[0]["departure_time"] == "6:50 AM"
+        assert departures[0]["arrival_time"] == "6:58 AM"
+        assert departures[0]["all_stops"] == ("6:50 AM", "6:58 AM", "7:01 AM")
+        assert departures[0]["stop_names"] == MVConnectorSchedule.STOPS["inbound"]
+
+    def test_partial_inbound_route(self):
+        """Test that the transit center to 950|1000 leg uses the inbound schedule."""
+        departures = MVConnectorSchedule.get_next_shuttles(
+            "LinkedIn Transit Center", "LinkedIn 950|1000", WEEKDAY_MORNING, limit=1
+        )
+
+        assert departures[0]["departure_time"] == "6:58 AM"
+        assert departures[0]["arrival_time"] == "7:01 AM"
+
+    def test_outbound_route(self):
+        """Test departures from the transit center to Mountain View Caltrain."""
+        departures = MVConnectorSchedule.get_next_shuttles(
+            "LinkedIn Transit Center", "Mountain View Caltrain", WEEKDAY_AFTERNOON, limit=1
+        )
+
+        assert departures[0]["departure_time"] == "3:21 PM"
+        assert departures[0]["arrival_time"] == "3:29 PM"
+
+    def test_unsupported_route(self):
+        """Test that unknown stop pairs return no departures."""
+        departures = MVConnectorSchedule.get_next_shuttles(
+            "Mountain View Caltrain", "Mountain View Caltrain", WEEKDAY_MORNING
+        )
+
+        assert departures == []
+
+    def test_no_service_on_weekends(self):
+        """Test that no departures are returned on weekends."""
+        saturday = datetime(2025, 8, 9, 8, 0)
+
+        departures = MVConnectorSchedule.get_next_shuttles(
+            "Mountain View Caltrain", "LinkedIn Transit Center", saturday
+        )
+
+        assert departures == []